@@ -0,0 +1,18 @@
+'''Helpers shared by benchmark scripts'''
+import os, sys
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), os.pardir))
+
+
+def percentile(values: list, q: float) -> float:
+    '''Nearest-rank percentile of unsorted `values`, `q` in range 0..100'''
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(len(ordered) * q / 100))]
+
+
+def latency(seconds: list) -> dict:
+    '''p50/p99/mean of timings given in seconds, reported in milliseconds'''
+    return {
+        "p50_ms": round(percentile(seconds, 50) * 1000, 4),
+        "p99_ms": round(percentile(seconds, 99) * 1000, 4),
+        "mean_ms": round(sum(seconds) / len(seconds) * 1000, 4)
+    }
@@ -0,0 +1,80 @@
+'''
+Measures calls/sec and p50/p99 latency of every ProxySix method at growing concurrency.
+
+Requests go to FakeProxySix through FakeTransport (client overhead only) or, with --server, 
+through FakeServer on localhost (whole aiohttp path).
+
+Usage: python benchmarks/bench_calls.py [--server] [--calls N] [--concurrency 1,8,64,512]
+'''
+import argparse, asyncio, json, time
+import _common
+
+from proxy6 import ProxySix, ProxyCountry, ProxyScheme
+from proxy6.testing import FakeProxySix, FakeServer, FakeTransport
+
+CONCURRENCY = (1, 8, 64, 512)
+
+CALLS = {
+    "getPrice": lambda client: client.getPrice(1, 30),
+    "getCount": lambda client: client.getCount(ProxyCountry.GERMANY),
+    "getCountry": lambda client: client.getCountry(),
+    "getProxy": lambda client: client.getProxy(limit=10, nokey=True),
+    "setType": lambda client: client.setType([1], ProxyScheme.HTTPS),
+    "setDescription": lambda client: client.setDescription("bench", ids=[1]),
+    "buyProxy": lambda client: client.buyProxy(1, 1, ProxyCountry.GERMANY, nokey=True),
+    "prolongProxy": lambda client: client.prolongProxy(1, [1], nokey=True),
+    "deleteProxy": lambda client: client.deleteProxy(description="missing"),
+    "checkProxy": lambda client: client.checkProxy(1),
+}
+
+
+async def measure(client: ProxySix, call, calls: int, concurrency: int) -> dict:
+    '''Runs `calls` calls from `concurrency` workers'''
+    timings = []
+    left = calls
+
+    async def worker():
+        nonlocal left
+        while left > 0:
+            left -= 1
+            start = time.perf_counter()
+            await call(client)
+            timings.append(time.perf_counter() - start)
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - start
+    return {"calls_per_sec": round(len(timings) / elapsed, 1), **_common.latency(timings)}
+
+
+async def run(calls: int = 1000, concurrency: tuple = CONCURRENCY, server: bool = False, methods: list = None) -> dict:
+    '''Returns results keyed by method, then by concurrency'''
+    fake = FakeProxySix(proxies=100, balance=1e12)
+    fake.available = dict.fromkeys(fake.available, 10 ** 9)
+    results = {}
+    async with FakeServer(fake) as fake_server:
+        if server:
+            client = ProxySix(fake.api_key, limit=max(concurrency))
+            client.URL = fake_server.url
+        else:
+            client = ProxySix(fake.api_key, transport=FakeTransport(fake))
+        async with client:
+            for name in methods or CALLS:
+                results[name] = {}
+                for level in concurrency:
+                    results[name][str(level)] = await measure(client, CALLS[name], max(calls, level), level)
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--server", action="store_true", help="go through FakeServer on localhost")
+    parser.add_argument("--calls", type=int, default=1000, help="calls per method and concurrency level")
+    parser.add_argument("--concurrency", default=",".join(map(str, CONCURRENCY)))
+    args = parser.parse_args()
+    concurrency = tuple(int(level) for level in args.concurrency.split(","))
+    print(json.dumps(asyncio.run(run(args.calls, concurrency, args.server)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+'''
+Measures ProxySix._extract_data overhead per response, getproxy decode throughput 
+and memory per decoded proxy of validated (default) and trusted clients.
+
+Usage: python benchmarks/bench_decode.py [--budget SECONDS]
+'''
+import argparse, copy, gc, json, time, tracemalloc
+import _common
+
+from proxy6 import ProxySix
+from proxy6.exceptions import BadRequest
+
+HEADER = {"status": "yes", "user_id": "1", "balance": "10.5", "currency": "RUB", "date_mod": "2023-05-01 12:00:00"}
+
+
+def make_proxy(id: int) -> dict:
+    return {
+        "id": str(id), "ip": f"10.0.{id // 256}.{id % 256}", "host": "127.0.0.1", "port": str(10000 + id),
+        "user": "user", "pass": "pass", "type": "http", "country": "de",
+        "date": "2023-05-01 12:00:00", "date_end": "2023-06-01 12:00:00",
+        "unixtime": 1682942400, "unixtime_end": 1685620800, "descr": "", "active": "1"
+    }
+
+
+def proxy_page(size: int) -> dict:
+    return {**HEADER, "list_count": size, "list": [make_proxy(i) for i in range(1, size + 1)]}
+
+
+CASES = {
+    "getproxy x10": ("getproxy", proxy_page(10)),
+    "getproxy x100": ("getproxy", proxy_page(100)),
+    "getproxy x1000": ("getproxy", proxy_page(1000)),
+    "check": ("check", {**HEADER, "proxy_id": 1, "proxy_status": True}),
+    "delete": ("delete", {**HEADER, "count": 1}),
+    "error 410": ("getprice", {"status": "no", "error_id": 410, "error": "Error price"}),
+}
+
+
+def measure(client: ProxySix, method: str, payload: dict, budget: float = 0.5) -> float:
+    '''Returns seconds per decoded response'''
+    runs, spent = 0, 0.0
+    while spent < budget:
+        batch = [copy.deepcopy(payload) for _ in range(max(1, 2000 // max(1, len(payload.get("list", ())))))]
+        start = time.perf_counter()
+        for data in batch:
+            try:
+                client._extract_data(data, method)
+            except BadRequest:
+                pass
+        spent += time.perf_counter() - start
+        runs += len(batch)
+    return spent / runs
+
+
+def memory(client: ProxySix, size: int = 1000) -> float:
+    '''Returns bytes allocated per proxy kept by decoded getproxy page'''
+    payload = copy.deepcopy(proxy_page(size))
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before = tracemalloc.get_traced_memory()[0]
+        decoded = client._extract_data(payload, "getproxy")
+        gc.collect()
+        after = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    del decoded
+    return (after - before) / size
+
+
+def run(budget: float = 0.5) -> dict:
+    '''Returns microseconds per response by case, proxies/sec and bytes per proxy by client'''
+    results = {"us_per_response": {}, "proxies_per_sec": {}, "bytes_per_proxy": {}}
+    client = ProxySix("key")
+    for name, (method, payload) in CASES.items():
+        results["us_per_response"][name] = round(measure(client, method, payload, budget) * 1e6, 2)
+
+    payload = proxy_page(1000)
+    for name, client in (("validated", ProxySix("key")), ("trusted", ProxySix("key", trusted=True))):
+        results["proxies_per_sec"][name] = round(1000 / measure(client, "getproxy", payload, budget))
+        results["bytes_per_proxy"][name] = round(memory(client))
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--budget", type=float, default=0.5, help="seconds spent per case")
+    print(json.dumps(run(parser.parse_args().budget), indent=2))
+
+
+if __name__ == "__main__":
+    main()
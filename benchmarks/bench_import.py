@@ -0,0 +1,57 @@
+'''
+Measures import time of proxy6 with `python -X importtime` in fresh interpreters 
+and reports which heavy dependencies each statement loads.
+
+Usage: python benchmarks/bench_import.py [--runs N]
+'''
+import argparse, json, os, statistics, subprocess, sys
+import _common
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+STATEMENTS = {
+    "import proxy6": "import proxy6",
+    "ProxySix()": "from proxy6 import ProxySix; ProxySix('key')",
+    "models": "from proxy6 import ProxySix, Proxy",
+    "everything": "from proxy6 import *",
+}
+HEAVY = ("aiohttp", "pydantic", "asyncio")
+
+
+def measure(statement: str) -> tuple:
+    '''Returns microseconds spent importing modules by `statement` and heavy modules it loaded'''
+    result = subprocess.run([sys.executable, "-X", "importtime", "-c", statement], 
+        cwd=ROOT, capture_output=True, text=True, check=True)
+    total, loaded = 0, set()
+    for line in result.stderr.splitlines():
+        if not line.startswith("import time:") or "|" not in line:
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue
+        if not name.startswith("  "):
+            total += int(cumulative)
+        loaded.add(name.strip().split(".")[0])
+    return total, sorted(loaded.intersection(HEAVY))
+
+
+def run(runs: int = 5) -> dict:
+    '''Returns median import microseconds (above bare interpreter startup) and loaded heavy modules by statement'''
+    baseline = statistics.median(measure("pass")[0] for _ in range(runs))
+    results = {}
+    for name, statement in STATEMENTS.items():
+        timings, loaded = [], None
+        for _ in range(runs):
+            total, loaded = measure(statement)
+            timings.append(total - baseline)
+        results[name] = {"median_us": statistics.median(timings), "min_us": min(timings), "loads": loaded}
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--runs", type=int, default=5, help="interpreters started per statement")
+    print(json.dumps(run(parser.parse_args().runs), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,51 @@
+'''
+Compares latency of a fresh session per call with the pooled session owned by ProxySix.
+
+Usage: python benchmarks/bench_session.py [--calls N]
+'''
+import argparse, asyncio, json, time
+import _common
+
+from proxy6 import ProxySix
+from proxy6.testing import FakeProxySix, FakeServer
+
+
+async def per_call(url: str, calls: int) -> list:
+    timings = []
+    for _ in range(calls):
+        start = time.perf_counter()
+        async with ProxySix("key") as client:
+            client.URL = url
+            await client.getCountry()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def pooled(url: str, calls: int) -> list:
+    timings = []
+    async with ProxySix("key") as client:
+        client.URL = url
+        for _ in range(calls):
+            start = time.perf_counter()
+            await client.getCountry()
+            timings.append(time.perf_counter() - start)
+    return timings
+
+
+async def run(calls: int = 500) -> dict:
+    '''Returns latency of per-call and pooled sessions'''
+    async with FakeServer(FakeProxySix(api_key="key")) as server:
+        return {
+            "per_call": _common.latency(await per_call(server.url, calls)),
+            "pooled": _common.latency(await pooled(server.url, calls))
+        }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--calls", type=int, default=500)
+    print(json.dumps(asyncio.run(run(parser.parse_args().calls)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
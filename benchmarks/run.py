@@ -0,0 +1,78 @@
+'''
+Runs all benchmarks and writes one JSON document, optionally comparing it with a previous run.
+
+Usage: python benchmarks/run.py [--quick] [--output results.json] [--compare baseline.json]
+
+Document layout: `{"meta": {...versions...}, "results": {"calls": ..., "server": ..., "decode": ..., "session": ..., "import": ...}}`. 
+With --compare every numeric result is printed next to the baseline value and their ratio.
+'''
+import argparse, asyncio, datetime, json, platform, sys
+import _common
+
+import aiohttp, pydantic
+from proxy6 import jsonlib
+import bench_calls, bench_decode, bench_import, bench_session
+
+
+def meta() -> dict:
+    return {
+        "created": datetime.datetime.now(datetime.timezone.utc).isoformat(timespec="seconds"),
+        "python": platform.python_version(),
+        "implementation": platform.python_implementation(),
+        "platform": platform.platform(),
+        "aiohttp": aiohttp.__version__,
+        "pydantic": pydantic.VERSION,
+        "json": jsonlib.BACKEND
+    }
+
+
+async def collect(quick: bool) -> dict:
+    calls = 100 if quick else 1000
+    concurrency = (1, 64) if quick else bench_calls.CONCURRENCY
+    return {
+        "calls": await bench_calls.run(calls, concurrency),
+        "server": await bench_calls.run(calls, concurrency, server=True, methods=["getCountry", "getProxy"]),
+        "decode": bench_decode.run(0.1 if quick else 0.5),
+        "session": await bench_session.run(50 if quick else 500),
+        "import": bench_import.run(3 if quick else 10)
+    }
+
+
+def flatten(results: dict, prefix: str = "") -> dict:
+    flat = {}
+    for key, value in results.items():
+        if isinstance(value, dict):
+            flat.update(flatten(value, f"{prefix}{key}."))
+        else:
+            flat[f"{prefix}{key}"] = value
+    return flat
+
+
+def compare(current: dict, baseline: dict) -> None:
+    '''Prints every result present in both runs with ratio current / baseline'''
+    old = flatten(baseline["results"])
+    for key, value in flatten(current["results"]).items():
+        if key in old and old[key]:
+            print(f"{key:<60} {old[key]:>14} {value:>14} {value / old[key]:>8.2f}x")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--quick", action="store_true", help="fewer calls and concurrency levels")
+    parser.add_argument("--output", help="file to write JSON to (default - stdout)")
+    parser.add_argument("--compare", help="JSON written by a previous run")
+    args = parser.parse_args()
+
+    document = {"meta": meta(), "results": asyncio.run(collect(args.quick))}
+    if args.output:
+        with open(args.output, "w") as file:
+            json.dump(document, file, indent=2)
+    elif not args.compare:
+        json.dump(document, sys.stdout, indent=2)
+    if args.compare:
+        with open(args.compare) as file:
+            compare(document, json.load(file))
+
+
+if __name__ == "__main__":
+    main()
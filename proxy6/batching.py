@@ -0,0 +1,196 @@
+from .types import *
+from .exceptions import ElementNotFound, InvalidProxyIDs
+from typing import Any, TYPE_CHECKING
+import asyncio
+
+if TYPE_CHECKING:
+    from .client import ProxySix
+
+# errors caused by some of the ids, the rest of the batch is resent id by id
+_PER_ID_ERRORS = (InvalidProxyIDs, ElementNotFound)
+
+class _Batch():
+    __slots__ = ("method", "params", "futures", "length", "timer")
+
+    def __init__(self, method: str, params: tuple) -> None:
+        self.method = method
+        self.params = params
+        self.futures: Dict[int, asyncio.Future] = {}
+        self.length: int = 0
+        self.timer: asyncio.TimerHandle = None
+
+
+class MutationBatcher():
+    '''
+    Joins single-proxy mutation calls from many coroutines into few API requests
+
+    Calls with the same method and parameters made within `delay` seconds are sent as one request 
+    with comma-joined `ids`. Batch is sent earlier when it reaches `max_batch` ids or when its ids 
+    would exceed `max_ids_length` characters in URL. Every caller receives the result for its own id. 
+    If API rejects a batch because of some of its ids, the batch is resent id by id.
+
+    Attributes
+    ----------
+    client (ProxySix):
+        Client sending requests
+    delay (float):
+        Seconds calls are collected before batch is sent
+    max_batch (int):
+        Maximum amount of ids in one request
+    max_ids_length (int):
+        Maximum length of joined `ids` parameter
+    requests (int):
+        Amount of API requests sent
+    '''
+    def __init__(self, client: "ProxySix", delay: float = 0.01, max_batch: int = 100, max_ids_length: int = 2000) -> None:
+        '''
+        Parameters
+        ----------
+        client (ProxySix):
+            Client sending requests (Required)
+        delay (float):
+            Seconds calls are collected before batch is sent (default - 0.01)
+        max_batch (int):
+            Maximum amount of ids in one request (default - 100)
+        max_ids_length (int):
+            Maximum length of joined `ids` parameter (default - 2000)
+        '''
+        self.client = client
+        self.delay: float = delay
+        self.max_batch: int = max_batch
+        self.max_ids_length: int = max_ids_length
+        self.requests: int = 0
+        self._batches: Dict[tuple, _Batch] = {}
+        self._tasks: set = set()
+
+    async def setType(self, id: int, type: ProxyScheme) -> bool:
+        '''
+        Changes the type (protocol) of proxy, see `ProxySix.setType`
+
+        Returns
+        -------
+        result (bool):
+            True - succsefully changed type
+        '''
+        return await self._submit("settype", (type,), id)
+
+    async def setDescription(self, id: int, new: str) -> int:
+        '''
+        Updates technical comment of proxy, see `ProxySix.setDescription`
+
+        Returns
+        -------
+        count (int):
+            1 - description was changed, 0 - it was not
+        '''
+        return await self._submit("setdescr", (new,), id)
+
+    async def deleteProxy(self, id: int) -> int:
+        '''
+        Deletes proxy, see `ProxySix.deleteProxy`
+
+        Returns
+        -------
+        count (int):
+            1 - proxy was deleted, 0 - it was not. If API deleted only part of a batch 
+            the outcome of single proxy is unknown and amount of proxies deleted by batch is returned
+        '''
+        return await self._submit("delete", (), id)
+
+    async def prolongProxy(self, id: int, period: int) -> Prolong:
+        '''
+        Extends proxy, see `ProxySix.prolongProxy`. Raises `ElementNotFound` if proxy was not prolonged
+
+        Returns
+        -------
+        data (Prolong):
+            Information about prolong
+        '''
+        return await self._submit("prolong", (period,), id)
+
+    async def flush(self) -> None:
+        '''Sends all collected calls at once and waits for their requests'''
+        for batch in list(self._batches.values()):
+            self._dispatch(batch)
+        while self._tasks:
+            await asyncio.gather(*self._tasks, return_exceptions=True)
+
+    async def _submit(self, method: str, params: tuple, id: int) -> Any:
+        key = (method, params)
+        batch = self._batches.get(key)
+        future = batch.futures.get(id) if batch is not None else None
+        if future is None:
+            length = len(str(id)) + 1
+            if batch is not None and (len(batch.futures) >= self.max_batch or batch.length + length > self.max_ids_length):
+                self._dispatch(batch)
+                batch = None
+            if batch is None:
+                batch = self._batches[key] = _Batch(method, params)
+                batch.timer = asyncio.get_running_loop().call_later(self.delay, self._dispatch, batch)
+            future = batch.futures[id] = asyncio.get_running_loop().create_future()
+            batch.length += length
+            if len(batch.futures) >= self.max_batch:
+                self._dispatch(batch)
+        return await asyncio.shield(future)
+
+    def _dispatch(self, batch: _Batch) -> None:
+        if self._batches.get((batch.method, batch.params)) is not batch:
+            return
+        del self._batches[(batch.method, batch.params)]
+        batch.timer.cancel()
+        task = asyncio.ensure_future(self._send(batch.method, batch.params, batch.futures))
+        self._tasks.add(task)
+        task.add_done_callback(self._tasks.discard)
+
+    async def _request(self, method: str, params: tuple, ids: List[int]) -> Any:
+        self.requests += 1
+        if method == "settype":
+            return await self.client.setType(ids, params[0])
+        if method == "setdescr":
+            return await self.client.setDescription(params[0], ids=ids)
+        if method == "delete":
+            return await self.client.deleteProxy(ids=ids)
+        return await self.client.prolongProxy(params[0], ids)
+
+    async def _send(self, method: str, params: tuple, futures: Dict[int, asyncio.Future]) -> None:
+        ids = list(futures)
+        try:
+            result = await self._request(method, params, ids)
+        except _PER_ID_ERRORS as e:
+            if len(ids) == 1:
+                _resolve(futures[ids[0]], exception=e)
+            else:
+                await asyncio.gather(*(self._send(method, params, {id: futures[id]}) for id in ids))
+            return
+        except Exception as e:
+            for future in futures.values():
+                _resolve(future, exception=e)
+            return
+
+        if method == "settype":
+            for future in futures.values():
+                _resolve(future, result)
+        elif method == "prolong":
+            for id, future in futures.items():
+                if id in result.list:
+                    _resolve(future, result.list[id])
+                else:
+                    _resolve(future, exception=ElementNotFound(f"Proxy {id} was not prolonged"))
+        elif result == len(ids) or result == 0 or len(ids) == 1:
+            for future in futures.values():
+                _resolve(future, result // len(ids) if len(ids) > 1 else result)
+        elif method == "setdescr":
+            # partially applied, setting description again is harmless and tells which ids were changed
+            await asyncio.gather(*(self._send(method, params, {id: futures[id]}) for id in ids))
+        else:
+            for future in futures.values():
+                _resolve(future, result)
+
+
+def _resolve(future: asyncio.Future, result: Any = None, exception: Exception = None) -> None:
+    if future.done():
+        return
+    if exception is not None:
+        future.set_exception(exception)
+    else:
+        future.set_result(result)
@@ -0,0 +1,137 @@
+from .types import *
+from .exceptions import BadRequest, ERRORS, InsufficientFunds, ProxiesUnavailable
+from typing import Optional, TYPE_CHECKING
+from pydantic import BaseModel
+import asyncio
+
+if TYPE_CHECKING:
+    from .client import ProxySix
+
+_ERROR_IDS = {error: error_id for error_id, error in ERRORS.items()}
+
+class FailedChunk(BaseModel):
+    '''
+    Part of bulk order that was not bought
+
+    Attributes
+    ----------
+    index (int):
+        Index of the chunk order was split into
+    count (int):
+        Amount of proxies not bought
+    error_id (int):
+        API error ID (None for errors not returned by API, e.g. timeouts)
+    error (str):
+        Error the part failed with
+    ambiguous (bool):
+        True - request failed without answer and may have been applied by API
+    '''
+    index: int
+    count: int
+    error_id: Optional[int] = None
+    error: str
+    ambiguous: bool = False
+
+
+class BulkPurchase(NewProxyListNokey):
+    '''
+    Merged result of bulk order
+
+    Has the fields of `NewProxyListNokey` for all bought proxies (`count`, `price`, `period`, `country`, `list`).
+
+    Attributes
+    ----------
+    requested (int):
+        Amount of proxies ordered
+    chunks (int):
+        Amount of chunks order was split into
+    failed (List[FailedChunk]):
+        Parts of order that were not bought and why
+    '''
+    requested: int
+    chunks: int
+    failed: List[FailedChunk] = []
+
+    @property
+    def missing(self) -> int:
+        '''Amount of ordered proxies not bought'''
+        return self.requested - self.count
+
+    @property
+    def complete(self) -> bool:
+        '''Whether all ordered proxies were bought'''
+        return not self.failed
+
+
+async def buy_bulk(client: "ProxySix",
+        count: int,
+        period: int,
+        country: ProxyCountry,
+        version: ProxyVersion = ProxyVersion.IPv6,
+        type: ProxyScheme = ProxyScheme.HTTPS,
+        description: str = None,
+        auto_prolong: bool = False,
+        chunk_size: int = 100,
+        concurrency: int = 4,
+        min_chunk: int = 10) -> BulkPurchase:
+    '''
+    Buys proxies in chunks of `chunk_size`, at most `concurrency` `buyProxy` calls at once
+
+    A chunk rejected with `ProxiesUnavailable` or `InsufficientFunds` is halved and its halves are bought
+    one after another while they are at least `min_chunk` large, so as much as possible is bought.
+    Other errors fail the chunk at once. Failed requests are never resent: request failed without readable answer
+    (connection error, timeout, broken or invalid response) may have been applied and is reported as `ambiguous`.
+
+    See `ProxySix.buyBulk` for parameters.
+    '''
+    sizes = [chunk_size] * (count // chunk_size) + ([count % chunk_size] if count % chunk_size else [])
+    semaphore = asyncio.Semaphore(concurrency)
+    bought = [[] for _ in sizes]
+    failed = []
+
+    async def buy(index: int, size: int) -> None:
+        async with semaphore:
+            try:
+                res = await client.buyProxy(size, period, country, version, type, description, auto_prolong, nokey=True)
+            except (ProxiesUnavailable, InsufficientFunds) as e:
+                if size // 2 < max(min_chunk, 1):
+                    failed.append(FailedChunk(index=index, count=size, error_id=_ERROR_IDS[e.__class__], error=f"{e.__class__.__name__}: {e}"))
+                    return
+                error = e
+            except BadRequest as e:
+                failed.append(FailedChunk(index=index, count=size, error_id=_ERROR_IDS.get(e.__class__), error=f"{e.__class__.__name__}: {e}"))
+                return
+            except Exception as e:
+                # no answer or unreadable one (timeout, broken body, invalid data), the chunk may have been bought
+                failed.append(FailedChunk(index=index, count=size, error=f"{e.__class__.__name__}: {e}", ambiguous=True))
+                return
+            else:
+                bought[index].append(res)
+                return
+        half = size // 2
+        await buy(index, size - half)
+        if any(chunk.index == index for chunk in failed):
+            failed.append(FailedChunk(index=index, count=half, error_id=_ERROR_IDS[error.__class__], error=f"{error.__class__.__name__}: {error}"))
+            return
+        await buy(index, half)
+
+    await asyncio.gather(*(buy(index, size) for index, size in enumerate(sizes)))
+
+    results = [res for chunk in bought for res in chunk]
+    merged = {}
+    for chunk in failed:
+        key = (chunk.index, chunk.error_id, chunk.error, chunk.ambiguous)
+        if key in merged:
+            merged[key].count += chunk.count
+        else:
+            merged[key] = chunk
+    failed = sorted(merged.values(), key=lambda chunk: chunk.index)
+    return BulkPurchase.construct(
+        count=sum(res.count for res in results),
+        price=round(sum(res.price for res in results), 2),
+        period=period,
+        country=country,
+        list=[proxy for res in results for proxy in res.list],
+        requested=count,
+        chunks=len(sizes),
+        failed=failed)
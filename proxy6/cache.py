@@ -0,0 +1,119 @@
+from typing import Any, Awaitable, Callable, Dict
+import asyncio, collections, time
+
+DEFAULT_TTLS = {
+    "getcountry" : 3600.0,
+    "getprice" : 300.0,
+    "getcount" : 60.0
+}
+
+class ResponseCache():
+    '''
+    Cache of decoded responses of read-only API methods
+
+    Entries are keyed by method and parameters, live for a per-method time and the least recently used 
+    entry is evicted once `maxsize` is reached. Concurrent identical requests are joined into one: 
+    only the first one is sent, the rest wait for its result. Errors are never cached.
+
+    Cached objects are shared between callers and must be treated as read-only.
+
+    Attributes
+    ----------
+    ttls (Dict[str, float]):
+        Lifetime of entries for each cached method in seconds
+    maxsize (int):
+        Maximum amount of entries
+    hits (int):
+        Amount of requests answered from cache or joined to request in flight
+    misses (int):
+        Amount of requests sent to API
+    '''
+    def __init__(self, ttls: Dict[str, float] = None, maxsize: int = 1024) -> None:
+        '''
+        Parameters
+        ----------
+        ttls (Dict[str, float]):
+            Lifetime of entries in seconds by method name. 
+            Only listed methods are cached (default - DEFAULT_TTLS: `getcountry`, `getprice`, `getcount`)
+        maxsize (int):
+            Maximum amount of entries (default - 1024)
+        '''
+        self.ttls: Dict[str, float] = dict(DEFAULT_TTLS if ttls is None else ttls)
+        self.maxsize: int = maxsize
+        self._entries: collections.OrderedDict = collections.OrderedDict()
+        self._inflight: Dict[tuple, asyncio.Future] = {}
+        self.hits: int = 0
+        self.misses: int = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def caches(self, method: str) -> bool:
+        '''Whether responses of `method` are cached'''
+        return method in self.ttls
+
+    @staticmethod
+    def _key(method: str, params: dict) -> tuple:
+        return (method, tuple(sorted(params.items())))
+
+    async def get(self, method: str, params: dict, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        '''
+        Returns cached response or obtains it with `fetch`
+
+        Parameters
+        ----------
+        method (str):
+            API method name
+        params (dict):
+            Request parameters
+        fetch (Callable[[], Awaitable[Any]]):
+            Coroutine function requesting and decoding response
+        '''
+        key = self._key(method, params)
+        entry = self._entries.get(key)
+        if entry is not None:
+            expires, value = entry
+            if expires > time.monotonic():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.hits += 1
+        else:
+            self.misses += 1
+            task = self._inflight[key] = asyncio.ensure_future(fetch())
+            task.add_done_callback(lambda t: self._store(key, method, t))
+        return await asyncio.shield(task)
+
+    def _store(self, key: tuple, method: str, task: asyncio.Future) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        else:
+            return
+        if task.cancelled() or task.exception() is not None:
+            return
+        self._entries[key] = (time.monotonic() + self.ttls[method], task.result())
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, method: str = None) -> None:
+        '''
+        Drops cached entries. Requests already in flight are not stored once they finish.
+
+        Parameters
+        ----------
+        method (str):
+            Drop entries of this method only (default - None, drop everything)
+        '''
+        if method is None:
+            self._entries.clear()
+            self._inflight.clear()
+            return
+        for key in [key for key in self._entries if key[0] == method]:
+            del self._entries[key]
+        for key in [key for key in self._inflight if key[0] == method]:
+            del self._inflight[key]
@@ -0,0 +1,806 @@
+from __future__ import annotations
+from .exceptions import *
+from .enums import *
+from .ratelimit import RateLimiter
+from .retry import RetryPolicy
+from .cache import ResponseCache
+from .jsonlib import ListStreamParser, loads
+from .transport import Transport, AiohttpTransport
+from .hooks import Hooks, CallEvent
+from typing import AsyncIterator, Dict, Iterable, List, Tuple, TYPE_CHECKING
+import asyncio, collections, datetime, itertools, time
+
+if TYPE_CHECKING:
+    import aiohttp
+    from .types import *
+    from .planner import PurchaseConstraints, PurchasePlan
+    from .bulk import BulkPurchase
+    from .idempotency import MutationJournal
+
+_DECODERS: tuple = None
+
+def _load_decoders() -> tuple:
+    '''Imports decoders (and pydantic models) on the first decoded response'''
+    global _DECODERS
+    from .decoders import DECODERS, TRUSTED_DECODERS
+    _DECODERS = (DECODERS, TRUSTED_DECODERS)
+    return _DECODERS
+
+
+class ProxySix():
+    '''Class to work with proxy provider API proxy6.net'''
+    URL = "https://proxy6.net/api"
+    PAGE_LIMIT = 1000
+
+    def __init__(self, 
+            api_key: str, 
+            session: aiohttp.ClientSession = None, 
+            limit: int = 100, 
+            limit_per_host: int = 0, 
+            keepalive_timeout: float = 15.0, 
+            ttl_dns_cache: int = 10, 
+            rate_limiter: RateLimiter = None, 
+            retry: RetryPolicy = None, 
+            cache: ResponseCache = None, 
+            trusted: bool = False, 
+            transport: Transport = None, 
+            hooks: Hooks = None, 
+            journal: MutationJournal = None) -> None:
+        '''
+        Initialize instance of ProxyService
+
+        Parameters
+        ----------
+        api_key (str):
+            API key from proxy6.net (`https://proxy6.net/en/user/developers`)
+        session (aiohttp.ClientSession):
+            Session to send requests with. If not given, instance creates its own session 
+            on the first request and closes it in `close()` (default - None)
+        limit (int):
+            Total number of simultaneous connections of own session (default - 100, 0 - unlimited)
+        limit_per_host (int):
+            Number of simultaneous connections to one host of own session (default - 0, unlimited)
+        keepalive_timeout (float):
+            Seconds to keep idle connections of own session open (default - 15.0)
+        ttl_dns_cache (int):
+            Seconds to cache resolved DNS entries of own session (default - 10)
+        rate_limiter (RateLimiter):
+            Limiter every request waits for before being sent. Use `RateLimiter.shared(api_key, ...)` 
+            to share one limit between instances with the same API key (default - None, no limit)
+        retry (RetryPolicy):
+            Policy of retrying idempotent requests failed with transient errors (default - None, no retries)
+        cache (ResponseCache):
+            Cache for responses of read-only catalog methods (`getCountry`, `getPrice`, `getCount`). 
+            It is cleared after every `buyProxy`, `prolongProxy` and `deleteProxy` call (default - None, no caching)
+        trusted (bool):
+            True - skip validation of proxy lists: `getProxy` returns `ProxyRecord` objects 
+            parsing dates lazily instead of `Proxy` models (default - False)
+        transport (Transport):
+            Way requests are delivered to API. If given, `session` and connection options are ignored 
+            and the transport is closed in `close()` (default - None, `AiohttpTransport`)
+        hooks (Hooks):
+            Callbacks reporting timing, size and errors of every call, e.g. to `MetricsCollector` (default - None)
+        journal (MutationJournal):
+            Journal of calls made with `idempotency_key`, required to use the keys (default - None)
+        '''
+        self.api_key: str = api_key
+        self.user_id: int = None
+        self.balance: float = None
+        self.currency: Currency = None
+        self.date_mod: datetime.datetime = None
+
+        self.rate_limiter: RateLimiter = rate_limiter
+        self.retry: RetryPolicy = retry
+        self.cache: ResponseCache = cache
+        self.trusted: bool = trusted
+        self.hooks: Hooks = hooks
+        self.journal: MutationJournal = journal
+        self._planner = None
+
+        if transport is None:
+            transport = AiohttpTransport(session, limit, limit_per_host, keepalive_timeout, ttl_dns_cache)
+        self.transport: Transport = transport
+
+    async def __aenter__(self) -> "ProxySix":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    @property
+    def session(self) -> aiohttp.ClientSession:
+        '''Session used to send requests by `AiohttpTransport` (created on first access if not supplied)'''
+        return self.transport.session
+
+    async def close(self) -> None:
+        '''
+        Closes the transport and its connection pool. 
+        Session supplied by caller is left open, it is up to caller to close it.
+        '''
+        await self.transport.close()
+
+    async def _private_request(self, method: str, params: dict, event: CallEvent = None) -> dict:
+        url = f"{self.URL}/{self.api_key}/{method}/"
+        if self.retry is not None:
+            self.retry.record_request()
+        attempt = 1
+        while True:
+            if self.rate_limiter is not None:
+                await self.rate_limiter.acquire()
+            if event is not None:
+                event.attempt = attempt
+                self.hooks.emit("on_request_start", event)
+                start = time.perf_counter()
+            try:
+                r = await self.transport.get(url, params)
+                if event is not None:
+                    event.network_time += time.perf_counter() - start
+                    event.status = r.status
+                    event.bytes = len(r.body)
+                    self.hooks.emit("on_response", event)
+                if r.status == 200:
+                    if event is not None:
+                        start = time.perf_counter()
+                    try:
+                        data = loads(r.body)
+                    except ValueError:
+                        return None
+                    finally:
+                        if event is not None:
+                            event.decode_time += time.perf_counter() - start
+                    if not isinstance(data, dict):
+                        return None
+                    status = data.get("status", None)
+                    if status == "yes" or status == "no":
+                        return data
+                    return None
+                if r.status < 500 or not self._retry_allowed(method, attempt):
+                    return None
+            except self.transport.transient_errors:
+                if event is not None:
+                    event.network_time += time.perf_counter() - start
+                if not self._retry_allowed(method, attempt):
+                    raise
+            await asyncio.sleep(self.retry.delay(attempt))
+            attempt += 1
+
+    async def _call(self, method: str, params: dict):
+        if self.cache is not None and self.cache.caches(method):
+            return await self.cache.get(method, params, lambda: self._request(method, params))
+        return await self._request(method, params)
+
+    async def _mutate(self, method: str, params: dict, idempotency_key: str = None, ends: Dict[int, int] = None):
+        if idempotency_key is None:
+            return await self._call(method, params)
+        if self.journal is None:
+            raise ValueError("idempotency_key requires client created with journal")
+        from .idempotency import run_idempotent
+        return await run_idempotent(self, self.journal, idempotency_key, method, params, ends)
+
+    async def _request(self, method: str, params: dict):
+        if self.hooks is None:
+            res = await self._private_request(method, params)
+            return self._extract_data(res, method)
+        event = CallEvent(method, params)
+        try:
+            res = await self._private_request(method, params, event)
+            start = time.perf_counter()
+            result = self._extract_data(res, method)
+            event.decode_time += time.perf_counter() - start
+        except Exception as e:
+            event.error = e
+            self.hooks.emit("on_error", event)
+            raise
+        self.hooks.emit("on_decode_done", event)
+        return result
+
+    def _retry_allowed(self, method: str, attempt: int) -> bool:
+        return self.retry is not None and self.retry.allow(method, attempt)
+                                     
+    def _extract_data(self, data: dict, method: str):
+        if data is None:
+            raise UnknownError("Invalid Request")
+        
+        user_id = data.pop("user_id", None)
+        if user_id is not None:
+            self.user_id = int(user_id)
+        balance = data.pop("balance", None)
+        if balance is not None:
+            self.balance = float(balance)
+        currency = data.pop("currency", None)
+        if currency is not None:
+            self.currency = Currency(currency)
+        date_mod = data.pop("date_mod", None)
+        if date_mod is not None:
+            self.date_mod = datetime.datetime.fromisoformat(date_mod)
+
+        if data.pop("status", None) == "yes":
+            decoders, trusted_decoders = _DECODERS or _load_decoders()
+            decoder = self.trusted and trusted_decoders.get(method) or decoders.get(method)
+            return decoder(data) if decoder is not None else None
+        
+        error_id = data.get("error_id", None)
+        error = ERRORS.get(int(error_id), UnknownError) if error_id is not None else UnknownError
+        raise error(data.get("error", None))
+    
+    async def getPrice(self, count: int, period: int, version: ProxyVersion = ProxyVersion.IPv6) -> Price:
+        '''
+        Get information about the cost of the order, depending on the version, period and number of proxy
+
+        Parameters
+        ----------
+        count (int):
+            Number of proxies (Required)
+        period (int):
+            Number of days (Required)
+        version (ProxyVersion):
+            Proxy version (default: IPv6)
+
+        Returns
+        -------
+            data (PriceDict)
+        '''
+        method = "getprice"
+        params = {
+            "count" : count,
+            "period" : period,
+            "version" : version.value
+        }
+        return await self._call(method, params)
+    
+    async def getCount(self, country: ProxyCountry, version: ProxyVersion = ProxyVersion.IPv6) -> int:
+        '''
+        Get an information on amount of proxies available to purchase for a selected country
+
+        Parameters
+        ----------
+        country (ProxyCountry):
+            Country Code (Required)
+        version (ProxyVersion):
+            Proxy version (default: IPv6)
+
+        Returns
+        -------
+            data (CountDict)
+        '''
+        method = "getcount"
+        params = {
+            "country" : country.value,
+            "version" : version.value
+        }
+        return await self._call(method, params)
+    
+    async def getCountry(self, version: ProxyVersion = ProxyVersion.IPv6) -> List[ProxyCountry]:
+        '''
+        Get information on available for proxies purchase countries
+
+        Parameters
+        ----------
+        version (ProxyVersion):
+            Proxy Version (default: IPv6)
+
+        Returns
+        -------
+            data (CountryDict)
+        '''
+        method = "getcountry"
+        params = {"version" : version.value}
+        return await self._call(method, params)
+    
+    async def getProxy(self, 
+            state: ProxyState = ProxyState.all, 
+            description: str = None, 
+            nokey: bool = False, 
+            page: int = 1, 
+            limit: int = 1000) -> ProxyList | ProxyListNokey:
+        '''
+        Returns the list of your proxies
+
+        Parameters
+        ----------
+        state (ProxyState):
+            State of proxies to return (default - All)
+        description (str):
+            Technical comment you've entered when purchased proxy. 
+            Proxies with exact same description will be returned (deafult - None)
+        nokey (bool):
+            True - proxies will be returned as list. False - proxies will be returned as dictionary (key - proxy id, value - proxy info)
+        page (int):
+            Page number to return (default - 1)
+        limit (int):
+            Limit of proxies to return (default - 1000; max. value)
+
+        Returns
+        -------
+        data (ProxyList | ProxyListNokey):
+            Information about proxies
+        '''
+        method = "getproxy"
+        params = {
+            "state" : state.value,
+            "page" : page,
+            "limit" : limit
+        }
+        if description is not None:
+            params["descr"] = description
+        if nokey:
+            params["nokey"] = ""
+
+        return await self._call(method, params)
+    
+    async def streamProxy(self, 
+            state: ProxyState = ProxyState.all, 
+            description: str = None, 
+            page: int = 1, 
+            limit: int = 1000) -> AsyncIterator[Proxy]:
+        '''
+        Returns one page of your proxies like `getProxy`, yielding each proxy as soon as it is downloaded
+
+        Response body is parsed incrementally, so the first proxies are available before the whole page 
+        is received and the page is never held in memory at once. API errors are raised after the body ends. 
+        Requests made with this method are not retried.
+
+        Parameters
+        ----------
+        state (ProxyState):
+            State of proxies to return (default - All)
+        description (str):
+            Technical comment you've entered when purchased proxy (default - None)
+        page (int):
+            Page number to return (default - 1)
+        limit (int):
+            Limit of proxies to return (default - 1000; max. value)
+
+        Yields
+        ------
+        proxy (Proxy):
+            Information about proxy (`ProxyRecord` for trusted client)
+        '''
+        method = "getproxy"
+        params = {
+            "state" : state.value,
+            "page" : page,
+            "limit" : limit,
+            "nokey" : ""
+        }
+        if description is not None:
+            params["descr"] = description
+        from .types import Proxy, ProxyRecord
+        decode = ProxyRecord if self.trusted else lambda proxy: Proxy(**proxy)
+
+        url = f"{self.URL}/{self.api_key}/{method}/"
+        if self.rate_limiter is not None:
+            await self.rate_limiter.acquire()
+        parser = ListStreamParser()
+        async with self.transport.stream(url, params) as r:
+            if r.status != 200:
+                raise UnknownError("Invalid Request")
+            async for chunk in r.iter_chunks():
+                try:
+                    entries = parser.feed(chunk)
+                except ValueError:
+                    raise UnknownError("Invalid Request")
+                for entry in entries:
+                    yield decode(entry[1] if parser.keyed else entry)
+        try:
+            entries = parser.close()
+        except ValueError:
+            raise UnknownError("Invalid Request")
+        for entry in entries:
+            yield decode(entry[1] if parser.keyed else entry)
+        header = parser.header
+        if header.get("status", None) == "yes":
+            header["list"] = []
+        self._extract_data(header, method)
+    
+    async def iterProxies(self, 
+            state: ProxyState = ProxyState.all, 
+            description: str = None, 
+            page_size: int = 1000, 
+            prefetch: int = 1) -> AsyncIterator[Proxy]:
+        '''
+        Iterates over all of your proxies, fetching pages of `getProxy` lazily
+
+        While one page is being consumed up to `prefetch` following pages are already requested, 
+        so at most `prefetch + 1` pages are held in memory at once.
+
+        Parameters
+        ----------
+        state (ProxyState):
+            State of proxies to return (default - All)
+        description (str):
+            Technical comment you've entered when purchased proxy (default - None)
+        page_size (int):
+            Amount of proxies requested per page, larger values are reduced to 1000 (default - 1000; max. value)
+        prefetch (int):
+            Amount of pages requested ahead of the one being consumed (default - 1)
+
+        Yields
+        ------
+        proxy (Proxy):
+            Information about proxy
+        '''
+        page_size = min(max(page_size, 1), self.PAGE_LIMIT)
+        pending = collections.deque()
+        next_page = 1
+
+        def discard(task: asyncio.Future) -> None:
+            # prefetched page is not needed, its error is retrieved so it is never reported as unretrieved
+            task.cancel()
+            task.add_done_callback(lambda task: task.cancelled() or task.exception())
+
+        def schedule():
+            nonlocal next_page
+            pending.append(asyncio.ensure_future(self.getProxy(
+                state=state, description=description, nokey=True, page=next_page, limit=page_size)))
+            next_page += 1
+
+        try:
+            for _ in range(max(prefetch, 0) + 1):
+                schedule()
+            while pending:
+                proxies = await pending.popleft()
+                if len(proxies.list) < page_size:
+                    while pending:
+                        discard(pending.popleft())
+                else:
+                    schedule()
+                for proxy in proxies.list:
+                    yield proxy
+        finally:
+            for task in pending:
+                discard(task)
+    
+    async def setType(self, ids: List[int], type: ProxyScheme) -> bool:
+        '''
+        Changes the type (protocol) in the proxy list
+
+        Parameters
+        ----------
+        ids (List[int]):
+            List of proxy IDs to change type (Required)
+        type (ProxyScheme):
+            New scheme to be applied to chosen proxies (Required)
+
+        Returns
+        -------
+        result (bool):
+            True - succsefully changed type
+        '''
+        method = "settype"
+        params = {
+            "ids" : ",".join(map(str, ids)),
+            "type" : type.value
+        }
+        return await self._call(method, params)
+    
+    async def setDescription(self, new: str, old: str = None, ids: List[int] = None) -> int:
+        '''
+        Updates technical comments in the proxy list that was added when buying (method `buy`)
+
+        Parameters
+        ----------
+        new (str):
+            New description to set (Required)
+        old (str):
+            Old description to replace
+        ids (List[int]):
+            List of proxy IDs to set new description to
+
+        *Either `old` or `ids` parameter must be set.
+
+        Returns
+        -------
+        count (int) 
+            Amount of proxies that were changed
+        '''
+        method = "setdescr"
+        params = {
+            "new" : new
+        }
+        if old is not None:
+            params["old"] = old
+        if ids is not None:
+            params["ids"] = ",".join(map(str, ids))
+        
+        return await self._call(method, params)
+    
+    async def buyProxy(self, 
+        count: int, 
+        period: int, 
+        country: ProxyCountry, 
+        version: ProxyVersion = ProxyVersion.IPv6, 
+        type: ProxyScheme = ProxyScheme.HTTPS, 
+        description: str = None, 
+        auto_prolong: bool = False, 
+        nokey: bool = False, 
+        idempotency_key: str = None) -> NewProxyList | NewProxyListNokey:
+        '''
+        Used for proxy purchases
+
+        Parameters
+        ----------
+        count (int):
+            Amount of proxies to buy (Required)
+        period (int):
+            Period for which proxies are purchased in days (Required)
+        country (ProxyCountry):
+            Country of proxy (Required)
+        version (ProxyVersion):
+            Proxy Version (IPv4, IPv4Shared, IPv6)
+        type (ProxyScheme):
+            Proxy Scheme (http, socks)
+        desciption (str):
+            Technical description for proxy. (Max value 50 characters)
+        auto_prolong (bool):
+            True - prolong proxy automatically, False - do not prolong
+        nokey (bool):
+            True - proxies will be returned as list. False - proxies will be returned as dictionary (key - proxy id, value - proxy info)
+        idempotency_key (str):
+            Unique key of this purchase. Repeating the call with the same key (e.g. after timeout) never buys twice, 
+            see `MutationJournal` (default - None)
+
+        Returns
+        -------
+        data (NewProxyList | NewProxyListNokey):
+            Information about just bought proxies
+        '''
+        method = "buy"
+        params = {
+            "count" : count,
+            "period" : period,
+            "country" : country.value,
+            "version" : version.value,
+            "type" : type.value,
+        }
+        if description is not None:
+            params["descr"] = description
+        
+        if auto_prolong:
+            params["auto_prolong"] = ""
+        if nokey:
+            params["nokey"] = ""
+
+        try:
+            return await self._mutate(method, params, idempotency_key)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate()
+    
+    async def prolongProxy(self, 
+            period: int, 
+            ids: List[int | Proxy], 
+            nokey: bool = False, 
+            idempotency_key: str = None) -> ProlongList | ProlongListNokey:
+        '''
+        Used to extend existing proxies
+
+        Parameters
+        ----------
+        period (int):
+            Extension period in days (Required)
+        ids (List[int | Proxy]):
+            List of proxy IDs or proxies (e.g. from `ProxyInventory`) to extend. With `idempotency_key`, 
+            `unixtime_end` of given proxies is journaled to find out later whether the call was applied (Required)
+        nokey (bool):
+            True - proxies will be returned as list. False - proxies will be returned as dictionary (key - proxy id, value - proxy info)
+        idempotency_key (str):
+            Unique key of this prolong. Repeating the call with the same key never prolongs twice (default - None)
+
+        Returns
+        -------
+        data (ProlongList | ProlongListNokey)
+            Information about prolongs
+        '''
+        method = "prolong"
+        ends = {proxy.id: proxy.unixtime_end for proxy in ids if not isinstance(proxy, int)}
+        params = {
+            "period" : period,
+            "ids" : ",".join(str(id if isinstance(id, int) else id.id) for id in ids)
+        }
+        if nokey:
+            params["nokey"] = ""
+
+        try:
+            return await self._mutate(method, params, idempotency_key, ends)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate()
+    
+    async def deleteProxy(self, ids: List[int] = None, description: str = None, idempotency_key: str = None) -> int:
+        '''
+        Used to delete proxies
+
+        Parameters
+        ----------
+        ids (List[int]):
+            List of proxy IDs to set new description to (Required)
+        description (str):
+            New description to set (Required)
+        idempotency_key (str):
+            Unique key of this deletion. Repeating the call with the same key returns the same amount (default - None)
+
+        *Either `ids` or `description` parameter must be set.
+
+        Returns
+        -------
+        data (int):
+            Amount of just deleted proxies
+        '''
+        method = "delete"
+        params = {}
+        if ids is not None:
+            params["ids"] = ",".join(map(str, ids))
+        if description is not None:
+            params["descr"] = description
+
+        try:
+            return await self._mutate(method, params, idempotency_key)
+        finally:
+            if self.cache is not None:
+                self.cache.invalidate()
+    
+    async def checkProxy(self, id: int) -> bool:
+        '''
+        Used to check the validity of the proxy
+
+        Parameters
+        ----------
+        ids (int):
+            Proxy ID to check
+
+        Returns
+        -------
+        data (bool):
+            True - proxy is working. False - proxy is not working
+        '''
+        method = "check"
+        params = {
+            "ids" : id
+        }
+
+        return await self._call(method, params)
+
+    async def buyBulk(self, 
+            count: int, 
+            period: int, 
+            country: ProxyCountry, 
+            version: ProxyVersion = ProxyVersion.IPv6, 
+            type: ProxyScheme = ProxyScheme.HTTPS, 
+            description: str = None, 
+            auto_prolong: bool = False, 
+            chunk_size: int = 100, 
+            concurrency: int = 4, 
+            min_chunk: int = 10) -> BulkPurchase:
+        '''
+        Buys large amount of proxies as concurrent orders of `chunk_size`
+
+        Failure of one chunk does not undo or stop others. A chunk rejected because proxies or funds ran out 
+        (`ProxiesUnavailable`, `InsufficientFunds`) is halved while halves are at least `min_chunk` large, 
+        so everything that can be bought is bought. Failed chunks are not resent; a chunk failed without readable answer 
+        from API is marked `ambiguous`, since it may have been bought.
+
+        Parameters
+        ----------
+        count (int):
+            Amount of proxies (Required)
+        period (int):
+            Period in days (Required)
+        country (ProxyCountry):
+            Country Code (Required)
+        version (ProxyVersion):
+            Proxy version (default - IPv6)
+        type (ProxyScheme):
+            Proxy scheme (default - HTTPS)
+        description (str):
+            Technical description for proxies (default - None)
+        auto_prolong (bool):
+            True - prolong proxies automatically (default - False)
+        chunk_size (int):
+            Amount of proxies per order (default - 100)
+        concurrency (int):
+            Maximum amount of orders at once (default - 4)
+        min_chunk (int):
+            Smallest part a rejected chunk is split into (default - 10)
+
+        Returns
+        -------
+        data (BulkPurchase):
+            Merged `NewProxyListNokey` of bought proxies with `failed` chunks, their sizes and errors
+        '''
+        from .bulk import buy_bulk
+        return await buy_bulk(self, count, period, country, version, type, description, auto_prolong, 
+            chunk_size, concurrency, min_chunk)
+
+    async def planPurchase(self, 
+            count: int, 
+            period: int, 
+            constraints: PurchaseConstraints = None, 
+            execute: bool = False, 
+            type: ProxyScheme = ProxyScheme.HTTPS, 
+            description: str = None, 
+            auto_prolong: bool = False) -> PurchasePlan:
+        '''
+        Finds the cheapest split of purchase across countries and versions, optionally buying it
+
+        Countries, availability and prices are requested concurrently and cached (see `PurchasePlanner`). 
+        Orders of a feasible plan are placed at once when `execute` is True, results are stored in the orders.
+
+        Parameters
+        ----------
+        count (int):
+            Amount of proxies to buy (Required)
+        period (int):
+            Period in days (Required)
+        constraints (PurchaseConstraints):
+            Allowed countries and versions, maximum price and amount of orders (default - None, no limits)
+        execute (bool):
+            True - buy proxies of the plan if it is feasible (default - False)
+        type (ProxyScheme):
+            Scheme of bought proxies (default - HTTPS)
+        description (str):
+            Technical description of bought proxies (default - None)
+        auto_prolong (bool):
+            True - prolong bought proxies automatically (default - False)
+
+        Returns
+        -------
+        plan (PurchasePlan):
+            Orders with their prices (and results if executed); `reason` is set if plan is not feasible
+        '''
+        if self._planner is None:
+            from .planner import PurchasePlanner
+            self._planner = PurchasePlanner(self)
+        plan = await self._planner.plan(count, period, constraints)
+        if execute and plan.feasible:
+            await self._planner.execute(plan, type, description, auto_prolong)
+        return plan
+
+    async def checkMany(self, 
+            ids: Iterable[int], 
+            concurrency: int = 10, 
+            timeout: float = None) -> AsyncIterator[Tuple[int, bool | Exception]]:
+        '''
+        Checks validity of many proxies concurrently, yielding results as soon as they complete
+
+        At most `concurrency` checks are in flight at once, ids are taken from `ids` lazily. 
+        Failure of one check does not stop the others: its exception is yielded in place of status. 
+        Closing the iterator cancels checks that are still running.
+
+        Parameters
+        ----------
+        ids (Iterable[int]):
+            Proxy IDs to check (Required)
+        concurrency (int):
+            Maximum amount of simultaneous checks (default - 10)
+        timeout (float):
+            Seconds to wait for a single check, `asyncio.TimeoutError` is yielded on expiry (default - None, no timeout)
+
+        Yields
+        ------
+        result (Tuple[int, bool | Exception]):
+            Proxy ID and its status (True - working, False - not working) or exception raised while checking
+        '''
+        async def check(id: int):
+            try:
+                return id, await asyncio.wait_for(self.checkProxy(id), timeout)
+            except Exception as e:
+                return id, e
+
+        ids = iter(ids)
+        running = set()
+
+        def fill():
+            for id in itertools.islice(ids, concurrency - len(running)):
+                running.add(asyncio.ensure_future(check(id)))
+
+        try:
+            fill()
+            while running:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                fill()
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in running:
+                task.cancel()
@@ -0,0 +1,299 @@
+from .client import ProxySix
+from .types import *
+from .exceptions import BadRequest, InsufficientFunds
+from .ratelimit import RateLimiter
+from .cache import ResponseCache
+from .transport import Transport, AiohttpTransport
+from typing import Any, Awaitable, Callable, Iterable, Iterator, Tuple
+from pydantic import BaseModel
+import asyncio, collections, datetime
+
+class Account(BaseModel):
+    '''
+    State of one account of a cluster
+
+    Attributes
+    ----------
+    name (str):
+        Account name in the cluster
+    user_id (int):
+        User ID (None until the first response)
+    balance (float):
+        Balance reported by the last response
+    currency (Currency):
+        Currency of balance
+    date_mod (datetime.datetime):
+        Last time proxies of account were modified
+    error (str):
+        Error of the last refresh (None if it succeeded)
+    '''
+    name: str
+    user_id: int = None
+    balance: float = None
+    currency: Currency = None
+    date_mod: datetime.datetime = None
+    error: str = None
+
+
+class ClusterProxyList(BaseModel):
+    '''
+    Proxies of all accounts of a cluster
+
+    Attributes
+    ----------
+    list_count (int):
+        Amount of proxies
+    list (List[Proxy]):
+        Proxies of all accounts (`ProxyRecord` objects for trusted clients)
+    accounts (Dict[int, str]):
+        Account name by proxy ID
+    errors (Dict[str, str]):
+        Error by name of account whose proxies could not be listed
+    '''
+    list_count: int = 0
+    list: List[Proxy] = []
+    accounts: Dict[int, str] = {}
+    errors: Dict[str, str] = {}
+
+    def of(self, name: str) -> List[Proxy]:
+        '''Returns proxies of one account'''
+        return [proxy for proxy in self.list if self.accounts[proxy.id] == name]
+
+
+class ProxySixCluster():
+    '''
+    Works with many proxy6.net accounts at once
+
+    All clients send requests through one transport, so they share its connection pool,
+    while each API key has its own rate limiter (`RateLimiter.shared`). Cross-account calls are run
+    concurrently, at most `concurrency` at once, and errors of single accounts are collected
+    instead of failing the whole call.
+
+    ```
+    async with ProxySixCluster({"main": key1, "reserve": key2}, rate=5) as cluster:
+        proxies = await cluster.getProxy(ProxyState.ACTIVE)
+        totals = await cluster.total_balance()
+        name, bought = await cluster.buyProxy(10, 30, ProxyCountry.GERMANY)
+    ```
+
+    Attributes
+    ----------
+    clients (Dict[str, ProxySix]):
+        Client by account name
+    transport (Transport):
+        Transport shared by all clients
+    concurrency (int):
+        Maximum amount of accounts called at once
+    '''
+    def __init__(self,
+            api_keys: Iterable[str] | Dict[str, str],
+            rate: float = None,
+            burst: int = 1,
+            concurrency: int = 10,
+            transport: Transport = None,
+            limit: int = 100,
+            **options) -> None:
+        '''
+        Parameters
+        ----------
+        api_keys (Iterable[str] | Dict[str, str]):
+            API keys, or API key by account name. Keys themselves are used as names if not given (Required)
+        rate (float):
+            Requests per second allowed for every API key (default - None, no limit)
+        burst (int):
+            Requests allowed at once for every API key after idle period (default - 1)
+        concurrency (int):
+            Maximum amount of accounts called at once (default - 10)
+        transport (Transport):
+            Transport shared by all clients, closed in `close()` (default - None, `AiohttpTransport` with `limit` connections)
+        limit (int):
+            Total number of simultaneous connections of default transport (default - 100)
+        **options:
+            Other `ProxySix` arguments applied to every client (e.g. `retry`, `trusted`, `hooks`). 
+            `cache` is a template: every client gets its own `ResponseCache` with the same settings. 
+            `journal` is not accepted, as idempotency keys belong to one account: set `cluster[name].journal` instead
+
+        Raises
+        ------
+        ValueError:
+            `journal` was given in options
+        '''
+        if options.get("journal") is not None:
+            raise ValueError("journal can not be shared by accounts, set it on clients of the cluster")
+        cache = options.pop("cache", None)
+        keys = dict(api_keys) if isinstance(api_keys, dict) else {key: key for key in api_keys}
+        self.transport: Transport = transport if transport is not None else AiohttpTransport(limit=limit)
+        self.concurrency: int = concurrency
+        self.clients: Dict[str, ProxySix] = {
+            name: ProxySix(key, transport=self.transport,
+                rate_limiter=RateLimiter.shared(key, rate, burst) if rate is not None else None, 
+                cache=ResponseCache(cache.ttls, cache.maxsize) if cache is not None else None, **options)
+            for name, key in keys.items()
+        }
+        self._errors: Dict[str, str] = {}
+
+    async def __aenter__(self) -> "ProxySixCluster":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+    async def close(self) -> None:
+        '''Closes the shared transport'''
+        await self.transport.close()
+
+    def __getitem__(self, name: str) -> ProxySix:
+        return self.clients[name]
+
+    def __len__(self) -> int:
+        return len(self.clients)
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.clients)
+
+    @property
+    def accounts(self) -> Dict[str, Account]:
+        '''State of every account as reported by its last response'''
+        return {
+            name: Account(name=name, user_id=client.user_id, balance=client.balance, currency=client.currency,
+                date_mod=client.date_mod, error=self._errors.get(name))
+            for name, client in self.clients.items()
+        }
+
+    async def gather(self,
+            call: Callable[[ProxySix], Awaitable[Any]],
+            names: Iterable[str] = None) -> Tuple[Dict[str, Any], Dict[str, Exception]]:
+        '''
+        Runs `call(client)` for every account concurrently
+
+        Parameters
+        ----------
+        call (Callable[[ProxySix], Awaitable[Any]]):
+            Coroutine function called with client of each account (Required)
+        names (Iterable[str]):
+            Names of accounts to call (default - None, all of them)
+
+        Returns
+        -------
+        outcome (Tuple[Dict[str, Any], Dict[str, Exception]]):
+            Results and exceptions by account name
+        '''
+        names = list(self.clients) if names is None else list(names)
+        semaphore = asyncio.Semaphore(self.concurrency)
+        results, errors = {}, {}
+
+        async def run(name: str) -> None:
+            async with semaphore:
+                try:
+                    results[name] = await call(self.clients[name])
+                except (BadRequest, *self.transport.transient_errors) as e:
+                    errors[name] = e
+
+        await asyncio.gather(*(run(name) for name in names))
+        return results, errors
+
+    async def refresh(self) -> Dict[str, Account]:
+        '''
+        Requests state of every account
+
+        Returns
+        -------
+        accounts (Dict[str, Account]):
+            Fresh state by account name (with `error` set for accounts that could not be reached)
+        '''
+        _, errors = await self.gather(lambda client: client.getProxy(nokey=True, limit=1))
+        self._errors = {name: repr(error) for name, error in errors.items()}
+        return self.accounts
+
+    async def total_balance(self, refresh: bool = True) -> Dict[Currency, float]:
+        '''
+        Sums balances of accounts
+
+        Parameters
+        ----------
+        refresh (bool):
+            True - request balances first, False - use ones of the last responses (default - True)
+
+        Returns
+        -------
+        totals (Dict[Currency, float]):
+            Total balance by currency
+        '''
+        accounts = await self.refresh() if refresh else self.accounts
+        totals = collections.defaultdict(float)
+        for account in accounts.values():
+            if account.balance is not None:
+                totals[account.currency] += account.balance
+        return {currency: round(total, 2) for currency, total in totals.items()}
+
+    async def getProxy(self,
+            state: ProxyState = ProxyState.all,
+            description: str = None,
+            names: Iterable[str] = None) -> ClusterProxyList:
+        '''
+        Returns all proxies of all accounts
+
+        Parameters
+        ----------
+        state (ProxyState):
+            State of proxies to return (default - All)
+        description (str):
+            Technical comment you've entered when purchased proxy (default - None)
+        names (Iterable[str]):
+            Names of accounts to list (default - None, all of them)
+
+        Returns
+        -------
+        proxies (ClusterProxyList):
+            Merged proxies with account of every proxy and errors of accounts that failed
+        '''
+        async def collect(client: ProxySix) -> list:
+            return [proxy async for proxy in client.iterProxies(state=state, description=description)]
+
+        results, errors = await self.gather(collect, names)
+        proxies, accounts = [], {}
+        for name, found in results.items():
+            proxies.extend(found)
+            accounts.update((proxy.id, name) for proxy in found)
+        return ClusterProxyList.construct(list_count=len(proxies), list=proxies, accounts=accounts,
+            errors={name: repr(error) for name, error in errors.items()})
+
+    async def buyProxy(self,
+            count: int,
+            period: int,
+            country: ProxyCountry,
+            version: ProxyVersion = ProxyVersion.IPv6,
+            type: ProxyScheme = ProxyScheme.HTTPS,
+            description: str = None,
+            auto_prolong: bool = False,
+            nokey: bool = False) -> Tuple[str, NewProxyList | NewProxyListNokey]:
+        '''
+        Buys proxies from an account able to pay for them
+
+        Price and balance of every account are requested at once (`getPrice`), then accounts that
+        can pay are tried from the cheapest price and the largest balance. Parameters are the ones of `ProxySix.buyProxy`.
+
+        Returns
+        -------
+        purchase (Tuple[str, NewProxyList | NewProxyListNokey]):
+            Name of account proxies were bought from and information about bought proxies
+
+        Raises
+        ------
+        InsufficientFunds:
+            No account can pay for proxies
+        '''
+        prices, errors = await self.gather(lambda client: client.getPrice(count, period, version))
+        candidates = sorted(
+            (name for name, price in prices.items() 
+                if self.clients[name].balance is not None and self.clients[name].balance >= price.price),
+            key=lambda name: (prices[name].price, -self.clients[name].balance))
+        for name in candidates:
+            try:
+                bought = await self.clients[name].buyProxy(count, period, country, version, type, description, auto_prolong, nokey)
+            except InsufficientFunds as e:
+                errors[name] = e
+                continue
+            return name, bought
+        raise InsufficientFunds(f"No account can pay for {count} proxies for {period} days" +
+            (f" ({', '.join(f'{name}: {error!r}' for name, error in errors.items())})" if errors else ""))
@@ -0,0 +1,85 @@
+from .types import *
+from typing import Any, Callable, Dict
+
+Decoder = Callable[[dict], Any]
+
+DECODERS: Dict[str, Decoder] = {}
+TRUSTED_DECODERS: Dict[str, Decoder] = {}
+
+def register_decoder(method: str, trusted: bool = False) -> Callable[[Decoder], Decoder]:
+    '''
+    Registers function decoding successful response of API method
+
+    Decoder receives response data without `status` and account fields 
+    (`user_id`, `balance`, `currency`, `date_mod`) and returns the value API method call results in.
+
+    Parameters
+    ----------
+    method (str):
+        API method name as it appears in URL (Required)
+    trusted (bool):
+        True - decoder is used by clients in trusted mode and may skip validation, 
+        methods without trusted decoder fall back to the regular one (default - False)
+    '''
+    def register(decoder: Decoder) -> Decoder:
+        (TRUSTED_DECODERS if trusted else DECODERS)[method] = decoder
+        return decoder
+    return register
+
+
+@register_decoder("getprice")
+def decode_price(data: dict) -> Price:
+    return Price(**data)
+
+@register_decoder("getcount")
+def decode_count(data: dict) -> int:
+    return int(data["count"])
+
+@register_decoder("getcountry")
+def decode_country(data: dict) -> List[ProxyCountry]:
+    return [ProxyCountry(code) for code in data["list"]]
+
+@register_decoder("getproxy")
+def decode_proxy(data: dict) -> ProxyList | ProxyListNokey:
+    if isinstance(data["list"], dict):
+        return ProxyList(**data)
+    return ProxyListNokey(**data)
+
+@register_decoder("getproxy", trusted=True)
+def decode_proxy_trusted(data: dict) -> ProxyList | ProxyListNokey:
+    proxies = data["list"]
+    if isinstance(proxies, dict):
+        return ProxyList.construct(
+            list_count=int(data["list_count"]), 
+            list={int(id): ProxyRecord(proxy) for id, proxy in proxies.items()})
+    return ProxyListNokey.construct(
+        list_count=int(data["list_count"]), 
+        list=[ProxyRecord(proxy) for proxy in proxies])
+
+@register_decoder("settype")
+def decode_type(data: dict) -> bool:
+    return True
+
+@register_decoder("setdescr")
+def decode_description(data: dict) -> int:
+    return int(data["count"])
+
+@register_decoder("buy")
+def decode_buy(data: dict) -> NewProxyList | NewProxyListNokey:
+    if isinstance(data["list"], dict):
+        return NewProxyList(**data)
+    return NewProxyListNokey(**data)
+
+@register_decoder("prolong")
+def decode_prolong(data: dict) -> ProlongList | ProlongListNokey:
+    if isinstance(data["list"], dict):
+        return ProlongList(**data)
+    return ProlongListNokey(**data)
+
+@register_decoder("delete")
+def decode_delete(data: dict) -> int:
+    return int(data["count"])
+
+@register_decoder("check")
+def decode_check(data: dict) -> bool:
+    return data["proxy_status"]
@@ -0,0 +1,84 @@
+from enum import Enum
+
+class ProxyVersion(Enum):
+    IPv6 = 6
+    IPv4 = 4
+    IPv4Shared = 3
+
+class ProxyCountry(Enum):
+    UKRAINE = 'ua'
+    LATVIA = 'lv'
+    RUSSIA = 'ru'
+    BELGIUM = 'be'
+    BELARUS = 'by'
+    ROMANIA = 'ro'
+    SLOVENIA = 'si'
+    SOUTH_AFRICA = 'za'
+    AUSTRALIA = 'au'
+    JAPAN = 'jp'
+    MOLDOVA = 'md'
+    ISRAEL = 'il'
+    SPAIN = 'es'
+    GERMANY = 'de'
+    KYRGYZSTAN = 'kg'
+    TAJIKISTAN = 'tj'
+    TURKMENISTAN = 'tm'
+    UNITED_STATES = 'us'
+    UNITED_KINGDOM = 'gb'
+    EGYPT = 'eg'
+    PHILIPPINES = 'ph'
+    HONG_KONG = 'hk'
+    KAZAKHSTAN = 'kz'
+    BULGARIA = 'bg'
+    MALAYSIA = 'my'
+    THAILAND = 'th'
+    SOUTH_KOREA = 'kr'
+    SERBIA = 'rs'
+    CYPRUS = 'cy'
+    BANGLADESH = 'bd'
+    UNITED_ARAB_EMIRATES = 'ae'
+    UZBEKISTAN = 'uz'
+    NIGERIA = 'ng'
+    MEXICO = 'mx'
+    TAIWAN = 'tw'
+    SINGAPORE = 'sg'
+    ITALY = 'it'
+    BRAZIL = 'br'
+    LITHUANIA = 'lt'
+    INDONESIA = 'id'
+    DENMARK = 'dk'
+    VIETNAM = 'vn'
+    INDIA = 'in'
+    CHINA = 'cn'
+    PORTUGAL = 'pt'
+    NETHERLANDS = 'nl'
+    GEORGIA = 'ge'
+    IRELAND = 'ie'
+    CHILE = 'cl'
+    ARMENIA = 'am'
+    ESTONIA = 'ee'
+    FRANCE = 'fr'
+    POLAND = 'pl'
+    CZECH_REPUBLIC = 'cz'
+    AUSTRIA = 'at'
+    NORWAY = 'no'
+    FINLAND = 'fi'
+    GREECE = 'gr'
+    SWITZERLAND = 'ch'
+    SWEDEN = 'se'
+    TURKEY = 'tr'
+    CANADA = 'ca'
+
+class ProxyState(Enum):
+    ACTIVE = "active"
+    EXPIRED = "expired"
+    EXPIRING = "expiring"
+    all = "all"
+
+class ProxyScheme(Enum):
+    HTTPS = "http"
+    SOCKS5 = "socks"
+
+class Currency(Enum):
+    RUB = "RUB"
+    USD = "USD"
@@ -61,4 +61,22 @@ class PriceError(BadRequest):
 
 class UnknownError(BadRequest):
     '''Raised when unknow error occured'''
-    pass
\ No newline at end of file
+    pass
+
+
+ERRORS = {
+    100 : InvalidAPIKey,
+    105 : InvalidIP,
+    110 : InvalidMethod,
+    200 : InvalidCount,
+    210 : InvalidPeriod,
+    220 : InvalidCountry,
+    230 : InvalidProxyIDs,
+    240 : InvalidVersion,
+    250 : InvalidDescription,
+    260 : InvalidType,
+    300 : ProxiesUnavailable,
+    400 : InsufficientFunds,
+    404 : ElementNotFound,
+    410 : PriceError
+}
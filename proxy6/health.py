@@ -0,0 +1,308 @@
+from .types import *
+from typing import AsyncIterator, Deque, Iterable
+from urllib.parse import urlsplit
+from pydantic import BaseModel
+import asyncio, base64, collections, itertools, ssl, struct, time
+
+class ProbeResult(BaseModel):
+    '''
+    Outcome of one request sent to target through proxy
+
+    Attributes
+    ----------
+    proxy_id (int):
+        Proxy ID
+    ok (bool):
+        True - target answered with status below 400
+    status (int):
+        HTTP status of target response (None if no response was received)
+    connect_time (float):
+        Seconds to open TCP connection to proxy
+    ttfb (float):
+        Seconds from start of probe to the first byte of response
+    total_time (float):
+        Seconds from start of probe to the end of response
+    size (int):
+        Bytes of response received
+    throughput (float):
+        Bytes per second received after the first byte
+    error (str):
+        Description of failure (None if probe completed)
+    timestamp (float):
+        Unixtime of probe start
+    '''
+    proxy_id: int
+    ok: bool
+    status: int = None
+    connect_time: float = None
+    ttfb: float = None
+    total_time: float = None
+    size: int = 0
+    throughput: float = None
+    error: str = None
+    timestamp: float
+
+
+class HealthRecord():
+    '''
+    Rolling health statistics of one proxy over the last `window` probes
+
+    Attributes
+    ----------
+    results (Deque[ProbeResult]):
+        Last probe results, oldest first
+    consecutive_failures (int):
+        Amount of failed probes since the last successful one
+    '''
+    def __init__(self, window: int = 20) -> None:
+        self.results: Deque[ProbeResult] = collections.deque(maxlen=window)
+        self.consecutive_failures: int = 0
+
+    def add(self, result: ProbeResult) -> None:
+        self.results.append(result)
+        self.consecutive_failures = 0 if result.ok else self.consecutive_failures + 1
+
+    @property
+    def last(self) -> ProbeResult:
+        return self.results[-1] if self.results else None
+
+    @property
+    def success_rate(self) -> float:
+        '''Share of successful probes in window (None if proxy was not probed)'''
+        if not self.results:
+            return None
+        return sum(result.ok for result in self.results) / len(self.results)
+
+    def _mean(self, field: str) -> float:
+        values = [getattr(result, field) for result in self.results if result.ok]
+        return sum(values) / len(values) if values else None
+
+    @property
+    def connect_time(self) -> float:
+        '''Mean connect time of successful probes in window'''
+        return self._mean("connect_time")
+
+    @property
+    def ttfb(self) -> float:
+        '''Mean time to first byte of successful probes in window'''
+        return self._mean("ttfb")
+
+    @property
+    def throughput(self) -> float:
+        '''Mean throughput of successful probes in window'''
+        return self._mean("throughput")
+
+
+async def _start_tls(reader: asyncio.StreamReader, writer: asyncio.StreamWriter, 
+        context: ssl.SSLContext, server_hostname: str) -> None:
+    '''Upgrades connection of reader and writer to TLS'''
+    if hasattr(writer, "start_tls"):
+        await writer.start_tls(context, server_hostname=server_hostname)
+        return
+    # StreamWriter.start_tls appeared in Python 3.11, older ones get the same switch of transport done by hand
+    transport = await asyncio.get_running_loop().start_tls(
+        writer.transport, writer.transport.get_protocol(), context, server_hostname=server_hostname)
+    writer._transport = reader._transport = transport
+
+
+class HealthProber():
+    '''
+    Checks proxies by sending requests through them, without using proxy6.net API
+
+    Every probe opens a connection to proxy (`http` or `socks5`, see `Proxy.proxy_link`), 
+    requests `target` through it and measures connect time, time to first byte and throughput. 
+    Results are collected into per-proxy `HealthRecord`s.
+
+    Attributes
+    ----------
+    target (str):
+        URL requested through proxies (`http://` or `https://`)
+    timeout (float):
+        Seconds a single probe may take
+    concurrency (int):
+        Maximum amount of simultaneous probes of `probe_many`
+    read_limit (int):
+        Maximum amount of response bytes read per probe
+    ssl_context (ssl.SSLContext):
+        Context used for `https://` targets
+    records (Dict[int, HealthRecord]):
+        Health records by proxy ID
+    '''
+    def __init__(self, 
+            target: str = "http://example.com/", 
+            timeout: float = 10.0, 
+            concurrency: int = 1000, 
+            window: int = 20, 
+            read_limit: int = 65536, 
+            ssl_context: ssl.SSLContext = None) -> None:
+        '''
+        Parameters
+        ----------
+        target (str):
+            URL requested through proxies (default - http://example.com/)
+        timeout (float):
+            Seconds a single probe may take (default - 10.0)
+        concurrency (int):
+            Maximum amount of simultaneous probes of `probe_many` (default - 1000)
+        window (int):
+            Amount of last probes kept in each health record (default - 20)
+        read_limit (int):
+            Maximum amount of response bytes read per probe (default - 64 KiB)
+        ssl_context (ssl.SSLContext):
+            Context used for `https://` targets, e.g. one trusting own CA (default - None, `ssl.create_default_context()`)
+        '''
+        url = urlsplit(target)
+        if url.scheme not in ("http", "https"):
+            raise ValueError("target must be http:// or https:// URL")
+        self.target: str = target
+        self.timeout: float = timeout
+        self.concurrency: int = concurrency
+        self.window: int = window
+        self.read_limit: int = read_limit
+        self.ssl_context: ssl.SSLContext = ssl_context or ssl.create_default_context()
+        self.records: Dict[int, HealthRecord] = {}
+
+        self._tls: bool = url.scheme == "https"
+        self._host: str = url.hostname
+        self._port: int = url.port or (443 if self._tls else 80)
+        self._path: str = (url.path or "/") + (f"?{url.query}" if url.query else "")
+        self._authority: str = url.netloc.rpartition("@")[2]
+
+    def record(self, proxy_id: int) -> HealthRecord:
+        '''Returns health record of proxy, creating empty one if needed'''
+        record = self.records.get(proxy_id)
+        if record is None:
+            record = self.records[proxy_id] = HealthRecord(self.window)
+        return record
+
+    async def probe(self, proxy: Proxy) -> ProbeResult:
+        '''
+        Probes one proxy and adds result to its health record
+
+        Parameters
+        ----------
+        proxy (Proxy):
+            Proxy to probe, any object with `id`, `host`, `port`, `user`, `pswd` and `type` (Required)
+        '''
+        timestamp = time.time()
+        timings = {}
+        try:
+            status, size = await asyncio.wait_for(self._request(proxy, timings), self.timeout)
+        except asyncio.CancelledError:
+            raise
+        except asyncio.TimeoutError:
+            result = ProbeResult(proxy_id=proxy.id, ok=False, error="Timeout", timestamp=timestamp, **timings)
+        except (OSError, ConnectionError, ValueError, asyncio.IncompleteReadError) as e:
+            result = ProbeResult(proxy_id=proxy.id, ok=False, error=f"{type(e).__name__}: {e}", timestamp=timestamp, **timings)
+        else:
+            transfer = timings["total_time"] - timings["ttfb"]
+            result = ProbeResult(
+                proxy_id=proxy.id, ok=status < 400, status=status, size=size, timestamp=timestamp, 
+                throughput=size / transfer if transfer > 0 else None, **timings)
+        self.record(proxy.id).add(result)
+        return result
+
+    async def probe_many(self, proxies: Iterable[Proxy]) -> AsyncIterator[ProbeResult]:
+        '''
+        Probes proxies concurrently, yielding results as soon as they complete
+
+        At most `concurrency` probes run at once, proxies are taken from `proxies` lazily. 
+        Closing the iterator cancels probes that are still running.
+
+        Parameters
+        ----------
+        proxies (Iterable[Proxy]):
+            Proxies to probe (Required)
+        '''
+        proxies = iter(proxies)
+        running = set()
+
+        def fill():
+            for proxy in itertools.islice(proxies, self.concurrency - len(running)):
+                running.add(asyncio.ensure_future(self.probe(proxy)))
+
+        try:
+            fill()
+            while running:
+                done, running = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                fill()
+                for task in done:
+                    yield task.result()
+        finally:
+            for task in running:
+                task.cancel()
+
+    async def _request(self, proxy: Proxy, timings: dict) -> tuple:
+        loop = asyncio.get_running_loop()
+        start = loop.time()
+        reader, writer = await asyncio.open_connection(proxy.host, int(proxy.port))
+        timings["connect_time"] = loop.time() - start
+        try:
+            if proxy.type == ProxyScheme.SOCKS5:
+                await self._socks5_connect(reader, writer, proxy)
+            elif self._tls:
+                await self._http_connect(reader, writer, proxy)
+            if self._tls:
+                await _start_tls(reader, writer, self.ssl_context, self._host)
+
+            if proxy.type == ProxyScheme.HTTPS and not self._tls:
+                credentials = base64.b64encode(f"{proxy.user}:{proxy.pswd}".encode()).decode()
+                head = f"GET {self.target} HTTP/1.1\r\nProxy-Authorization: Basic {credentials}\r\n"
+            else:
+                head = f"GET {self._path} HTTP/1.1\r\n"
+            writer.write(f"{head}Host: {self._authority}\r\nConnection: close\r\nAccept: */*\r\n\r\n".encode())
+            await writer.drain()
+
+            first = await reader.read(1)
+            if not first:
+                raise ConnectionError("Connection closed without response")
+            timings["ttfb"] = loop.time() - start
+            data = bytearray(first)
+            while len(data) < self.read_limit:
+                chunk = await reader.read(self.read_limit - len(data))
+                if not chunk:
+                    break
+                data += chunk
+            timings["total_time"] = loop.time() - start
+        finally:
+            writer.close()
+
+        line = bytes(data.split(b"\r\n", 1)[0]).split()
+        if len(line) < 2 or not line[0].startswith(b"HTTP/") or not line[1].isdigit():
+            raise ValueError("Invalid HTTP response")
+        return int(line[1]), len(data)
+
+    async def _http_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, proxy: Proxy) -> None:
+        credentials = base64.b64encode(f"{proxy.user}:{proxy.pswd}".encode()).decode()
+        writer.write((
+            f"CONNECT {self._host}:{self._port} HTTP/1.1\r\nHost: {self._host}:{self._port}\r\n"
+            f"Proxy-Authorization: Basic {credentials}\r\n\r\n").encode())
+        await writer.drain()
+        head = await reader.readuntil(b"\r\n\r\n")
+        status = head.split(b"\r\n", 1)[0].split()
+        if len(status) < 2 or status[1] != b"200":
+            raise ConnectionError(f"Proxy refused CONNECT: {head.splitlines()[0].decode(errors='replace')}")
+
+    async def _socks5_connect(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, proxy: Proxy) -> None:
+        user, pswd = proxy.user.encode(), proxy.pswd.encode()
+        writer.write(b"\x05\x01\x02" if user else b"\x05\x01\x00")
+        version, method = await reader.readexactly(2)
+        if version != 5 or method == 0xFF:
+            raise ConnectionError("SOCKS5 proxy refused authentication methods")
+        if method == 2:
+            writer.write(bytes((1, len(user))) + user + bytes((len(pswd),)) + pswd)
+            _, status = await reader.readexactly(2)
+            if status != 0:
+                raise ConnectionError("SOCKS5 authentication failed")
+        host = self._host.encode("idna")
+        writer.write(b"\x05\x01\x00\x03" + bytes((len(host),)) + host + struct.pack("!H", self._port))
+        version, reply, _, address_type = await reader.readexactly(4)
+        if reply != 0:
+            raise ConnectionError(f"SOCKS5 proxy refused CONNECT (reply {reply})")
+        if address_type == 1:
+            await reader.readexactly(4 + 2)
+        elif address_type == 4:
+            await reader.readexactly(16 + 2)
+        else:
+            length, = await reader.readexactly(1)
+            await reader.readexactly(length + 2)
@@ -0,0 +1,364 @@
+from typing import Callable, Dict, List, Tuple
+import bisect, collections
+
+EVENTS = ("on_request_start", "on_response", "on_decode_done", "on_error")
+DEFAULT_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class CallEvent():
+    '''
+    State of one API call passed to hooks
+
+    The same object is passed to every hook of a call and is filled as the call goes on,
+    copy fields you want to keep after the hook returns. API key is never included.
+
+    Attributes
+    ----------
+    method (str):
+        API method name (e.g. `getproxy`)
+    params (dict):
+        Request parameters
+    attempt (int):
+        Number of the current attempt, starting with 1
+    status (int):
+        HTTP status of the last response (None until a response is received)
+    bytes (int):
+        Size of the last response body
+    network_time (float):
+        Seconds spent waiting for transport, summed over attempts
+    decode_time (float):
+        Seconds spent parsing JSON and decoding the result
+    error (Exception):
+        Exception the call failed with (None if it did not)
+    '''
+    __slots__ = ("method", "params", "attempt", "status", "bytes", "network_time", "decode_time", "error")
+
+    def __init__(self, method: str, params: dict) -> None:
+        self.method: str = method
+        self.params: dict = dict(params)
+        self.attempt: int = 0
+        self.status: int = None
+        self.bytes: int = 0
+        self.network_time: float = 0.0
+        self.decode_time: float = 0.0
+        self.error: Exception = None
+
+    @property
+    def total_time(self) -> float:
+        '''Network and decode seconds together'''
+        return self.network_time + self.decode_time
+
+    def __repr__(self) -> str:
+        return (f"CallEvent(method={self.method!r}, attempt={self.attempt}, status={self.status}, bytes={self.bytes}, "
+            f"network_time={self.network_time:.6f}, decode_time={self.decode_time:.6f}, error={self.error!r})")
+
+
+class Hooks():
+    '''
+    Callbacks ProxySix calls during API calls
+
+    - `on_request_start` - before every attempt is sent
+    - `on_response` - after every HTTP response is received (`status`, `bytes` and `network_time` are set)
+    - `on_decode_done` - after the result is decoded successfully (`decode_time` is set)
+    - `on_error` - when the call fails with a transport or API error (`error` is set)
+
+    Callbacks are called synchronously with `CallEvent` and should be fast and must not raise.
+    Registering methods return the callback, so they can be used as decorators:
+
+    ```
+    hooks = Hooks()
+
+    @hooks.on_error
+    def log_error(event):
+        print(event.method, event.error)
+
+    client = ProxySix(api_key, hooks=hooks)
+    ```
+
+    `streamProxy` is not reported.
+    '''
+    def __init__(self) -> None:
+        self.callbacks: Dict[str, List[Callable[[CallEvent], None]]] = {event: [] for event in EVENTS}
+
+    def on_request_start(self, callback: Callable[[CallEvent], None]) -> Callable[[CallEvent], None]:
+        '''Registers callback called before every attempt'''
+        self.callbacks["on_request_start"].append(callback)
+        return callback
+
+    def on_response(self, callback: Callable[[CallEvent], None]) -> Callable[[CallEvent], None]:
+        '''Registers callback called after every HTTP response'''
+        self.callbacks["on_response"].append(callback)
+        return callback
+
+    def on_decode_done(self, callback: Callable[[CallEvent], None]) -> Callable[[CallEvent], None]:
+        '''Registers callback called after successfully decoded result'''
+        self.callbacks["on_decode_done"].append(callback)
+        return callback
+
+    def on_error(self, callback: Callable[[CallEvent], None]) -> Callable[[CallEvent], None]:
+        '''Registers callback called when call fails'''
+        self.callbacks["on_error"].append(callback)
+        return callback
+
+    def add(self, listener: object) -> object:
+        '''
+        Registers every method of `listener` named after an event (e.g. `MetricsCollector`)
+
+        Returns
+        -------
+        listener (object):
+            Given listener
+        '''
+        for event in EVENTS:
+            callback = getattr(listener, event, None)
+            if callback is not None:
+                self.callbacks[event].append(callback)
+        return listener
+
+    def remove(self, callback: Callable[[CallEvent], None] | object) -> None:
+        '''Unregisters callback or every method of listener'''
+        for event, callbacks in self.callbacks.items():
+            targets = (callback, getattr(callback, event, None))
+            callbacks[:] = [registered for registered in callbacks if registered not in targets]
+
+    def emit(self, event: str, call: CallEvent) -> None:
+        for callback in self.callbacks[event]:
+            callback(call)
+
+
+class Histogram():
+    '''
+    Cumulative histogram of durations with fixed bucket bounds (seconds)
+
+    Attributes
+    ----------
+    bounds (Tuple[float]):
+        Upper bounds of buckets
+    counts (List[int]):
+        Observations per bucket, the last one is above all bounds
+    count (int):
+        Amount of observations
+    sum (float):
+        Sum of observations
+    '''
+    def __init__(self, bounds: Tuple[float] = DEFAULT_BUCKETS) -> None:
+        self.bounds: Tuple[float] = tuple(bounds)
+        self.counts: List[int] = [0] * (len(self.bounds) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect.bisect_left(self.bounds, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> float:
+        '''
+        Estimates quantile by linear interpolation inside its bucket
+
+        Parameters
+        ----------
+        q (float):
+            Quantile in range 0..1 (e.g. 0.99)
+
+        Returns
+        -------
+        value (float):
+            Estimated value (None without observations, last bound if it falls above all bounds)
+        '''
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for i, count in enumerate(self.counts):
+            if count and seen + count >= rank:
+                if i == len(self.bounds):
+                    return self.bounds[-1]
+                lower = self.bounds[i - 1] if i else 0.0
+                return lower + (self.bounds[i] - lower) * (rank - seen) / count
+            seen += count
+        return self.bounds[-1]
+
+    def cumulative(self) -> List[Tuple[float, int]]:
+        '''Returns `(upper bound, observations up to it)` pairs, the last bound is `inf`'''
+        pairs, total = [], 0
+        for bound, count in zip(self.bounds + (float("inf"),), self.counts):
+            total += count
+            pairs.append((bound, total))
+        return pairs
+
+
+def _escape(value: str) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    return repr(float(value)) if isinstance(value, float) else str(value)
+
+
+class MetricsCollector():
+    '''
+    In-memory metrics of API calls, fed by hooks
+
+    ```
+    metrics = MetricsCollector()
+    client = ProxySix(api_key, hooks=Hooks())
+    client.hooks.add(metrics)
+    ...
+    metrics.histograms["getproxy"]["network"].quantile(0.99)
+    print(metrics.prometheus())
+    ```
+
+    Attributes
+    ----------
+    histograms (Dict[str, Dict[str, Histogram]]):
+        Histograms of `network`, `decode` and `total` seconds by API method
+    responses (Counter):
+        Responses by `(method, status)`
+    errors (Counter):
+        Failed calls by `(method, exception class name)`
+    bytes (Counter):
+        Received bytes by method
+    '''
+    KINDS = ("network", "decode", "total")
+
+    def __init__(self, buckets: Tuple[float] = DEFAULT_BUCKETS, namespace: str = "proxy6") -> None:
+        '''
+        Parameters
+        ----------
+        buckets (Tuple[float]):
+            Upper bounds of histogram buckets in seconds (default - 1 ms to 10 s)
+        namespace (str):
+            Prefix of Prometheus metric names (default - proxy6)
+        '''
+        self.buckets: Tuple[float] = tuple(buckets)
+        self.namespace: str = namespace
+        self.histograms: Dict[str, Dict[str, Histogram]] = {}
+        self.responses: collections.Counter = collections.Counter()
+        self.errors: collections.Counter = collections.Counter()
+        self.bytes: collections.Counter = collections.Counter()
+
+    def _histograms(self, method: str) -> Dict[str, Histogram]:
+        histograms = self.histograms.get(method)
+        if histograms is None:
+            histograms = self.histograms[method] = {kind: Histogram(self.buckets) for kind in self.KINDS}
+        return histograms
+
+    def on_response(self, event: CallEvent) -> None:
+        self.responses[(event.method, event.status)] += 1
+        self.bytes[event.method] += event.bytes
+
+    def on_decode_done(self, event: CallEvent) -> None:
+        histograms = self._histograms(event.method)
+        histograms["network"].observe(event.network_time)
+        histograms["decode"].observe(event.decode_time)
+        histograms["total"].observe(event.total_time)
+
+    def on_error(self, event: CallEvent) -> None:
+        self.errors[(event.method, type(event.error).__name__)] += 1
+        self._histograms(event.method)["total"].observe(event.total_time)
+
+    def quantile(self, method: str, q: float, kind: str = "total") -> float:
+        '''Estimated `q` quantile of `kind` seconds of `method` calls (None without observations)'''
+        histograms = self.histograms.get(method)
+        return histograms[kind].quantile(q) if histograms is not None else None
+
+    def snapshot(self) -> dict:
+        '''Returns plain dict with counts, p50 and p99 of every histogram, responses, errors and bytes'''
+        return {
+            "latency": {
+                method: {
+                    kind: {"count": h.count, "sum": h.sum, "p50": h.quantile(0.5), "p99": h.quantile(0.99)}
+                    for kind, h in histograms.items()
+                } for method, histograms in self.histograms.items()
+            },
+            "responses": {f"{method} {status}": count for (method, status), count in self.responses.items()},
+            "errors": {f"{method} {error}": count for (method, error), count in self.errors.items()},
+            "bytes": dict(self.bytes)
+        }
+
+    def prometheus(self) -> str:
+        '''Returns metrics in Prometheus text exposition format'''
+        ns = self.namespace
+        lines = [
+            f"# HELP {ns}_call_duration_seconds Duration of API calls by phase",
+            f"# TYPE {ns}_call_duration_seconds histogram"
+        ]
+        for method, histograms in sorted(self.histograms.items()):
+            for kind, histogram in histograms.items():
+                labels = f'method="{_escape(method)}",phase="{kind}"'
+                for bound, count in histogram.cumulative():
+                    lines.append(f'{ns}_call_duration_seconds_bucket{{{labels},le="{_format(bound)}"}} {count}')
+                lines.append(f"{ns}_call_duration_seconds_sum{{{labels}}} {_format(histogram.sum)}")
+                lines.append(f"{ns}_call_duration_seconds_count{{{labels}}} {histogram.count}")
+        lines += [f"# HELP {ns}_responses_total HTTP responses by status", f"# TYPE {ns}_responses_total counter"]
+        for (method, status), count in sorted(self.responses.items(), key=str):
+            lines.append(f'{ns}_responses_total{{method="{_escape(method)}",status="{status}"}} {count}')
+        lines += [f"# HELP {ns}_errors_total Failed API calls by exception", f"# TYPE {ns}_errors_total counter"]
+        for (method, error), count in sorted(self.errors.items()):
+            lines.append(f'{ns}_errors_total{{method="{_escape(method)}",error="{_escape(error)}"}} {count}')
+        lines += [f"# HELP {ns}_response_bytes_total Received response bytes", f"# TYPE {ns}_response_bytes_total counter"]
+        for method, count in sorted(self.bytes.items()):
+            lines.append(f'{ns}_response_bytes_total{{method="{_escape(method)}"}} {count}')
+        return "\n".join(lines) + "\n"
+
+
+class MetricsServer():
+    '''
+    HTTP endpoint serving `MetricsCollector.prometheus()` for Prometheus to scrape
+
+    ```
+    async with MetricsServer(metrics, port=9106) as server:
+        ...  # GET http://127.0.0.1:9106/metrics
+    ```
+    '''
+    def __init__(self, collector: MetricsCollector, host: str = "127.0.0.1", port: int = 9106, path: str = "/metrics") -> None:
+        '''
+        Parameters
+        ----------
+        collector (MetricsCollector):
+            Metrics to serve
+        host (str):
+            Interface to listen on (default - 127.0.0.1)
+        port (int):
+            Port to listen on, 0 - any free port (default - 9106)
+        path (str):
+            URL path of metrics (default - /metrics)
+        '''
+        self.collector: MetricsCollector = collector
+        self.host: str = host
+        self.port: int = port
+        self.path: str = path
+        self.url: str = None
+        self._runner = None
+
+    async def start(self) -> str:
+        '''Starts server, returns metrics URL'''
+        from aiohttp import web
+
+        async def handle(request: web.Request) -> web.Response:
+            return web.Response(body=self.collector.prometheus().encode(),
+                headers={"Content-Type": "text/plain; version=0.0.4; charset=utf-8"})
+
+        app = web.Application()
+        app.router.add_get(self.path, handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        await web.TCPSite(self._runner, self.host, self.port).start()
+        self.url = f"http://{self.host}:{self._runner.addresses[0][1]}{self.path}"
+        return self.url
+
+    async def close(self) -> None:
+        '''Stops server'''
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "MetricsServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
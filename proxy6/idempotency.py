@@ -0,0 +1,341 @@
+'''
+Idempotency keys for mutating calls
+
+`MutationJournal` is an append-only JSON lines file. Every `buyProxy`, `prolongProxy` and `deleteProxy` call
+made with an idempotency key is written to it as `pending` before the request is sent and as `done` or `failed`
+once the answer is known. A call that failed without answer (timeout, connection error) stays `pending`,
+and the next call with the same key first asks `getProxy` whether the mutation was applied:
+
+- `buy` requests are sent with the key tag in description, bought proxies are found by it;
+- `prolong` records `unixtime_end` of proxies passed as `Proxy` objects or found in `inventory` of the journal,
+  prolonged proxies have it increased. Without any of them account `date_mod` of the last answer is recorded:
+  if it has not changed, the call was not applied;
+- `delete` checks which proxies are still there.
+
+Only the part that was not applied is sent again, so retries never buy or prolong twice.
+'''
+from .types import *
+from .types import ProxyRecord
+from .exceptions import BadRequest, UnknownError
+from typing import Dict, Iterable, Optional, TYPE_CHECKING
+import asyncio, contextlib, datetime, hashlib, json, math, os, time
+
+if TYPE_CHECKING:
+    from .client import ProxySix
+    from .inventory import ProxyInventory
+
+PENDING, DONE, FAILED = "pending", "done", "failed"
+_DESCRIPTION_LIMIT = 50
+_RESULT_TYPES = {cls.__name__: cls for cls in (NewProxyList, NewProxyListNokey, ProlongList, ProlongListNokey)}
+
+
+def key_tag(key: str) -> str:
+    '''Short tag identifying idempotency key in proxy description'''
+    return "idem:" + hashlib.sha256(key.encode()).hexdigest()[:12]
+
+
+def _tagged(description: Optional[str], tag: str) -> str:
+    if not description:
+        return tag
+    return f"{description[:_DESCRIPTION_LIMIT - len(tag) - 1]} {tag}"
+
+
+class MutationJournal():
+    '''
+    Local journal of mutating calls made with idempotency keys
+
+    Entries are kept in memory by key and every change is appended to the file, so the journal
+    survives restarts: the file is replayed on creation. Calls with the same key are serialized.
+
+    Attributes
+    ----------
+    path (str):
+        Journal file
+    sync (bool):
+        Whether every record is flushed to disk (`os.fsync`) before request is sent
+    inventory (ProxyInventory):
+        Source of `unixtime_end` of proxies prolonged by ID
+    entries (Dict[str, dict]):
+        The latest state of every key: `method`, `request` (parameters given by caller), `params` (parameters sent),
+        `state` (`pending`, `done` or `failed`), reconciliation data and result or error
+    '''
+    def __init__(self, path: str, sync: bool = True, inventory: "ProxyInventory" = None) -> None:
+        '''
+        Parameters
+        ----------
+        path (str):
+            Journal file, created if missing (Required)
+        sync (bool):
+            True - flush every record to disk, False - leave it to OS (default - True)
+        inventory (ProxyInventory):
+            Synced inventory of the account, keyed prolongs take `unixtime_end` of proxies from it 
+            instead of asking API (default - None)
+        '''
+        self.path: str = path
+        self.sync: bool = sync
+        self.inventory: "ProxyInventory" = inventory
+        self.entries: Dict[str, dict] = {}
+        self._locks: Dict[str, list] = {}
+        if os.path.exists(path):
+            with open(path, encoding="utf-8") as file:
+                for line in file:
+                    try:
+                        record = json.loads(line)
+                    except ValueError:
+                        continue  # line torn by crash while it was written
+                    self.entries[record["key"]] = {**self.entries.get(record["key"], {}), **record}
+
+    def __contains__(self, key: str) -> bool:
+        return key in self.entries
+
+    def __len__(self) -> int:
+        return len(self.entries)
+
+    def get(self, key: str) -> Optional[dict]:
+        '''Returns the latest state of key (None if it was never used)'''
+        return self.entries.get(key)
+
+    def record(self, key: str, **fields) -> dict:
+        '''
+        Updates entry of key and appends the change to the file
+
+        Parameters
+        ----------
+        key (str):
+            Idempotency key (Required)
+        **fields:
+            Fields of entry to set
+
+        Returns
+        -------
+        entry (dict):
+            Updated entry
+        '''
+        change = {"key": key, **fields, "time": time.time()}
+        with open(self.path, "a", encoding="utf-8") as file:
+            file.write(json.dumps(change) + "\n")
+            if self.sync:
+                file.flush()
+                os.fsync(file.fileno())
+        entry = self.entries[key] = {**self.entries.get(key, {}), **change}
+        return entry
+
+    def pending(self) -> List[str]:
+        '''Returns keys of calls whose outcome is unknown'''
+        return [key for key, entry in self.entries.items() if entry.get("state") == PENDING]
+
+    def compact(self, max_age: float = None) -> int:
+        '''
+        Rewrites the file with one line per key, replacing it atomically
+
+        Parameters
+        ----------
+        max_age (float):
+            Seconds after which finished (`done` or `failed`) entries are dropped (default - None, keep all)
+
+        Returns
+        -------
+        dropped (int):
+            Amount of dropped entries
+        '''
+        now = time.time()
+        dropped = [key for key, entry in self.entries.items()
+            if max_age is not None and entry.get("state") != PENDING and now - entry["time"] > max_age]
+        for key in dropped:
+            del self.entries[key]
+        temporary = f"{self.path}.{os.getpid()}.tmp"
+        with open(temporary, "w", encoding="utf-8") as file:
+            for entry in self.entries.values():
+                file.write(json.dumps(entry) + "\n")
+            file.flush()
+            os.fsync(file.fileno())
+        os.replace(temporary, self.path)
+        return len(dropped)
+
+    @contextlib.asynccontextmanager
+    async def lock(self, key: str):
+        '''Async context manager holding key, so calls with the same key run one after another'''
+        holder = self._locks.setdefault(key, [asyncio.Lock(), 0])
+        holder[1] += 1
+        try:
+            async with holder[0]:
+                yield
+        finally:
+            holder[1] -= 1
+            if not holder[1]:
+                del self._locks[key]
+
+
+def _encode(result) -> dict:
+    if isinstance(result, int):
+        return {"result_type": "int", "result": result}
+    return {"result_type": type(result).__name__, "result": json.loads(result.json(by_alias=True))}
+
+
+def _decode(entry: dict):
+    if entry["result_type"] == "int":
+        return entry["result"]
+    return _RESULT_TYPES[entry["result_type"]].parse_obj(entry["result"])
+
+
+def _ids(params: dict) -> List[int]:
+    return [int(id) for id in params["ids"].split(",")] if params.get("ids") else []
+
+
+async def _ends(client: "ProxySix", ids: Iterable[int]) -> Dict[int, int]:
+    '''`unixtime_end` of those of proxies that exist, pages are requested until all are found'''
+    wanted, ends = set(ids), {}
+    async with contextlib.aclosing(client.iterProxies()) as proxies:
+        async for proxy in proxies:
+            if proxy.id in wanted:
+                ends[proxy.id] = proxy.unixtime_end
+                if len(ends) == len(wanted):
+                    break
+    return ends
+
+
+async def _described(client: "ProxySix", description: str) -> List[Proxy]:
+    async with contextlib.aclosing(client.iterProxies(description=description)) as proxies:
+        return [proxy.to_model() if isinstance(proxy, ProxyRecord) else proxy async for proxy in proxies]
+
+
+async def _prepare(client: "ProxySix", journal: MutationJournal, method: str, params: dict, key: str,
+        ends: Dict[int, int] = None) -> dict:
+    '''Parameters to send and data needed to reconcile them later'''
+    if method == "buy":
+        return {"params": {**params, "descr": _tagged(params.get("descr"), key_tag(key))}}
+    if method == "prolong":
+        ends = dict(ends or {})
+        if journal.inventory is not None:
+            ends.update((id, journal.inventory.get(id).unixtime_end)
+                for id in _ids(params) if id not in ends and id in journal.inventory)
+        if ends:
+            return {"params": params, "ends": {str(id): end for id, end in ends.items()}}
+        # nothing to compare with, API is asked only if the call ends up without answer
+        date_mod = client.date_mod.isoformat() if client.date_mod is not None else None
+        return {"params": params, "date_mod": date_mod}
+    if "ids" in params:
+        return {"params": params}
+    return {"params": params, "described": len(await _described(client, params["descr"]))}
+
+
+async def _reconcile(client: "ProxySix", entry: dict):
+    '''
+    Finds out what part of pending call was applied
+
+    Returns `(result, params)`: result of the applied part (None if nothing was applied)
+    and parameters of the part still to be sent (None if everything was applied)
+    '''
+    method, params = entry["method"], entry["params"]
+    nokey = "nokey" in params
+    if method == "buy":
+        found = await _described(client, params["descr"])
+        if not found:
+            return None, params
+        bought = [NewProxy.parse_obj(proxy.dict(by_alias=True)) for proxy in found]
+        cls = NewProxyListNokey if nokey else NewProxyList
+        return cls(count=len(bought), price=math.nan, period=int(params["period"]), country=params["country"],
+            list=bought if nokey else {proxy.id: proxy for proxy in bought}), None
+    if method == "prolong":
+        if "ends" not in entry:
+            await client.getProxy(limit=1)  # refreshes date_mod
+            if entry["date_mod"] is None or client.date_mod != datetime.datetime.fromisoformat(entry["date_mod"]):
+                raise ValueError(f"Can not find out whether prolong with idempotency key {entry['key']!r} was applied: "
+                    "account changed since and unixtime_end of proxies was not known")
+            return None, params
+        before = {int(id): end for id, end in entry["ends"].items()}
+        now = await _ends(client, _ids(params))
+        if not any(end > before[id] for id, end in now.items() if id in before):
+            return None, params
+        prolonged = [Prolong(id=id, date_end=datetime.datetime.fromtimestamp(end), unixtime_end=end)
+            for id, end in now.items()]
+        # API prolongs all given proxies in one transaction, so a changed one means the call was applied
+        cls = ProlongListNokey if nokey else ProlongList
+        return cls(price=math.nan, period=int(params["period"]), count=len(prolonged),
+            list=prolonged if nokey else {prolong.id: prolong for prolong in prolonged}), None
+    if "ids" in params:
+        ids = _ids(params)
+        left = await _ends(client, ids)
+        deleted = len(ids) - len(left)
+        if not left:
+            return deleted, None
+        return (deleted or None), {**params, "ids": ",".join(str(id) for id in ids if id in left)}
+    left = len(await _described(client, params["descr"]))
+    deleted = entry["described"] - left
+    if not left:
+        return deleted, None
+    return (deleted or None), params
+
+
+async def _restore_description(client: "ProxySix", entry: dict) -> None:
+    try:
+        await client.setDescription(entry["request"].get("descr", ""), old=entry["params"]["descr"])
+    except (BadRequest, *client.transport.transient_errors):
+        pass  # proxies keep the tag, which is harmless
+
+
+async def run_idempotent(client: "ProxySix", journal: MutationJournal, key: str, method: str, params: dict,
+        ends: Dict[int, int] = None):
+    '''
+    Sends mutating call at most once per idempotency key
+
+    Key already `done` returns the journaled result without request, `failed` key (API refused the call
+    with an error ID) is sent again, `pending` key (no answer, 5xx or unreadable answer) is reconciled first.
+    Results found by reconciliation have `price` of NaN, as API does not report it. Proxies bought with a key
+    get their own description back once purchase is confirmed.
+
+    Parameters
+    ----------
+    client (ProxySix):
+        Client sending the call (Required)
+    journal (MutationJournal):
+        Journal of keys (Required)
+    key (str):
+        Idempotency key (Required)
+    method (str):
+        `buy`, `prolong` or `delete` (Required)
+    params (dict):
+        Parameters of the call (Required)
+    ends (Dict[int, int]):
+        Known `unixtime_end` of prolonged proxies by ID (default - None)
+
+    Raises
+    ------
+    ValueError:
+        Key was used for another call, or pending prolong can not be reconciled
+    '''
+    async with journal.lock(key):
+        entry = journal.get(key)
+        if entry is not None and (entry["method"], entry["request"]) != (method, params):
+            raise ValueError(f"Idempotency key {key!r} was used for another {entry['method']!r} call")
+
+        applied, send = None, None
+        if entry is not None and entry["state"] == DONE:
+            return _decode(entry)
+        if entry is not None and entry["state"] == PENDING:
+            applied, send = await _reconcile(client, entry)
+            if send is None:
+                entry = journal.record(key, state=DONE, **_encode(applied))
+                if method == "buy":
+                    await _restore_description(client, entry)
+                return applied
+        else:
+            entry = journal.record(key, method=method, request=params, state=PENDING,
+                **await _prepare(client, journal, method, params, key, ends))
+            send = entry["params"]
+
+        try:
+            result = await client._call(method, send)
+        except BadRequest as e:
+            if isinstance(e, UnknownError):
+                raise  # server error or unreadable answer, the call may have been applied
+            # API refused the call, so it was not applied and may be sent again
+            journal.record(key, state=FAILED, error=f"{e.__class__.__name__}: {e}")
+            raise
+
+        if isinstance(applied, int):
+            result += applied
+        entry = journal.record(key, state=DONE, **_encode(result))
+        if method == "buy":
+            await _restore_description(client, entry)
+        return result
@@ -0,0 +1,316 @@
+from .types import *
+from .snapshot import account_hash, decode_row, load_snapshot, save_snapshot
+from typing import Dict, Iterable, Iterator, List, Set, TYPE_CHECKING
+import asyncio, bisect, datetime, time
+
+if TYPE_CHECKING:
+    from .client import ProxySix
+
+class ProxyInventory():
+    '''
+    Local mirror of all proxies of account, indexed for queries without network
+
+    Proxies are indexed by id, country, type, description, active flag and expiration time. 
+    `sync()` asks API for account modification date (`date_mod`) first and downloads proxies 
+    only if it has changed since previous sync, then applies the difference to indexes. 
+    Expiration does not change `date_mod`, so proxies whose `unixtime_end` has passed are marked 
+    inactive locally on every `sync()` and query by `active`.
+
+    To start without downloading every page, `save()` inventory to a snapshot file and `load()` it 
+    on the next start, then `reconcile()` it with the account in background:
+
+    ```
+    inventory = ProxyInventory(client)
+    inventory.load("proxies.db")  # False if snapshot is missing or outdated
+    task = inventory.reconcile("proxies.db")  # sync() in background, snapshot is rewritten if proxies changed
+    ```
+
+    Attributes
+    ----------
+    client (ProxySix):
+        Client used to download proxies
+    proxies (Dict[int, Proxy]):
+        Proxies by ID
+    date_mod (datetime.datetime):
+        Account modification date proxies were synchronized at
+    synced_at (float):
+        Unixtime of the last sync
+    '''
+    def __init__(self, client: "ProxySix", page_size: int = 1000, prefetch: int = 1) -> None:
+        '''
+        Parameters
+        ----------
+        client (ProxySix):
+            Client used to download proxies (Required)
+        page_size (int):
+            Amount of proxies requested per page (default - 1000; max. value)
+        prefetch (int):
+            Amount of pages requested ahead while downloading (default - 1)
+        '''
+        self.client = client
+        self.page_size: int = page_size
+        self.prefetch: int = prefetch
+        self.proxies: Dict[int, Proxy] = {}
+        self.date_mod: datetime.datetime = None
+        self.synced_at: float = None
+        self._reconcile: asyncio.Task = None
+
+        self._by_country: Dict[ProxyCountry, Set[int]] = {}
+        self._by_type: Dict[ProxyScheme, Set[int]] = {}
+        self._by_descr: Dict[str, Set[int]] = {}
+        self._by_active: Dict[bool, Set[int]] = {True: set(), False: set()}
+        self._by_end: List[tuple] = []
+        self._expired_at: float = 0.0
+
+    def __len__(self) -> int:
+        return len(self.proxies)
+
+    def __iter__(self) -> Iterator[Proxy]:
+        return iter(self.proxies.values())
+
+    def __contains__(self, id: int) -> bool:
+        return id in self.proxies
+
+    def get(self, id: int) -> Proxy:
+        '''Returns proxy by ID or None'''
+        return self.proxies.get(id)
+
+    async def sync(self, force: bool = False) -> bool:
+        '''
+        Brings inventory up to date with the account
+
+        Parameters
+        ----------
+        force (bool):
+            Download proxies even if account modification date has not changed (default - False)
+
+        Returns
+        -------
+        changed (bool):
+            True - proxies were downloaded and applied. False - inventory was already up to date
+        '''
+        if not force and self.date_mod is not None:
+            await self.client.getProxy(nokey=True, limit=1)
+            if self.client.date_mod is not None and self.client.date_mod == self.date_mod:
+                self.synced_at = time.time()
+                self._expire(self.synced_at)
+                return False
+
+        fetched = {}
+        async for proxy in self.client.iterProxies(page_size=self.page_size, prefetch=self.prefetch):
+            fetched[proxy.id] = proxy
+        self.update(fetched.values(), replace=True)
+        self.date_mod = self.client.date_mod
+        self.synced_at = time.time()
+        self._expire(self.synced_at)
+        return True
+
+    def save(self, path: str) -> None:
+        '''
+        Writes proxies and account modification date to snapshot file (SQLite), replacing it atomically
+
+        Parameters
+        ----------
+        path (str):
+            Snapshot file (Required)
+        '''
+        save_snapshot(path, self.proxies.values(), self.date_mod, account_hash(self.client.api_key))
+
+    def load(self, path: str) -> bool:
+        '''
+        Replaces proxies with ones of snapshot file written by `save()`
+
+        Snapshot is ignored if it is missing, damaged, of another format version or of another API key. 
+        Loaded proxies are not validated (`ProxyRecord` objects for trusted client). 
+        `synced_at` is set to the time snapshot was saved at.
+
+        Parameters
+        ----------
+        path (str):
+            Snapshot file (Required)
+
+        Returns
+        -------
+        loaded (bool):
+            True - snapshot was loaded. False - it was ignored
+        '''
+        snapshot = load_snapshot(path, account_hash(self.client.api_key))
+        if snapshot is None:
+            return False
+        rows, date_mod, saved_at = snapshot
+        decode = ProxyRecord if getattr(self.client, "trusted", False) else decode_row
+        self.update(map(decode, rows), replace=True)
+        self.date_mod = date_mod
+        self.synced_at = saved_at
+        return True
+
+    def reconcile(self, path: str = None) -> asyncio.Task:
+        '''
+        Runs `sync()` in background, then saves snapshot to `path` if proxies have changed
+
+        Calling it while previous reconciliation runs returns the running task.
+
+        Parameters
+        ----------
+        path (str):
+            Snapshot file to update (default - None, no saving)
+
+        Returns
+        -------
+        task (asyncio.Task):
+            Task resulting in `sync()` result
+        '''
+        if self._reconcile is None or self._reconcile.done():
+            self._reconcile = asyncio.ensure_future(self._reconcile_snapshot(path))
+        return self._reconcile
+
+    async def _reconcile_snapshot(self, path: str) -> bool:
+        changed = await self.sync()
+        if changed and path is not None:
+            proxies, date_mod = list(self.proxies.values()), self.date_mod
+            await asyncio.get_running_loop().run_in_executor(
+                None, save_snapshot, path, proxies, date_mod, account_hash(self.client.api_key))
+        return changed
+
+    def update(self, proxies: Iterable[Proxy], replace: bool = False) -> None:
+        '''
+        Adds or updates proxies in inventory
+
+        Parameters
+        ----------
+        proxies (Iterable[Proxy]):
+            Proxies to store (Required)
+        replace (bool):
+            Remove proxies absent in `proxies` (default - False)
+        '''
+        seen = set()
+        bulk = not self.proxies
+        for proxy in proxies:
+            seen.add(proxy.id)
+            old = self.proxies.get(proxy.id)
+            if old is not None:
+                if old == proxy:
+                    continue
+                self._unindex(old)
+            self.proxies[proxy.id] = proxy
+            self._index(proxy, sort=not bulk)
+        if bulk:
+            self._by_end.sort()
+        if replace:
+            for id in [id for id in self.proxies if id not in seen]:
+                self.remove(id)
+
+    def remove(self, id: int) -> Proxy:
+        '''Removes proxy from inventory, returns removed proxy or None'''
+        proxy = self.proxies.pop(id, None)
+        if proxy is not None:
+            self._unindex(proxy)
+        return proxy
+
+    def _expire(self, now: float) -> None:
+        '''Marks proxies expired since the previous call inactive'''
+        if now <= self._expired_at:
+            return
+        active, inactive = self._by_active[True], self._by_active[False]
+        low = bisect.bisect_right(self._by_end, (self._expired_at, float("inf")))
+        high = bisect.bisect_right(self._by_end, (now, float("inf")))
+        for _, id in self._by_end[low:high]:
+            if id in active:
+                active.discard(id)
+                inactive.add(id)
+                self.proxies[id].active = False
+        self._expired_at = now
+
+    def _index(self, proxy: Proxy, sort: bool = True) -> None:
+        if proxy.active and proxy.unixtime_end <= self._expired_at:
+            proxy.active = False
+        self._by_country.setdefault(proxy.country, set()).add(proxy.id)
+        self._by_type.setdefault(proxy.type, set()).add(proxy.id)
+        self._by_descr.setdefault(proxy.descr, set()).add(proxy.id)
+        self._by_active[bool(proxy.active)].add(proxy.id)
+        if sort:
+            bisect.insort(self._by_end, (proxy.unixtime_end, proxy.id))
+        else:
+            self._by_end.append((proxy.unixtime_end, proxy.id))
+
+    def _unindex(self, proxy: Proxy) -> None:
+        for index, key in ((self._by_country, proxy.country), (self._by_type, proxy.type), (self._by_descr, proxy.descr)):
+            ids = index[key]
+            ids.discard(proxy.id)
+            if not ids:
+                del index[key]
+        self._by_active[bool(proxy.active)].discard(proxy.id)
+        i = bisect.bisect_left(self._by_end, (proxy.unixtime_end, proxy.id))
+        del self._by_end[i]
+
+    def filter(self, 
+            country: ProxyCountry = None, 
+            type: ProxyScheme = None, 
+            description: str = None, 
+            active: bool = None, 
+            expires_after: float = None, 
+            expires_before: float = None) -> List[Proxy]:
+        '''
+        Returns proxies matching all given conditions, ordered by expiration time
+
+        Parameters
+        ----------
+        country (ProxyCountry):
+            Proxy country
+        type (ProxyScheme):
+            Proxy scheme
+        description (str):
+            Exact technical description
+        active (bool):
+            True - only active proxies, False - only inactive proxies (proxies expired by now are inactive)
+        expires_after (float):
+            Only proxies expiring at or after this unixtime
+        expires_before (float):
+            Only proxies expiring before this unixtime
+
+        Returns
+        -------
+        proxies (List[Proxy]):
+            Matching proxies
+        '''
+        sets = []
+        if country is not None:
+            sets.append(self._by_country.get(country, set()))
+        if type is not None:
+            sets.append(self._by_type.get(type, set()))
+        if description is not None:
+            sets.append(self._by_descr.get(description, set()))
+        if active is not None:
+            self._expire(time.time())
+            sets.append(self._by_active[bool(active)])
+        sets.sort(key=len)
+
+        low = 0 if expires_after is None else bisect.bisect_left(self._by_end, (expires_after,))
+        high = len(self._by_end) if expires_before is None else bisect.bisect_left(self._by_end, (expires_before,))
+        ranged = expires_after is not None or expires_before is not None
+        if not sets or (ranged and high - low <= len(sets[0])):
+            candidates = [id for _, id in self._by_end[low:high]]
+            return [self.proxies[id] for id in candidates if all(id in ids for ids in sets)]
+
+        proxies = [self.proxies[id] for id in sets[0] if all(id in ids for ids in sets[1:])]
+        if ranged:
+            proxies = [proxy for proxy in proxies 
+                if (expires_after is None or proxy.unixtime_end >= expires_after) 
+                and (expires_before is None or proxy.unixtime_end < expires_before)]
+        proxies.sort(key=lambda proxy: (proxy.unixtime_end, proxy.id))
+        return proxies
+
+    def expiring(self, within: float, now: float = None) -> List[Proxy]:
+        '''
+        Returns active proxies expiring in the next `within` seconds
+
+        Parameters
+        ----------
+        within (float):
+            Time window in seconds (Required)
+        now (float):
+            Current unixtime (default - time.time())
+        '''
+        now = time.time() if now is None else now
+        return self.filter(active=True, expires_after=now, expires_before=now + within)
+
@@ -0,0 +1,176 @@
+from typing import Any, List
+import codecs, json
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+BACKEND = "orjson" if orjson is not None else "json"
+
+def loads(data: bytes | str) -> Any:
+    '''Decodes JSON document with orjson when it is installed, with standard json module otherwise'''
+    if orjson is not None:
+        return orjson.loads(data)
+    return json.loads(data)
+
+
+_WHITESPACE = " \t\n\r"
+_DELIMITERS = _WHITESPACE + ",:]}"
+_decoder = json.JSONDecoder()
+
+class ListStreamParser():
+    '''
+    Incremental parser of API response, decoding entries of its `list` member as soon as they arrive
+
+    Response body is fed in arbitrary chunks. Entries of `list` are returned by `feed()` one by one: 
+    values for list format, `(key, value)` pairs for dictionary format. 
+    All other top-level members are collected in `header`.
+
+    Attributes
+    ----------
+    header (dict):
+        Top-level members except `list`
+    keyed (bool):
+        True - `list` is a dictionary, False - `list` is an array, None - `list` was not met yet
+    '''
+    _START, _KEY, _COLON, _VALUE, _ENTRY, _ENTRY_COLON, _ENTRY_VALUE, _DONE = range(8)
+
+    def __init__(self, key: str = "list") -> None:
+        self.key: str = key
+        self.header: dict = {}
+        self.keyed: bool = None
+        self._text = codecs.getincrementaldecoder("utf-8")()
+        self._buffer: str = ""
+        self._pos: int = 0
+        self._state: int = self._START
+        self._member: str = None
+        self._entry_key: str = None
+
+    @property
+    def done(self) -> bool:
+        '''Whether the whole document has been parsed'''
+        return self._state == self._DONE
+
+    def feed(self, chunk: bytes) -> List[Any]:
+        '''
+        Adds next chunk of body
+
+        Returns
+        -------
+        entries (List[Any]):
+            Entries of `list` completed by this chunk
+        '''
+        self._buffer = self._buffer[self._pos:] + self._text.decode(chunk)
+        self._pos = 0
+        return self._parse(final=False)
+
+    def close(self) -> List[Any]:
+        '''
+        Signals end of body, raises `ValueError` if document is incomplete
+
+        Returns
+        -------
+        entries (List[Any]):
+            Entries of `list` completed by the end of body
+        '''
+        self._buffer = self._buffer[self._pos:] + self._text.decode(b"", final=True)
+        self._pos = 0
+        entries = self._parse(final=True)
+        if self._state != self._DONE:
+            raise ValueError("Incomplete JSON document")
+        return entries
+
+    def _skip(self) -> str:
+        buffer, pos = self._buffer, self._pos
+        while pos < len(buffer) and buffer[pos] in _WHITESPACE:
+            pos += 1
+        self._pos = pos
+        return buffer[pos] if pos < len(buffer) else None
+
+    def _value(self, final: bool):
+        '''Decodes next value, returns `(True, value)` or `(False, None)` when more data is needed'''
+        try:
+            value, end = _decoder.raw_decode(self._buffer, self._pos)
+        except json.JSONDecodeError:
+            if final:
+                raise
+            return False, None
+        # a value is always followed by a delimiter, so a number without one may be cut
+        if not final and (end == len(self._buffer) or self._buffer[end] not in _DELIMITERS):
+            return False, None
+        self._pos = end
+        return True, value
+
+    def _expect(self, char: str) -> None:
+        raise ValueError(f"Unexpected {char!r} at position {self._pos} of JSON document")
+
+    def _parse(self, final: bool) -> List[Any]:
+        entries = []
+        while True:
+            char = self._skip()
+            if char is None or self._state == self._DONE:
+                if char is not None:
+                    self._expect(char)
+                return entries
+
+            if self._state == self._START:
+                if char != "{":
+                    self._expect(char)
+                self._pos += 1
+                self._state = self._KEY
+            elif self._state == self._KEY:
+                if char == ",":
+                    self._pos += 1
+                    continue
+                if char == "}":
+                    self._pos += 1
+                    self._state = self._DONE
+                    continue
+                complete, self._member = self._value(final)
+                if not complete:
+                    return entries
+                self._state = self._COLON
+            elif self._state == self._COLON:
+                if char != ":":
+                    self._expect(char)
+                self._pos += 1
+                self._state = self._VALUE
+            elif self._state == self._VALUE:
+                if self._member == self.key and char in "[{":
+                    self.keyed = char == "{"
+                    self._pos += 1
+                    self._state = self._ENTRY
+                    continue
+                complete, value = self._value(final)
+                if not complete:
+                    return entries
+                self.header[self._member] = value
+                self._state = self._KEY
+            elif self._state == self._ENTRY:
+                if char == ",":
+                    self._pos += 1
+                    continue
+                if char == ("}" if self.keyed else "]"):
+                    self._pos += 1
+                    self._state = self._KEY
+                    continue
+                complete, value = self._value(final)
+                if not complete:
+                    return entries
+                if self.keyed:
+                    self._entry_key = value
+                    self._state = self._ENTRY_COLON
+                else:
+                    entries.append(value)
+            elif self._state == self._ENTRY_COLON:
+                if char != ":":
+                    self._expect(char)
+                self._pos += 1
+                self._state = self._ENTRY_VALUE
+            elif self._state == self._ENTRY_VALUE:
+                complete, value = self._value(final)
+                if not complete:
+                    return entries
+                entries.append((self._entry_key, value))
+                self._state = self._ENTRY
@@ -0,0 +1,248 @@
+from .types import *
+from .exceptions import BadRequest, InvalidCountry, InvalidVersion
+from .cache import ResponseCache
+from typing import Optional, TYPE_CHECKING
+from pydantic import BaseModel
+import asyncio
+
+if TYPE_CHECKING:
+    from .client import ProxySix
+
+class PurchaseConstraints(BaseModel):
+    '''
+    Limits of purchase plan
+
+    Attributes
+    ----------
+    countries (List[ProxyCountry]):
+        Countries proxies may be bought in (None - any country)
+    versions (List[ProxyVersion]):
+        Proxy versions that may be bought (None - any version)
+    max_price (float):
+        Maximum total price (None - no limit)
+    max_orders (int):
+        Maximum amount of `buyProxy` calls plan is split into (None - no limit)
+    '''
+    countries: Optional[List[ProxyCountry]] = None
+    versions: Optional[List[ProxyVersion]] = None
+    max_price: Optional[float] = None
+    max_orders: Optional[int] = None
+
+
+class PlannedOrder(BaseModel):
+    '''
+    One `buyProxy` call of purchase plan
+
+    Attributes
+    ----------
+    country (ProxyCountry):
+        Country of proxies
+    version (ProxyVersion):
+        Version of proxies
+    count (int):
+        Amount of proxies
+    price (float):
+        Price of the order
+    available (int):
+        Amount of proxies available in country when plan was made
+    purchase (NewProxyListNokey):
+        Bought proxies, once plan is executed
+    error (str):
+        Error order failed with, once plan is executed
+    '''
+    country: ProxyCountry
+    version: ProxyVersion
+    count: int
+    price: float
+    available: int
+    purchase: Optional[NewProxyListNokey] = None
+    error: Optional[str] = None
+
+
+class PurchasePlan(BaseModel):
+    '''
+    Cheapest split of purchase into orders
+
+    Attributes
+    ----------
+    count (int):
+        Requested amount of proxies
+    period (int):
+        Period in days
+    orders (List[PlannedOrder]):
+        Orders to place
+    price (float):
+        Total price of orders
+    shortfall (int):
+        Amount of requested proxies not covered by orders
+    reason (str):
+        Why plan does not satisfy request or constraints (None if it does)
+    executed (bool):
+        Whether orders were placed
+    '''
+    count: int
+    period: int
+    orders: List[PlannedOrder] = []
+    price: float = 0.0
+    shortfall: int = 0
+    reason: Optional[str] = None
+    executed: bool = False
+
+    @property
+    def feasible(self) -> bool:
+        '''Whether orders buy all requested proxies within constraints'''
+        return self.reason is None
+
+    @property
+    def bought(self) -> int:
+        '''Amount of proxies bought by executed orders'''
+        return sum(order.purchase.count for order in self.orders if order.purchase is not None)
+
+
+class PurchasePlanner():
+    '''
+    Finds the cheapest way to buy proxies across countries and versions
+
+    Lists of countries (`getCountry`), availability (`getCount`) and prices (`getPrice`) of all candidate
+    country and version pairs are requested concurrently and cached, with the client's `ResponseCache`
+    if it has one or with planner's own otherwise. Price depends on version, amount and period only, so versions
+    are filled from the lowest price for the whole amount, and inside a version countries with the most
+    proxies available go first, which keeps orders few and large (volume prices apply per order).
+
+    Attributes
+    ----------
+    client (ProxySix):
+        Client used to request prices and buy proxies
+    cache (ResponseCache):
+        Cache of catalog responses used when client has no cache
+    concurrency (int):
+        Maximum amount of catalog requests at once
+    '''
+    def __init__(self, client: "ProxySix", cache: ResponseCache = None, concurrency: int = 20) -> None:
+        '''
+        Parameters
+        ----------
+        client (ProxySix):
+            Client used to request prices and buy proxies (Required)
+        cache (ResponseCache):
+            Cache of catalog responses used when client has no cache (default - None, new `ResponseCache`)
+        concurrency (int):
+            Maximum amount of catalog requests at once (default - 20)
+        '''
+        self.client = client
+        self.cache: ResponseCache = cache if cache is not None else ResponseCache()
+        self.concurrency: int = concurrency
+        self._semaphore = asyncio.Semaphore(concurrency)
+
+    async def _catalog(self, method: str, params: dict):
+        cache = self.client.cache
+        if cache is None or not cache.caches(method):
+            cache = self.cache
+
+        async def fetch():
+            async with self._semaphore:
+                return await self.client._request(method, params)
+
+        return await cache.get(method, params, fetch)
+
+    async def _price(self, count: int, period: int, version: ProxyVersion) -> Price:
+        return await self._catalog("getprice", {"count": count, "period": period, "version": version.value})
+
+    async def _available(self, country: ProxyCountry, version: ProxyVersion) -> int:
+        try:
+            return await self._catalog("getcount", {"country": country.value, "version": version.value})
+        except (InvalidCountry, InvalidVersion):
+            return 0  # country is not sold with this version, account errors propagate
+
+    async def plan(self, count: int, period: int, constraints: PurchaseConstraints = None) -> PurchasePlan:
+        '''
+        Makes purchase plan
+
+        Parameters
+        ----------
+        count (int):
+            Amount of proxies to buy (Required)
+        period (int):
+            Period in days (Required)
+        constraints (PurchaseConstraints):
+            Limits of plan (default - None, no limits)
+
+        Returns
+        -------
+        plan (PurchasePlan):
+            Orders covering as much of `count` as possible; `reason` tells why plan is not feasible
+        '''
+        constraints = constraints or PurchaseConstraints()
+        versions = list(constraints.versions or ProxyVersion)
+        allowed = set(constraints.countries) if constraints.countries is not None else None
+
+        listed = await asyncio.gather(*(self._catalog("getcountry", {"version": version.value}) for version in versions))
+        pairs = [(country, version) for version, countries in zip(versions, listed)
+            for country in countries if allowed is None or country in allowed]
+        counts, prices = await asyncio.gather(
+            asyncio.gather(*(self._available(country, version) for country, version in pairs)),
+            asyncio.gather(*(self._price(count, period, version) for version in versions)))
+        unit = {version: price.price_single for version, price in zip(versions, prices)}
+
+        candidates = sorted(((country, version, available) for (country, version), available in zip(pairs, counts) if available > 0),
+            key=lambda pair: (unit[pair[1]], -pair[2]))
+        allocation, left = [], count
+        for country, version, available in candidates:
+            if left == 0 or (constraints.max_orders is not None and len(allocation) == constraints.max_orders):
+                break
+            take = min(left, available)
+            allocation.append((country, version, take, available))
+            left -= take
+
+        quotes = await asyncio.gather(*(self._price(take, period, version) for _, version, take, _ in allocation))
+        orders = [PlannedOrder(country=country, version=version, count=take, price=quote.price, available=available)
+            for (country, version, take, available), quote in zip(allocation, quotes)]
+        plan = PurchasePlan(count=count, period=period, orders=orders,
+            price=round(sum(order.price for order in orders), 2), shortfall=left)
+        if left:
+            plan.reason = f"{left} of {count} proxies are not available" + (
+                f" within {constraints.max_orders} orders" if constraints.max_orders is not None else "")
+        elif constraints.max_price is not None and plan.price > constraints.max_price:
+            plan.reason = f"Price {plan.price} exceeds {constraints.max_price}"
+        return plan
+
+    async def execute(self,
+            plan: PurchasePlan,
+            type: ProxyScheme = ProxyScheme.HTTPS,
+            description: str = None,
+            auto_prolong: bool = False) -> PurchasePlan:
+        '''
+        Places all orders of plan at once
+
+        Every order gets either `purchase` or `error`, failure of one order does not stop others.
+        Cached availability is dropped afterwards.
+
+        Parameters
+        ----------
+        plan (PurchasePlan):
+            Plan made by `plan()` (Required)
+        type (ProxyScheme):
+            Proxy scheme (default - HTTPS)
+        description (str):
+            Technical description of bought proxies (default - None)
+        auto_prolong (bool):
+            True - prolong proxies automatically (default - False)
+
+        Returns
+        -------
+        plan (PurchasePlan):
+            The same plan with results of orders
+        '''
+        async def place(order: PlannedOrder) -> None:
+            try:
+                order.purchase = await self.client.buyProxy(order.count, plan.period, order.country, order.version,
+                    type, description, auto_prolong, nokey=True)
+            except (BadRequest, *self.client.transport.transient_errors) as e:
+                order.error = repr(e)
+
+        try:
+            await asyncio.gather(*(place(order) for order in plan.orders))
+        finally:
+            self.cache.invalidate("getcount")
+        plan.executed = True
+        return plan
@@ -0,0 +1,407 @@
+from .types import *
+from typing import Iterable, TYPE_CHECKING
+import asyncio, heapq, random, time
+
+if TYPE_CHECKING:
+    from .client import ProxySix
+    from .inventory import ProxyInventory
+
+STRATEGIES = ("latency", "least_used", "round_robin")
+
+class _Entry():
+    __slots__ = ("proxy", "in_use", "latency", "failures", "quarantined_until", "removed", "slots")
+
+    def __init__(self, proxy: Proxy) -> None:
+        self.proxy = proxy
+        self.in_use: int = 0
+        self.latency: float = None
+        self.failures: int = 0
+        self.quarantined_until: float = None
+        self.removed: bool = False
+        self.slots: Dict[tuple, int] = {}
+
+
+class _Group():
+    '''Available entries of one selection key, removable in O(1) by swapping with the last one'''
+    __slots__ = ("key", "entries", "cursor")
+
+    def __init__(self, key: tuple) -> None:
+        self.key = key
+        self.entries: List[_Entry] = []
+        self.cursor: int = 0
+
+    def add(self, entry: _Entry) -> None:
+        if self.key not in entry.slots:
+            entry.slots[self.key] = len(self.entries)
+            self.entries.append(entry)
+
+    def discard(self, entry: _Entry) -> None:
+        index = entry.slots.pop(self.key, None)
+        if index is None:
+            return
+        last = self.entries.pop()
+        if last is not entry:
+            self.entries[index] = last
+            last.slots[self.key] = index
+
+
+class Lease():
+    '''
+    Proxy handed out by `ProxyPool`, must be released exactly once
+
+    Can be used as async context manager: the proxy is released on exit, 
+    as failed if an exception was raised, with time spent inside as latency.
+
+    Attributes
+    ----------
+    proxy (Proxy):
+        Leased proxy
+    acquired_at (float):
+        Monotonic time of acquisition
+    '''
+    __slots__ = ("pool", "proxy", "acquired_at", "released", "_entry")
+
+    def __init__(self, pool: "ProxyPool", entry: _Entry) -> None:
+        self.pool = pool
+        self.proxy: Proxy = entry.proxy
+        self.acquired_at: float = time.monotonic()
+        self.released: bool = False
+        self._entry = entry
+
+    def release(self, ok: bool = True, latency: float = None) -> None:
+        '''
+        Returns proxy to pool
+
+        Parameters
+        ----------
+        ok (bool):
+            Whether proxy worked (default - True)
+        latency (float):
+            Observed latency in seconds (default - None, time since acquisition)
+        '''
+        self.pool.release(self, ok, latency)
+
+    async def __aenter__(self) -> Proxy:
+        return self.proxy
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if not self.released:
+            self.release(ok=exc_type is None)
+
+
+class ProxyPool():
+    '''
+    Hands out proxies to concurrent workers, preferring fast and idle ones
+
+    Every acquisition looks at two random available proxies of requested country/type 
+    and takes the better one ("power of two choices"), which costs O(1) regardless of pool size:
+
+    - `latency` - lower EWMA of observed latency multiplied by `in_use + 1` (untested proxies first)
+    - `least_used` - fewer current leases
+    - `round_robin` - proxies in turn
+
+    Proxy failing `failure_threshold` times in a row is quarantined for `quarantine` seconds. 
+    After that it gets a single chance: the next failure quarantines it again.
+
+    Attributes
+    ----------
+    strategy (str):
+        Selection strategy
+    max_leases (int):
+        Maximum amount of simultaneous leases of one proxy (None - unlimited)
+    alpha (float):
+        Weight of the newest latency sample in EWMA
+    failure_threshold (int):
+        Consecutive failures that quarantine proxy
+    quarantine (float):
+        Seconds proxy stays in quarantine
+    '''
+    def __init__(self, 
+            proxies: Iterable[Proxy] = (), 
+            strategy: str = "latency", 
+            max_leases: int = None, 
+            alpha: float = 0.3, 
+            failure_threshold: int = 3, 
+            quarantine: float = 60.0) -> None:
+        '''
+        Parameters
+        ----------
+        proxies (Iterable[Proxy]):
+            Proxies to start with (default - empty pool)
+        strategy (str):
+            `latency`, `least_used` or `round_robin` (default - latency)
+        max_leases (int):
+            Maximum amount of simultaneous leases of one proxy (default - None, unlimited)
+        alpha (float):
+            Weight of the newest latency sample in EWMA (default - 0.3)
+        failure_threshold (int):
+            Consecutive failures that quarantine proxy (default - 3)
+        quarantine (float):
+            Seconds proxy stays in quarantine (default - 60.0)
+        '''
+        if strategy not in STRATEGIES:
+            raise ValueError(f"strategy must be one of {STRATEGIES}")
+        self.strategy: str = strategy
+        self.max_leases: int = max_leases
+        self.alpha: float = alpha
+        self.failure_threshold: int = failure_threshold
+        self.quarantine: float = quarantine
+
+        self._entries: Dict[int, _Entry] = {}
+        self._groups: Dict[tuple, _Group] = {}
+        self._quarantined: List[tuple] = []
+        self._waiters: List[asyncio.Future] = []
+        self.update(proxies)
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, id: int) -> bool:
+        return id in self._entries
+
+    @classmethod
+    def from_inventory(cls, inventory: "ProxyInventory", **options) -> "ProxyPool":
+        '''Creates pool of active proxies of synchronized inventory'''
+        return cls(inventory.filter(active=True), **options)
+
+    async def load(self, client: "ProxySix") -> None:
+        '''Replaces proxies of pool with active proxies of account'''
+        self.update([proxy async for proxy in client.iterProxies(state=ProxyState.ACTIVE)], replace=True)
+
+    def update(self, proxies: Iterable[Proxy], replace: bool = False) -> None:
+        '''
+        Adds proxies to pool, keeping statistics of proxies already in it
+
+        Parameters
+        ----------
+        proxies (Iterable[Proxy]):
+            Proxies to add (Required)
+        replace (bool):
+            Remove proxies absent in `proxies` (default - False)
+        '''
+        seen = set()
+        for proxy in proxies:
+            seen.add(proxy.id)
+            entry = self._entries.get(proxy.id)
+            if entry is not None:
+                if self._keys(entry.proxy) == self._keys(proxy):
+                    entry.proxy = proxy
+                    continue
+                # country or type changed, move entry to groups of new keys (if it is available at all)
+                available = bool(entry.slots)
+                self._make_unavailable(entry)
+                entry.proxy = proxy
+                if available:
+                    self._make_available(entry)
+                continue
+            entry = self._entries[proxy.id] = _Entry(proxy)
+            self._make_available(entry)
+        if replace:
+            for id in [id for id in self._entries if id not in seen]:
+                self.remove(id)
+        self._wake()
+
+    def remove(self, id: int) -> None:
+        '''Removes proxy from pool, its active leases can still be released'''
+        entry = self._entries.pop(id, None)
+        if entry is not None:
+            entry.removed = True
+            self._make_unavailable(entry)
+
+    def _keys(self, proxy: Proxy) -> tuple:
+        return ((None, None), (proxy.country, None), (None, proxy.type), (proxy.country, proxy.type))
+
+    def _make_available(self, entry: _Entry) -> None:
+        for key in self._keys(entry.proxy):
+            group = self._groups.get(key)
+            if group is None:
+                group = self._groups[key] = _Group(key)
+            group.add(entry)
+
+    def _make_unavailable(self, entry: _Entry) -> None:
+        for key in list(entry.slots):
+            self._groups[key].discard(entry)
+
+    def _revive(self) -> None:
+        now = time.monotonic()
+        while self._quarantined and self._quarantined[0][0] <= now:
+            _, id, entry = heapq.heappop(self._quarantined)
+            if entry.removed or entry.quarantined_until is None:
+                continue
+            entry.quarantined_until = None
+            entry.failures = self.failure_threshold - 1
+            if self.max_leases is None or entry.in_use < self.max_leases:
+                self._make_available(entry)
+
+    def _score(self, entry: _Entry) -> float:
+        if self.strategy == "least_used":
+            return entry.in_use
+        return (entry.latency or 0.0) * (entry.in_use + 1)
+
+    def _pick(self, key: tuple) -> _Entry:
+        self._revive()
+        group = self._groups.get(key)
+        if group is None or not group.entries:
+            return None
+        entries = group.entries
+        if self.strategy == "round_robin":
+            group.cursor = (group.cursor + 1) % len(entries)
+            return entries[group.cursor]
+        if len(entries) == 1:
+            return entries[0]
+        first, second = random.sample(entries, 2)
+        return first if self._score(first) <= self._score(second) else second
+
+    def try_acquire(self, country: ProxyCountry = None, type: ProxyScheme = None) -> Lease:
+        '''Same as `acquire`, but returns None at once if no proxy is available'''
+        entry = self._pick((country, type))
+        if entry is None:
+            return None
+        entry.in_use += 1
+        if self.max_leases is not None and entry.in_use >= self.max_leases:
+            self._make_unavailable(entry)
+        return Lease(self, entry)
+
+    async def acquire(self, country: ProxyCountry = None, type: ProxyScheme = None, timeout: float = None) -> Lease:
+        '''
+        Leases proxy, waiting until one is available
+
+        Parameters
+        ----------
+        country (ProxyCountry):
+            Only proxies of this country (default - any)
+        type (ProxyScheme):
+            Only proxies of this scheme (default - any)
+        timeout (float):
+            Seconds to wait, `asyncio.TimeoutError` is raised on expiry (default - None, wait forever)
+
+        Returns
+        -------
+        lease (Lease):
+            Lease of proxy, to be released with `lease.release()` or used as `async with`
+        '''
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            lease = self.try_acquire(country, type)
+            if lease is not None:
+                return lease
+            wait = None
+            if deadline is not None:
+                wait = deadline - loop.time()
+                if wait <= 0:
+                    raise asyncio.TimeoutError()
+            if self._quarantined:
+                revival = max(0.0, self._quarantined[0][0] - time.monotonic())
+                wait = revival if wait is None else min(wait, revival)
+            waiter = loop.create_future()
+            self._waiters.append(waiter)
+            try:
+                await asyncio.wait_for(waiter, wait)
+            except asyncio.TimeoutError:
+                pass
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+
+    def lease(self, country: ProxyCountry = None, type: ProxyScheme = None, timeout: float = None) -> "_LeaseContext":
+        '''
+        Leases proxy for `async with` block, releasing it on exit
+
+        ```
+        async with pool.lease(country=ProxyCountry.GERMANY) as proxy:
+            ...
+        ```
+        '''
+        return _LeaseContext(self, country, type, timeout)
+
+    def release(self, lease: Lease, ok: bool = True, latency: float = None) -> None:
+        '''
+        Returns leased proxy to pool
+
+        Parameters
+        ----------
+        lease (Lease):
+            Lease returned by `acquire` (Required)
+        ok (bool):
+            Whether proxy worked (default - True)
+        latency (float):
+            Observed latency in seconds (default - None, time since acquisition)
+        '''
+        if lease.released:
+            raise RuntimeError("Lease is already released")
+        lease.released = True
+        entry = lease._entry
+        entry.in_use -= 1
+        if latency is None:
+            latency = time.monotonic() - lease.acquired_at
+        self._observe(entry, ok, latency)
+        if (not entry.removed and entry.quarantined_until is None 
+                and (self.max_leases is None or entry.in_use < self.max_leases)):
+            self._make_available(entry)
+        self._wake()
+
+    def observe(self, id: int, ok: bool, latency: float = None) -> None:
+        '''
+        Records outcome of using proxy outside of lease (e.g. `HealthProber` result)
+
+        Parameters
+        ----------
+        id (int):
+            Proxy ID (Required)
+        ok (bool):
+            Whether proxy worked (Required)
+        latency (float):
+            Observed latency in seconds (default - None, latency is not updated)
+        '''
+        entry = self._entries.get(id)
+        if entry is not None:
+            self._observe(entry, ok, latency)
+            self._wake()
+
+    def _observe(self, entry: _Entry, ok: bool, latency: float) -> None:
+        if ok:
+            entry.failures = 0
+            if latency is not None:
+                entry.latency = latency if entry.latency is None else entry.latency + self.alpha * (latency - entry.latency)
+            return
+        entry.failures += 1
+        if entry.failures >= self.failure_threshold and entry.quarantined_until is None:
+            entry.quarantined_until = time.monotonic() + self.quarantine
+            heapq.heappush(self._quarantined, (entry.quarantined_until, entry.proxy.id, entry))
+            self._make_unavailable(entry)
+
+    def _wake(self) -> None:
+        waiters, self._waiters = self._waiters, []
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def stats(self, id: int) -> dict:
+        '''Returns current statistics of proxy'''
+        entry = self._entries[id]
+        return {
+            "in_use" : entry.in_use,
+            "latency" : entry.latency,
+            "failures" : entry.failures,
+            "quarantined" : entry.quarantined_until is not None
+        }
+
+
+class _LeaseContext():
+    __slots__ = ("pool", "country", "type", "timeout", "lease")
+
+    def __init__(self, pool: ProxyPool, country: ProxyCountry, type: ProxyScheme, timeout: float) -> None:
+        self.pool = pool
+        self.country = country
+        self.type = type
+        self.timeout = timeout
+        self.lease: Lease = None
+
+    async def __aenter__(self) -> Proxy:
+        self.lease = await self.pool.acquire(self.country, self.type, self.timeout)
+        return self.lease.proxy
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        if not self.lease.released:
+            self.lease.release(ok=exc_type is None)
@@ -0,0 +1,271 @@
+from .types import *
+from .exceptions import BadRequest, InsufficientFunds
+from typing import Callable, Iterable, TYPE_CHECKING
+from pydantic import BaseModel
+import asyncio, heapq, logging, time
+
+if TYPE_CHECKING:
+    from .client import ProxySix
+    from .inventory import ProxyInventory
+
+logger = logging.getLogger(__name__)
+
+class ProlongReport(BaseModel):
+    '''
+    Outcome of one scheduled prolongation
+
+    Attributes
+    ----------
+    timestamp (float):
+        Unixtime prolongation was run at
+    period (int):
+        Extension period in days
+    renewed (Dict[int, int]):
+        New expiration unixtime by ID of prolonged proxy
+    skipped (List[int]):
+        IDs of due proxies not prolonged because balance was not enough
+    failed (List[int]):
+        IDs of due proxies not prolonged because of other API errors
+    price (float):
+        Total cost of prolongation
+    errors (List[str]):
+        Errors met while prolonging
+    '''
+    timestamp: float
+    period: int
+    renewed: Dict[int, int] = {}
+    skipped: List[int] = []
+    failed: List[int] = []
+    price: float = 0.0
+    errors: List[str] = []
+
+
+class ProlongScheduler():
+    '''
+    Prolongs proxies shortly before they expire
+
+    Keeps expiration times of proxies in a min-heap and sleeps until the earliest proxy is `lead` seconds 
+    from expiring. Then all proxies expiring within `window` seconds after it are prolonged with one 
+    `prolongProxy` call (split into chunks of `max_batch`).
+
+    Balance is respected: once price of one proxy is known, a batch is cut to what account balance 
+    above `min_balance` pays for, and a batch rejected with `InsufficientFunds` is halved until it fits. 
+    Proxies that could not be paid for are reported as skipped and retried after `retry_delay`.
+
+    Attributes
+    ----------
+    client (ProxySix):
+        Client used to prolong proxies
+    period (int):
+        Extension period in days
+    lead (float):
+        Seconds before expiration proxy is prolonged
+    window (float):
+        Seconds of expiration times joined into one batch
+    reports (List[ProlongReport]):
+        Reports of performed prolongations
+    '''
+    def __init__(self, 
+            client: "ProxySix", 
+            period: int, 
+            inventory: "ProxyInventory" = None, 
+            lead: float = 6 * 3600, 
+            window: float = 3600, 
+            max_batch: int = 200, 
+            min_balance: float = 0.0, 
+            retry_delay: float = 600, 
+            on_report: Callable[[ProlongReport], None] = None) -> None:
+        '''
+        Parameters
+        ----------
+        client (ProxySix):
+            Client used to prolong proxies (Required)
+        period (int):
+            Extension period in days (Required)
+        inventory (ProxyInventory):
+            Inventory active proxies are scheduled from by `refresh()` (default - None, use `schedule()`)
+        lead (float):
+            Seconds before expiration proxy is prolonged (default - 6 hours)
+        window (float):
+            Seconds of expiration times joined into one batch (default - 1 hour)
+        max_batch (int):
+            Maximum amount of proxies in one `prolongProxy` call (default - 200)
+        min_balance (float):
+            Balance that must stay on account (default - 0.0)
+        retry_delay (float):
+            Seconds to wait before retrying proxies that were not prolonged (default - 10 minutes)
+        on_report (Callable[[ProlongReport], None]):
+            Called with every report (default - None)
+        '''
+        self.client = client
+        self.period: int = period
+        self.inventory = inventory
+        self.lead: float = lead
+        self.window: float = window
+        self.max_batch: int = max_batch
+        self.min_balance: float = min_balance
+        self.retry_delay: float = retry_delay
+        self.on_report = on_report
+        self.reports: List[ProlongReport] = []
+
+        self._deadlines: Dict[int, float] = {}
+        self._heap: List[tuple] = []
+        self._unit_price: float = None
+        self._changed: asyncio.Event = None
+        self._task: asyncio.Task = None
+
+    def __len__(self) -> int:
+        return len(self._deadlines)
+
+    def schedule(self, proxies: Iterable[Proxy]) -> None:
+        '''Schedules prolongation of proxies by their `unixtime_end`'''
+        for proxy in proxies:
+            self._set(proxy.id, proxy.unixtime_end - self.lead)
+        self._notify()
+
+    def unschedule(self, id: int) -> None:
+        '''Stops prolonging proxy'''
+        self._deadlines.pop(id, None)
+
+    def refresh(self) -> None:
+        '''Replaces schedule with active proxies of inventory'''
+        active = self.inventory.filter(active=True)
+        ids = {proxy.id for proxy in active}
+        for id in [id for id in self._deadlines if id not in ids]:
+            del self._deadlines[id]
+        self.schedule(active)
+
+    def _set(self, id: int, due: float) -> None:
+        if self._deadlines.get(id) != due:
+            self._deadlines[id] = due
+            heapq.heappush(self._heap, (due, id))
+
+    def _notify(self) -> None:
+        if self._changed is not None:
+            self._changed.set()
+
+    @property
+    def next_due(self) -> float:
+        '''Unixtime of the next prolongation (None if nothing is scheduled)'''
+        while self._heap and self._deadlines.get(self._heap[0][1]) != self._heap[0][0]:
+            heapq.heappop(self._heap)
+        return self._heap[0][0] if self._heap else None
+
+    def _pop_due(self, now: float) -> List[int]:
+        first = self.next_due
+        if first is None or first > now:
+            return []
+        ids = []
+        while self._heap and self._heap[0][0] <= first + self.window:
+            due, id = heapq.heappop(self._heap)
+            if self._deadlines.get(id) == due:
+                del self._deadlines[id]
+                ids.append(id)
+        return ids
+
+    def _affordable(self, count: int) -> int:
+        if self._unit_price is None or self._unit_price <= 0 or self.client.balance is None:
+            return count
+        return max(0, min(count, int((self.client.balance - self.min_balance) / self._unit_price)))
+
+    async def run_once(self, now: float = None) -> ProlongReport:
+        '''
+        Prolongs proxies that are due
+
+        Parameters
+        ----------
+        now (float):
+            Current unixtime (default - time.time())
+
+        Returns
+        -------
+        report (ProlongReport):
+            What was prolonged (None if nothing was due)
+        '''
+        now = time.time() if now is None else now
+        ids = self._pop_due(now)
+        if not ids:
+            return None
+        report = ProlongReport(timestamp=now, period=self.period)
+        try:
+            for start in range(0, len(ids), self.max_batch):
+                await self._prolong(ids[start:start + self.max_batch], report)
+        except BaseException:
+            for id in ids:
+                if id not in self._deadlines:
+                    self._set(id, now + self.retry_delay)
+            raise
+        for id in report.skipped + report.failed:
+            self._set(id, now + self.retry_delay)
+        self.reports.append(report)
+        if self.on_report is not None:
+            self.on_report(report)
+        return report
+
+    async def _prolong(self, ids: List[int], report: ProlongReport) -> None:
+        pending = [ids]
+        while pending:
+            batch = pending.pop()
+            affordable = self._affordable(len(batch))
+            report.skipped.extend(batch[affordable:])
+            batch = batch[:affordable]
+            if not batch:
+                continue
+            try:
+                res = await self.client.prolongProxy(self.period, batch)
+            except InsufficientFunds as e:
+                if len(batch) == 1:
+                    report.skipped.extend(batch)
+                    report.errors.append(f"{type(e).__name__}: {e}")
+                else:
+                    half = len(batch) // 2
+                    pending.extend((batch[half:], batch[:half]))
+                continue
+            except (BadRequest, *self.client.transport.transient_errors) as e:
+                report.failed.extend(batch)
+                report.errors.append(f"{type(e).__name__}: {e}")
+                continue
+            report.price += res.price
+            if res.count:
+                self._unit_price = res.price / res.count
+            for id, prolong in res.list.items():
+                report.renewed[id] = prolong.unixtime_end
+                self._set(id, max(prolong.unixtime_end - self.lead, report.timestamp + self.retry_delay))
+            report.failed.extend(id for id in batch if id not in res.list)
+
+    async def run(self) -> None:
+        '''Prolongs proxies as they become due until cancelled'''
+        self._changed = asyncio.Event()
+        try:
+            while True:
+                self._changed.clear()
+                due = self.next_due
+                wait = None if due is None else max(0.0, due - time.time())
+                if wait is None or wait > 0:
+                    try:
+                        await asyncio.wait_for(self._changed.wait(), wait)
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+                try:
+                    await self.run_once()
+                except Exception:
+                    logger.exception("Prolongation failed, due proxies are retried in %s seconds", self.retry_delay)
+        finally:
+            self._changed = None
+
+    def start(self) -> asyncio.Task:
+        '''Starts `run()` in background task'''
+        if self._task is None or self._task.done():
+            self._task = asyncio.ensure_future(self.run())
+        return self._task
+
+    async def stop(self) -> None:
+        '''Stops background task started by `start()`'''
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
@@ -0,0 +1,122 @@
+from typing import Dict
+import asyncio, time
+
+class RateLimiter():
+    '''
+    Token bucket pacing requests to proxy6.net API
+
+    Bucket holds up to `burst` tokens and is refilled with `rate` tokens per second. 
+    Every request takes one token; when bucket is empty request waits for its turn. 
+    Waiters are served in order of arrival.
+
+    Attributes
+    ----------
+    rate (float):
+        Tokens added per second
+    burst (int):
+        Bucket capacity
+    acquired (int):
+        Amount of granted requests
+    delayed (int):
+        Amount of requests that had to wait
+    total_wait (float):
+        Summary time spent waiting in queue (seconds)
+    max_wait (float):
+        Longest time spent waiting in queue (seconds)
+    waiting (int):
+        Amount of requests currently waiting
+    '''
+    _shared: Dict[str, "RateLimiter"] = {}
+
+    def __init__(self, rate: float, burst: int = 1) -> None:
+        '''
+        Parameters
+        ----------
+        rate (float):
+            Requests per second allowed on average (Required)
+        burst (int):
+            Requests allowed at once after idle period (default - 1)
+        '''
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        if burst < 1:
+            raise ValueError("burst must be at least 1")
+        self.rate: float = float(rate)
+        self.burst: int = burst
+        self._tokens: float = float(burst)
+        self._updated: float = time.monotonic()
+
+        self.acquired: int = 0
+        self.delayed: int = 0
+        self.total_wait: float = 0.0
+        self.max_wait: float = 0.0
+        self.waiting: int = 0
+
+    @classmethod
+    def shared(cls, api_key: str, rate: float, burst: int = 1) -> "RateLimiter":
+        '''
+        Returns limiter shared by every caller using the same API key. 
+        Limiter is created on the first call, `rate` and `burst` of later calls are ignored.
+
+        Parameters
+        ----------
+        api_key (str):
+            API key limiter belongs to (Required)
+        rate (float):
+            Requests per second allowed on average (Required)
+        burst (int):
+            Requests allowed at once after idle period (default - 1)
+        '''
+        limiter = cls._shared.get(api_key)
+        if limiter is None:
+            limiter = cls._shared[api_key] = cls(rate, burst)
+        return limiter
+
+    @property
+    def mean_wait(self) -> float:
+        '''Average time spent waiting in queue per granted request (seconds)'''
+        return self.total_wait / self.acquired if self.acquired else 0.0
+
+    def _refill(self, now: float) -> None:
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    async def acquire(self) -> float:
+        '''
+        Waits until request is allowed to be sent
+
+        Returns
+        -------
+        wait (float):
+            Time spent waiting (seconds)
+        '''
+        self._refill(time.monotonic())
+        self._tokens -= 1
+        wait = -self._tokens / self.rate if self._tokens < 0 else 0.0
+        if wait > 0:
+            self.waiting += 1
+            try:
+                await asyncio.sleep(wait)
+            except asyncio.CancelledError:
+                self._tokens += 1
+                raise
+            finally:
+                self.waiting -= 1
+            self.delayed += 1
+        self.acquired += 1
+        self.total_wait += wait
+        self.max_wait = max(self.max_wait, wait)
+        return wait
+
+    def stats(self) -> dict:
+        '''Returns snapshot of queue metrics'''
+        return {
+            "rate" : self.rate,
+            "burst" : self.burst,
+            "acquired" : self.acquired,
+            "delayed" : self.delayed,
+            "waiting" : self.waiting,
+            "total_wait" : self.total_wait,
+            "mean_wait" : self.mean_wait,
+            "max_wait" : self.max_wait
+        }
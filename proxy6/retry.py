@@ -0,0 +1,89 @@
+import random
+
+IDEMPOTENT_METHODS = frozenset({"getprice", "getcount", "getcountry", "getproxy", "check"})
+
+class RetryPolicy():
+    '''
+    Describes how requests failed with transient errors are retried
+
+    Only idempotent API methods are retried (`getprice`, `getcount`, `getcountry`, `getproxy`, `check`), 
+    so `buy`, `prolong`, `delete` and other mutations are sent exactly once. 
+    Request is retried when server answers with 5xx status, when it times out or when connection fails.
+
+    Delays grow exponentially with "full jitter": n-th retry waits random time 
+    between 0 and `min(max_delay, base_delay * 2 ** (n - 1))` seconds.
+
+    Retries are limited by a budget shared by all requests of the policy: every request adds 
+    `budget_ratio` to it (up to `budget`) and every retry takes 1. 
+    When budget is empty failure is returned at once, so an outage is not multiplied by retries.
+
+    Attributes
+    ----------
+    retries (int):
+        Amount of retries performed
+    exhausted (int):
+        Amount of retries refused because budget was empty
+    '''
+    def __init__(self, 
+            max_attempts: int = 3, 
+            base_delay: float = 0.2, 
+            max_delay: float = 5.0, 
+            budget: float = 10.0, 
+            budget_ratio: float = 0.2, 
+            methods: frozenset = IDEMPOTENT_METHODS) -> None:
+        '''
+        Parameters
+        ----------
+        max_attempts (int):
+            Maximum amount of attempts per request, including the first one (default - 3)
+        base_delay (float):
+            Upper bound of delay before the first retry in seconds (default - 0.2)
+        max_delay (float):
+            Upper bound of delay before any retry in seconds (default - 5.0)
+        budget (float):
+            Maximum amount of retries stored in budget (default - 10.0)
+        budget_ratio (float):
+            Retries earned by every request (default - 0.2, i.e. one retry per five requests)
+        methods (frozenset):
+            API methods allowed to be retried (default - IDEMPOTENT_METHODS)
+        '''
+        if max_attempts < 1:
+            raise ValueError("max_attempts must be at least 1")
+        self.max_attempts: int = max_attempts
+        self.base_delay: float = base_delay
+        self.max_delay: float = max_delay
+        self.budget: float = budget
+        self.budget_ratio: float = budget_ratio
+        self.methods: frozenset = frozenset(methods)
+        self._balance: float = budget
+
+        self.retries: int = 0
+        self.exhausted: int = 0
+
+    def record_request(self) -> None:
+        '''Adds earnings of a new request to retry budget'''
+        self._balance = min(self.budget, self._balance + self.budget_ratio)
+
+    def allow(self, method: str, attempt: int) -> bool:
+        '''
+        Decides whether failed attempt may be retried, taking retry from budget if so
+
+        Parameters
+        ----------
+        method (str):
+            API method of failed request
+        attempt (int):
+            Number of failed attempt (starting from 1)
+        '''
+        if method not in self.methods or attempt >= self.max_attempts:
+            return False
+        if self._balance < 1:
+            self.exhausted += 1
+            return False
+        self._balance -= 1
+        self.retries += 1
+        return True
+
+    def delay(self, attempt: int) -> float:
+        '''Returns seconds to wait before retrying failed attempt number `attempt`'''
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
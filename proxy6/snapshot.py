@@ -0,0 +1,124 @@
+'''
+On-disk snapshots of proxy inventory
+
+Snapshot is a SQLite database. Its `user_version` header holds `SNAPSHOT_VERSION`,
+snapshots of other versions (or other accounts) are ignored on load, so changing the layout
+only requires increasing the version.
+'''
+from .types import *
+from .types import _COUNTRIES, _SCHEMES
+from typing import Iterable, Tuple
+import datetime, hashlib, os, sqlite3, time
+
+SNAPSHOT_VERSION = 1
+FIELDS = ("id", "ip", "host", "port", "user", "pass", "type", "country",
+    "date", "date_end", "unixtime", "unixtime_end", "descr", "active")
+
+_SCHEMA = f'''
+CREATE TABLE meta (key TEXT PRIMARY KEY, value TEXT);
+CREATE TABLE proxies (
+    id INTEGER PRIMARY KEY, ip TEXT, host TEXT, port TEXT, user TEXT, pass TEXT, type TEXT, country TEXT,
+    date TEXT, date_end TEXT, unixtime INTEGER, unixtime_end INTEGER, descr TEXT, active INTEGER
+);
+PRAGMA user_version = {SNAPSHOT_VERSION};
+'''
+
+
+def account_hash(api_key: str) -> str:
+    '''Identifies account in snapshot without storing API key'''
+    return hashlib.sha256(api_key.encode()).hexdigest()[:16]
+
+
+def _row(proxy: Proxy) -> tuple:
+    return (
+        proxy.id, proxy.ip, proxy.host, proxy.port, proxy.user, proxy.pswd, proxy.type.value, proxy.country.value,
+        proxy.date.isoformat(sep=" "), proxy.date_end.isoformat(sep=" "),
+        proxy.unixtime, proxy.unixtime_end, proxy.descr, int(proxy.active)
+    )
+
+
+def save_snapshot(path: str, proxies: Iterable[Proxy], date_mod: datetime.datetime, account: str = None) -> None:
+    '''
+    Writes proxies to snapshot, replacing the previous one atomically
+
+    Parameters
+    ----------
+    path (str):
+        Snapshot file (Required)
+    proxies (Iterable[Proxy]):
+        Proxies to store, `Proxy` or `ProxyRecord` (Required)
+    date_mod (datetime.datetime):
+        Account modification date proxies were synchronized at (Required)
+    account (str):
+        `account_hash()` of API key proxies belong to (default - None)
+    '''
+    temporary = f"{path}.{os.getpid()}.tmp"
+    if os.path.exists(temporary):
+        os.remove(temporary)
+    db = sqlite3.connect(temporary)
+    try:
+        db.executescript(_SCHEMA)
+        db.executemany("INSERT INTO meta VALUES (?, ?)", (
+            ("date_mod", date_mod.isoformat(sep=" ") if date_mod is not None else None),
+            ("saved_at", repr(time.time())),
+            ("account", account)
+        ))
+        db.executemany(f"INSERT INTO proxies VALUES ({', '.join('?' * len(FIELDS))})", map(_row, proxies))
+        db.commit()
+    finally:
+        db.close()
+    os.replace(temporary, path)
+
+
+def load_snapshot(path: str, account: str = None) -> Tuple[List[dict], datetime.datetime, float]:
+    '''
+    Reads proxies from snapshot
+
+    Parameters
+    ----------
+    path (str):
+        Snapshot file (Required)
+    account (str):
+        `account_hash()` of API key snapshot must belong to (default - None, any account)
+
+    Returns
+    -------
+    snapshot (Tuple[List[dict], datetime.datetime, float]):
+        Proxies as API returns them, account modification date and unixtime snapshot was saved at.
+        None if file is missing, damaged, of another version or of another account
+    '''
+    if not os.path.exists(path):
+        return None
+    try:
+        db = sqlite3.connect(f"file:{path}?mode=ro", uri=True)
+    except sqlite3.Error:
+        return None
+    try:
+        if db.execute("PRAGMA user_version").fetchone()[0] != SNAPSHOT_VERSION:
+            return None
+        meta = dict(db.execute("SELECT key, value FROM meta"))
+        if account is not None and meta.get("account") not in (None, account):
+            return None
+        rows = [dict(zip(FIELDS, row)) for row in db.execute(f"SELECT {', '.join(FIELDS)} FROM proxies")]
+    except sqlite3.Error:
+        return None
+    finally:
+        db.close()
+    date_mod = meta.get("date_mod")
+    return rows, datetime.datetime.fromisoformat(date_mod) if date_mod else None, float(meta["saved_at"])
+
+
+_PROXY_FIELDS = set(Proxy.__fields__)
+
+
+def decode_row(row: dict) -> Proxy:
+    '''Builds `Proxy` from snapshot row without validation (as `Proxy.construct`, skipping defaults)'''
+    proxy = Proxy.__new__(Proxy)
+    object.__setattr__(proxy, "__dict__", {
+        "id": row["id"], "ip": row["ip"], "host": row["host"], "port": row["port"], "user": row["user"], "pswd": row["pass"],
+        "type": _SCHEMES[row["type"]], "country": _COUNTRIES[row["country"]],
+        "date": datetime.datetime.fromisoformat(row["date"]), "date_end": datetime.datetime.fromisoformat(row["date_end"]),
+        "unixtime": row["unixtime"], "unixtime_end": row["unixtime_end"], "descr": row["descr"], "active": bool(row["active"])
+    })
+    object.__setattr__(proxy, "__fields_set__", _PROXY_FIELDS)
+    return proxy
@@ -0,0 +1,107 @@
+from .client import ProxySix
+from typing import Any, Coroutine, Iterator
+import asyncio, concurrent.futures, functools, inspect, threading
+
+class ProxySixSync():
+    '''
+    Blocking counterpart of `ProxySix` for code without event loop
+
+    Runs one `ProxySix` on an event loop living in a dedicated thread, so all calls share one connection pool. 
+    Has every public method of `ProxySix` with the same parameters: coroutines become blocking calls and 
+    async iterators (`iterProxies`, `checkMany`, ...) become ordinary iterators. 
+    Instance can be used from many threads at once.
+
+    Attributes
+    ----------
+    client (ProxySix):
+        Asynchronous client calls are delegated to
+    timeout (float):
+        Seconds to wait for a single call, the call is cancelled and `concurrent.futures.TimeoutError` 
+        (`TimeoutError` since Python 3.11) is raised on expiry (None - wait forever)
+    '''
+    def __init__(self, api_key: str, timeout: float = None, **options) -> None:
+        '''
+        Parameters
+        ----------
+        api_key (str):
+            API key from proxy6.net (`https://proxy6.net/en/user/developers`)
+        timeout (float):
+            Seconds to wait for a single call (default - None, wait forever)
+        **options:
+            Keyword arguments of `ProxySix` (connection limits, rate limiter, retry policy, cache, ...)
+        '''
+        self.timeout: float = timeout
+        self._loop = asyncio.new_event_loop()
+        self._thread = threading.Thread(target=self._loop.run_forever, name="proxy6-loop", daemon=True)
+        self._thread.start()
+        self.client: ProxySix = ProxySix(api_key, **options)
+
+    def __enter__(self) -> "ProxySixSync":
+        return self
+
+    def __exit__(self, exc_type, exc, tb) -> None:
+        self.close()
+
+    def __getattr__(self, name: str) -> Any:
+        # account state (balance, user_id, currency, date_mod, ...) is read from the client
+        if name.startswith("_") or name == "client":
+            raise AttributeError(name)
+        return getattr(self.client, name)
+
+    @property
+    def closed(self) -> bool:
+        return self._loop.is_closed()
+
+    def _run(self, coroutine: Coroutine) -> Any:
+        if self._loop.is_closed():
+            coroutine.close()
+            raise RuntimeError("Client is closed")
+        future = asyncio.run_coroutine_threadsafe(coroutine, self._loop)
+        try:
+            return future.result(self.timeout)
+        except concurrent.futures.TimeoutError:
+            future.cancel()
+            raise
+
+    def _iterate(self, iterator) -> Iterator:
+        try:
+            while True:
+                try:
+                    yield self._run(iterator.__anext__())
+                except StopAsyncIteration:
+                    return
+        finally:
+            if not self._loop.is_closed():
+                self._run(iterator.aclose())
+
+    def close(self) -> None:
+        '''Closes client session and stops background event loop'''
+        if self._loop.is_closed():
+            return
+        try:
+            self._run(self.client.close())
+        finally:
+            self._loop.call_soon_threadsafe(self._loop.stop)
+            self._thread.join()
+            self._loop.close()
+
+
+def _blocking(name: str, method):
+    @functools.wraps(method)
+    def call(self: ProxySixSync, *args, **kwargs):
+        return self._run(getattr(self.client, name)(*args, **kwargs))
+    return call
+
+def _iterating(name: str, method):
+    @functools.wraps(method)
+    def call(self: ProxySixSync, *args, **kwargs):
+        return self._iterate(getattr(self.client, name)(*args, **kwargs))
+    return call
+
+for _name, _method in inspect.getmembers(ProxySix, inspect.isfunction):
+    if _name.startswith("_") or _name == "close":
+        continue
+    if inspect.iscoroutinefunction(_method):
+        setattr(ProxySixSync, _name, _blocking(_name, _method))
+    elif inspect.isasyncgenfunction(_method):
+        setattr(ProxySixSync, _name, _iterating(_name, _method))
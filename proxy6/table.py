@@ -0,0 +1,259 @@
+from .types import *
+from typing import Iterable, Iterator
+from array import array
+import datetime, sys
+
+_EPOCH = datetime.datetime(1970, 1, 1)
+_SECOND = datetime.timedelta(seconds=1)
+_SCHEME_CODES = {scheme: code for code, scheme in enumerate(ProxyScheme)}
+_COUNTRY_CODES = {country: code for code, country in enumerate(ProxyCountry)}
+_SCHEMES = list(ProxyScheme)
+_COUNTRIES = list(ProxyCountry)
+
+def _seconds(value: datetime.datetime | str) -> int:
+    if isinstance(value, str):
+        value = datetime.datetime.fromisoformat(value)
+    return (value - _EPOCH) // _SECOND
+
+def _positions(column: array, code: int) -> List[int]:
+    '''Row numbers where one-byte `column` equals `code`, scanned by `bytes.find`'''
+    data = column.tobytes()
+    needle = bytes((code,))
+    rows = []
+    i = data.find(needle)
+    while i != -1:
+        rows.append(i)
+        i = data.find(needle, i + 1)
+    return rows
+
+
+class ProxyTable():
+    '''
+    Compact column-wise storage of proxies
+
+    Numbers are kept in typed arrays (`id`, `port`, `unixtime`, `unixtime_end`, `date`, `date_end` as seconds), 
+    strings are interned, country and type are stored as one-byte codes and active flags as a bitmask. 
+    Rows are accessed through `ProxyRow` views which do not copy data.
+
+    Conversion from and to `ProxyList` / `ProxyListNokey` is lossless.
+    '''
+    def __init__(self) -> None:
+        self.id = array("q")
+        self.port = array("l")
+        self.unixtime = array("q")
+        self.unixtime_end = array("q")
+        self.date = array("q")
+        self.date_end = array("q")
+        self.type = array("B")
+        self.country = array("B")
+        self.ip: List[str] = []
+        self.host: List[str] = []
+        self.user: List[str] = []
+        self.pswd: List[str] = []
+        self.descr: List[str] = []
+        self.active = bytearray()
+        self._length = 0
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator["ProxyRow"]:
+        return (ProxyRow(self, i) for i in range(self._length))
+
+    def __getitem__(self, index: int) -> "ProxyRow":
+        return self.row(index)
+
+    def row(self, index: int) -> "ProxyRow":
+        '''Returns view of row number `index`'''
+        if index < 0:
+            index += self._length
+        if not 0 <= index < self._length:
+            raise IndexError("row index out of range")
+        return ProxyRow(self, index)
+
+    def is_active(self, index: int) -> bool:
+        '''Whether proxy in row `index` is active'''
+        return bool(self.active[index >> 3] & (1 << (index & 7)))
+
+    def append(self, proxy: Proxy | ProxyRecord | dict) -> None:
+        '''
+        Adds proxy as the last row
+
+        Parameters
+        ----------
+        proxy (Proxy | ProxyRecord | dict):
+            Proxy model or proxy as it appears in `getproxy` response (Required)
+        '''
+        if isinstance(proxy, dict):
+            self._append(int(proxy["id"]), proxy["ip"], proxy["host"], proxy["port"], proxy["user"], proxy["pass"], 
+                _SCHEME_CODES[ProxyScheme(proxy["type"])], _COUNTRY_CODES[ProxyCountry(proxy["country"])], 
+                proxy["date"], proxy["date_end"], proxy["unixtime"], proxy["unixtime_end"], 
+                proxy["descr"], bool(int(proxy["active"])))
+        else:
+            self._append(proxy.id, proxy.ip, proxy.host, proxy.port, proxy.user, proxy.pswd, 
+                _SCHEME_CODES[proxy.type], _COUNTRY_CODES[proxy.country], 
+                proxy.date, proxy.date_end, proxy.unixtime, proxy.unixtime_end, proxy.descr, proxy.active)
+
+    def _append(self, id, ip, host, port, user, pswd, type, country, date, date_end, unixtime, unixtime_end, descr, active) -> None:
+        index = self._length
+        self.id.append(id)
+        self.port.append(int(port))
+        self.unixtime.append(int(unixtime))
+        self.unixtime_end.append(int(unixtime_end))
+        self.date.append(_seconds(date))
+        self.date_end.append(_seconds(date_end))
+        self.type.append(type)
+        self.country.append(country)
+        self.ip.append(sys.intern(ip))
+        self.host.append(sys.intern(host))
+        self.user.append(sys.intern(user))
+        self.pswd.append(sys.intern(pswd))
+        self.descr.append(sys.intern(descr))
+        if index & 7 == 0:
+            self.active.append(0)
+        if active:
+            self.active[index >> 3] |= 1 << (index & 7)
+        self._length += 1
+
+    def extend(self, proxies: Iterable[Proxy | ProxyRecord | dict]) -> None:
+        '''Adds proxies as the last rows'''
+        for proxy in proxies:
+            self.append(proxy)
+
+    @classmethod
+    def from_json(cls, data: dict | list) -> "ProxyTable":
+        '''
+        Builds table from `getproxy` response without creating models
+
+        Parameters
+        ----------
+        data (dict | list):
+            Whole response, or its `list` value in either keyed or nokey format (Required)
+        '''
+        if isinstance(data, dict) and "list" in data:
+            data = data["list"]
+        table = cls()
+        table.extend(data.values() if isinstance(data, dict) else data)
+        return table
+
+    @classmethod
+    def from_list(cls, proxies: ProxyList | ProxyListNokey) -> "ProxyTable":
+        '''Builds table from decoded `getProxy` result'''
+        table = cls()
+        table.extend(proxies.list.values() if isinstance(proxies.list, dict) else proxies.list)
+        return table
+
+    def to_list(self, nokey: bool = True) -> ProxyList | ProxyListNokey:
+        '''
+        Converts table back into `getProxy` result
+
+        Parameters
+        ----------
+        nokey (bool):
+            True - `ProxyListNokey` is returned. False - `ProxyList` is returned (default - True)
+        '''
+        proxies = [row.to_model() for row in self]
+        if nokey:
+            return ProxyListNokey.construct(list_count=len(proxies), list=proxies)
+        return ProxyList.construct(list_count=len(proxies), list={proxy.id: proxy for proxy in proxies})
+
+    def take(self, indices: Iterable[int]) -> "ProxyTable":
+        '''Returns new table made of rows with given numbers'''
+        table = ProxyTable()
+        for i in indices:
+            table._append(self.id[i], self.ip[i], self.host[i], self.port[i], self.user[i], self.pswd[i], 
+                self.type[i], self.country[i], _EPOCH + self.date[i] * _SECOND, _EPOCH + self.date_end[i] * _SECOND, 
+                self.unixtime[i], self.unixtime_end[i], self.descr[i], self.is_active(i))
+        return table
+
+    def where(self, 
+            country: ProxyCountry = None, 
+            type: ProxyScheme = None, 
+            description: str = None, 
+            active: bool = None, 
+            expires_after: int = None, 
+            expires_before: int = None) -> List[int]:
+        '''
+        Returns numbers of rows matching all given conditions
+
+        Parameters
+        ----------
+        country (ProxyCountry):
+            Proxy country
+        type (ProxyScheme):
+            Proxy scheme
+        description (str):
+            Exact technical description
+        active (bool):
+            True - only active proxies, False - only inactive proxies
+        expires_after (int):
+            Only proxies expiring at or after this unixtime
+        expires_before (int):
+            Only proxies expiring before this unixtime
+        '''
+        rows = None
+        if country is not None:
+            rows = _positions(self.country, _COUNTRY_CODES[country])
+        if type is not None:
+            found = _positions(self.type, _SCHEME_CODES[type])
+            rows = found if rows is None else [i for i in rows if self.type[i] == _SCHEME_CODES[type]]
+        if rows is None:
+            rows = range(self._length)
+        if description is not None:
+            descr = self.descr
+            rows = [i for i in rows if descr[i] == description]
+        if active is not None:
+            flags = self.active
+            rows = [i for i in rows if bool(flags[i >> 3] & (1 << (i & 7))) == active]
+        if expires_after is not None:
+            ends = self.unixtime_end
+            rows = [i for i in rows if ends[i] >= expires_after]
+        if expires_before is not None:
+            ends = self.unixtime_end
+            rows = [i for i in rows if ends[i] < expires_before]
+        return list(rows)
+
+    def filter(self, **conditions) -> "ProxyTable":
+        '''Returns new table made of rows matching conditions of `where`'''
+        return self.take(self.where(**conditions))
+
+
+class ProxyRow():
+    '''View of one `ProxyTable` row with the same attributes as `Proxy`'''
+    __slots__ = ("table", "index")
+
+    def __init__(self, table: ProxyTable, index: int) -> None:
+        self.table = table
+        self.index = index
+
+    id = property(lambda self: self.table.id[self.index])
+    ip = property(lambda self: self.table.ip[self.index])
+    host = property(lambda self: self.table.host[self.index])
+    port = property(lambda self: str(self.table.port[self.index]))
+    user = property(lambda self: self.table.user[self.index])
+    pswd = property(lambda self: self.table.pswd[self.index])
+    type = property(lambda self: _SCHEMES[self.table.type[self.index]])
+    country = property(lambda self: _COUNTRIES[self.table.country[self.index]])
+    date = property(lambda self: _EPOCH + self.table.date[self.index] * _SECOND)
+    date_end = property(lambda self: _EPOCH + self.table.date_end[self.index] * _SECOND)
+    unixtime = property(lambda self: self.table.unixtime[self.index])
+    unixtime_end = property(lambda self: self.table.unixtime_end[self.index])
+    descr = property(lambda self: self.table.descr[self.index])
+    active = property(lambda self: self.table.is_active(self.index))
+
+    @property
+    def proxy_link(self):
+        if self.type == ProxyScheme.HTTPS:
+            return f"http://{self.user}:{self.pswd}@{self.host}:{self.port}"
+        elif self.type == ProxyScheme.SOCKS5:
+            return f"socks5://{self.user}:{self.pswd}@{self.host}:{self.port}"
+
+    def to_model(self) -> Proxy:
+        '''Returns `Proxy` with values of the row'''
+        return Proxy.construct(
+            id=self.id, ip=self.ip, host=self.host, port=self.port, user=self.user, pswd=self.pswd, 
+            type=self.type, country=self.country, date=self.date, date_end=self.date_end, 
+            unixtime=self.unixtime, unixtime_end=self.unixtime_end, descr=self.descr, active=self.active)
+
+    def __repr__(self) -> str:
+        return f"ProxyRow(index={self.index}, id={self.id}, host={self.host!r}, port={self.port!r})"
@@ -0,0 +1,475 @@
+'''
+In-process fake of proxy6.net API for offline tests and benchmarks
+
+`FakeProxySix` keeps account state and answers API methods the way proxy6.net does, 
+including error codes 100-410. It is reached either without sockets through `FakeTransport`, 
+or over real HTTP through `FakeServer`:
+
+```
+fake = FakeProxySix(proxies=5000, latency=0.01)
+async with ProxySix(fake.api_key, transport=FakeTransport(fake)) as client:
+    ...
+```
+'''
+from .types import ProxyCountry, ProxyScheme, ProxyVersion
+from .transport import Response, StreamResponse, Transport
+from typing import AsyncIterator, Callable, Dict, Iterable, List
+from urllib.parse import urlsplit
+import asyncio, datetime, json, random, time
+
+_DAY = 86400
+_STATES = ("active", "expired", "expiring", "all")
+_VERSIONS = {version.value for version in ProxyVersion}
+_SCHEMES = {scheme.value for scheme in ProxyScheme}
+
+def _format(unixtime: float) -> str:
+    return datetime.datetime.fromtimestamp(unixtime, datetime.timezone.utc).strftime("%Y-%m-%d %H:%M:%S")
+
+
+class FakeError(Exception):
+    '''Raised inside `FakeProxySix` handlers to answer with API error'''
+    def __init__(self, error_id: int, error: str) -> None:
+        self.error_id = error_id
+        self.error = error
+        super().__init__(error)
+
+
+class FakeProxySix():
+    '''
+    State and behaviour of fake proxy6.net account
+
+    Attributes
+    ----------
+    api_key (str):
+        The only accepted API key
+    balance (float):
+        Account balance
+    proxies (Dict[int, dict]):
+        Account proxies by ID, stored the way API returns them
+    available (Dict[tuple, int]):
+        Proxies available to purchase by `(version, country code)`
+    prices (Dict[int, float]):
+        Price of one proxy for one day by version
+    latency (float | Callable[[str], float]):
+        Seconds every answer is delayed by (or function of method name returning them)
+    failure_rate (float):
+        Share of requests answered with HTTP 503
+    calls (List[tuple]):
+        Received `(method, params)` pairs
+    '''
+    def __init__(self, 
+            api_key: str = "fake-key", 
+            proxies: int = 20, 
+            balance: float = 1000.0, 
+            latency: float | Callable[[str], float] = 0.0, 
+            failure_rate: float = 0.0, 
+            seed: int = 0, 
+            first_id: int = 1) -> None:
+        '''
+        Parameters
+        ----------
+        api_key (str):
+            The only accepted API key (default - fake-key)
+        proxies (int):
+            Amount of proxies account starts with, a quarter of them expired (default - 20)
+        balance (float):
+            Account balance (default - 1000.0)
+        latency (float | Callable[[str], float]):
+            Seconds every answer is delayed by (default - 0.0)
+        failure_rate (float):
+            Share of requests answered with HTTP 503 (default - 0.0)
+        seed (int):
+            Seed of random generator used for dataset and failures (default - 0)
+        first_id (int):
+            ID of the first proxy, give accounts sharing a transport distinct ranges (default - 1)
+        '''
+        self.api_key: str = api_key
+        self.user_id: int = 1
+        self.balance: float = balance
+        self.currency: str = "RUB"
+        self.latency = latency
+        self.failure_rate: float = failure_rate
+        self.random = random.Random(seed)
+        self.prices = {6: 0.5, 4: 3.0, 3: 1.5}
+        self.countries = {
+            6: ["ru", "de", "us", "gb", "nl", "fr"],
+            4: [country.value for country in ProxyCountry],
+            3: ["ru", "de", "us"]
+        }
+        self.available = {(version, country): 1000 for version, countries in self.countries.items() for country in countries}
+        self.proxies: dict = {}
+        self.date_mod: float = time.time()
+        self.calls: List[tuple] = []
+        self._injected: List[tuple] = []
+        self._next_id = first_id
+
+        now = time.time()
+        for i in range(proxies):
+            expired = i % 4 == 3
+            start = now - self.random.randint(5, 30) * _DAY
+            end = now - self.random.randint(1, 4) * _DAY if expired else now + self.random.randint(1, 60) * _DAY
+            self._create(self.random.choice(self.countries[6]), 6, "http" if i % 3 else "socks", f"fake#{i}", start, end)
+
+    def _create(self, country: str, version: int, type: str, descr: str, start: float, end: float) -> dict:
+        id = self._next_id
+        self._next_id += 1
+        proxy = self.proxies[id] = {
+            "id": str(id), "version": str(version), 
+            "ip": f"2a00::{id:x}" if version == 6 else f"10.{id >> 16 & 255}.{id >> 8 & 255}.{id & 255}", 
+            "host": f"10.{id >> 16 & 255}.{id >> 8 & 255}.{id & 255}", "port": str(10000 + id % 50000), 
+            "user": f"user{id}", "pass": f"pass{id}", "type": type, "country": country, 
+            "date": _format(start), "date_end": _format(end), 
+            "unixtime": int(start), "unixtime_end": int(end), 
+            "descr": descr, "active": "1" if end > time.time() else "0"
+        }
+        self._touch()
+        return proxy
+
+    def _touch(self) -> None:
+        self.date_mod = max(time.time(), self.date_mod + 1)
+
+    def inject(self, method: str = None, error_id: int = None, status: int = None, error: str = "Injected error") -> None:
+        '''
+        Makes the next request (of `method`, or any) fail
+
+        Parameters
+        ----------
+        method (str):
+            API method to fail (default - None, any method)
+        error_id (int):
+            API error to answer with
+        status (int):
+            HTTP status to answer with instead of API error
+        error (str):
+            Error message
+        '''
+        self._injected.append((method, error_id, status, error))
+
+    async def handle(self, api_key: str, method: str, params: dict) -> tuple:
+        '''
+        Answers one request
+
+        Returns
+        -------
+        answer (tuple):
+            HTTP status and JSON document (None for error statuses)
+        '''
+        self.calls.append((method, dict(params)))
+        latency = self.latency(method) if callable(self.latency) else self.latency
+        if latency:
+            await asyncio.sleep(latency)
+        for i, (injected_method, error_id, status, error) in enumerate(self._injected):
+            if injected_method is None or injected_method == method:
+                del self._injected[i]
+                if status is not None:
+                    return status, None
+                return 200, {"status": "no", "error_id": error_id, "error": error}
+        if self.failure_rate and self.random.random() < self.failure_rate:
+            return 503, None
+
+        try:
+            if api_key != self.api_key:
+                raise FakeError(100, "Error key")
+            handler = getattr(self, f"_{method}", None)
+            if handler is None:
+                raise FakeError(110, "Error method")
+            data = handler(params)
+        except FakeError as e:
+            return 200, {"status": "no", "error_id": e.error_id, "error": e.error}
+        return 200, {
+            "status": "yes", "user_id": str(self.user_id), "balance": f"{self.balance:.2f}", 
+            "currency": self.currency, "date_mod": _format(self.date_mod), **data
+        }
+
+    @staticmethod
+    def _int(params: dict, name: str, error_id: int, error: str) -> int:
+        try:
+            return int(params[name])
+        except (KeyError, ValueError):
+            raise FakeError(error_id, error)
+
+    def _version(self, params: dict) -> int:
+        version = self._int(params, "version", 240, "Error version") if "version" in params else 6
+        if version not in _VERSIONS:
+            raise FakeError(240, "Error version")
+        return version
+
+    def _ids(self, params: dict) -> List[int]:
+        try:
+            ids = [int(id) for id in str(params["ids"]).split(",")]
+        except (KeyError, ValueError):
+            raise FakeError(230, "Error ids")
+        if not ids or len(ids) != len(set(ids)):
+            raise FakeError(230, "Error ids")
+        return ids
+
+    def _cost(self, count: int, period: int, version: int) -> float:
+        return round(self.prices[version] * count * period, 2)
+
+    def _getprice(self, params: dict) -> dict:
+        count = self._int(params, "count", 200, "Error count")
+        period = self._int(params, "period", 210, "Error period")
+        version = self._version(params)
+        if count < 1:
+            raise FakeError(200, "Error count")
+        if period < 1:
+            raise FakeError(210, "Error period")
+        price = self._cost(count, period, version)
+        if price <= 0:
+            raise FakeError(410, "Error price")
+        return {"price": price, "price_single": round(price / count, 2), "period": period, "count": count}
+
+    def _getcount(self, params: dict) -> dict:
+        version = self._version(params)
+        country = params.get("country")
+        if country not in self.countries[version]:
+            raise FakeError(220, "Error country")
+        return {"count": self.available[(version, country)]}
+
+    def _getcountry(self, params: dict) -> dict:
+        return {"list": list(self.countries[self._version(params)])}
+
+    def _matches(self, proxy: dict, state: str, now: float) -> bool:
+        active = proxy["unixtime_end"] > now
+        if state == "active":
+            return active
+        if state == "expired":
+            return not active
+        if state == "expiring":
+            return active and proxy["unixtime_end"] - now < 3 * _DAY
+        return True
+
+    def _getproxy(self, params: dict) -> dict:
+        state = params.get("state", "all")
+        if state not in _STATES:
+            raise FakeError(110, "Error state")
+        page = max(1, int(params.get("page", 1)))
+        limit = min(1000, max(1, int(params.get("limit", 1000))))
+        descr = params.get("descr")
+        now = time.time()
+        found = [proxy for proxy in self.proxies.values() 
+            if self._matches(proxy, state, now) and (descr is None or proxy["descr"] == descr)]
+        chunk = [dict(proxy, active="1" if proxy["unixtime_end"] > now else "0") for proxy in found[(page - 1) * limit:page * limit]]
+        proxies = chunk if "nokey" in params else {proxy["id"]: proxy for proxy in chunk}
+        return {"list_count": len(chunk), "list": proxies}
+
+    def _settype(self, params: dict) -> dict:
+        ids = self._ids(params)
+        if params.get("type") not in _SCHEMES:
+            raise FakeError(260, "Error type")
+        for id in ids:
+            if id in self.proxies:
+                self.proxies[id]["type"] = params["type"]
+        self._touch()
+        return {}
+
+    def _setdescr(self, params: dict) -> dict:
+        new = params.get("new")
+        if new is None or len(new) > 50:
+            raise FakeError(250, "Error new description")
+        if "ids" in params:
+            targets = [self.proxies[id] for id in self._ids(params) if id in self.proxies]
+        elif "old" in params:
+            targets = [proxy for proxy in self.proxies.values() if proxy["descr"] == params["old"]]
+        else:
+            raise FakeError(230, "Error ids")
+        for proxy in targets:
+            proxy["descr"] = new
+        self._touch()
+        return {"count": len(targets)}
+
+    def _buy(self, params: dict) -> dict:
+        count = self._int(params, "count", 200, "Error count")
+        period = self._int(params, "period", 210, "Error period")
+        version = self._version(params)
+        country = params.get("country")
+        type = params.get("type", "http")
+        descr = params.get("descr", "")
+        if count < 1:
+            raise FakeError(200, "Error count")
+        if period < 1:
+            raise FakeError(210, "Error period")
+        if country not in self.countries[version]:
+            raise FakeError(220, "Error country")
+        if type not in _SCHEMES:
+            raise FakeError(260, "Error type")
+        if len(descr) > 50:
+            raise FakeError(250, "Error description")
+        if count > self.available[(version, country)]:
+            raise FakeError(300, "Error active proxy allow")
+        price = self._cost(count, period, version)
+        if price > self.balance:
+            raise FakeError(400, "Error no money")
+        self.balance = round(self.balance - price, 2)
+        self.available[(version, country)] -= count
+        now = time.time()
+        bought = []
+        for _ in range(count):
+            proxy = self._create(country, version, type, descr, now, now + period * _DAY)
+            bought.append({key: proxy[key] for key in ("id", "ip", "host", "port", "user", "pass", "type", 
+                "date", "date_end", "unixtime", "unixtime_end", "active")})
+        return {
+            "count": count, "price": price, "price_single": round(price / count, 2), "period": period, "country": country, 
+            "list": bought if "nokey" in params else {proxy["id"]: proxy for proxy in bought}
+        }
+
+    def _prolong(self, params: dict) -> dict:
+        period = self._int(params, "period", 210, "Error period")
+        if period < 1:
+            raise FakeError(210, "Error period")
+        proxies = [self.proxies[id] for id in self._ids(params) if id in self.proxies]
+        price = round(sum(self._cost(1, period, int(proxy["version"])) for proxy in proxies), 2)
+        if price > self.balance:
+            raise FakeError(400, "Error no money")
+        self.balance = round(self.balance - price, 2)
+        now = time.time()
+        prolonged = []
+        for proxy in proxies:
+            end = max(now, proxy["unixtime_end"]) + period * _DAY
+            proxy.update(unixtime_end=int(end), date_end=_format(end), active="1")
+            prolonged.append({"id": proxy["id"], "date_end": proxy["date_end"], "unixtime_end": proxy["unixtime_end"]})
+        if proxies:
+            self._touch()
+        return {
+            "price": price, "period": period, "count": len(prolonged), 
+            "list": prolonged if "nokey" in params else {proxy["id"]: proxy for proxy in prolonged}
+        }
+
+    def _delete(self, params: dict) -> dict:
+        if "ids" in params:
+            ids = [id for id in self._ids(params) if id in self.proxies]
+        elif "descr" in params:
+            ids = [int(proxy["id"]) for proxy in self.proxies.values() if proxy["descr"] == params["descr"]]
+        else:
+            raise FakeError(230, "Error ids")
+        for id in ids:
+            del self.proxies[id]
+        if ids:
+            self._touch()
+        return {"count": len(ids)}
+
+    def _check(self, params: dict) -> dict:
+        ids = self._ids(params)
+        if len(ids) != 1:
+            raise FakeError(230, "Error ids")
+        proxy = self.proxies.get(ids[0])
+        if proxy is None:
+            raise FakeError(404, "Error not found")
+        return {"proxy_id": ids[0], "proxy_status": proxy["unixtime_end"] > time.time()}
+
+
+def _route(url: str) -> tuple:
+    parts = [part for part in urlsplit(url).path.split("/") if part]
+    if len(parts) < 2:
+        return None, None
+    return parts[-2], parts[-1]
+
+
+class FakeTransport(Transport):
+    '''
+    Transport delivering requests straight to `FakeProxySix`, without sockets
+
+    Attributes
+    ----------
+    fake (FakeProxySix):
+        Fake API answering requests (the first one if many were given)
+    fakes (Dict[str, FakeProxySix]):
+        Fake accounts by API key, requests with other keys go to `fake`
+    chunk_size (int):
+        Size of chunks streamed responses are split into
+    '''
+    def __init__(self, fake: FakeProxySix | Iterable[FakeProxySix], chunk_size: int = 4096) -> None:
+        fakes = [fake] if isinstance(fake, FakeProxySix) else list(fake)
+        self.fake: FakeProxySix = fakes[0]
+        self.fakes: Dict[str, FakeProxySix] = {fake.api_key: fake for fake in fakes}
+        self.chunk_size: int = chunk_size
+
+    async def get(self, url: str, params: dict) -> Response:
+        api_key, method = _route(url)
+        fake = self.fakes.get(api_key, self.fake)
+        status, data = await fake.handle(api_key, method, {key: str(value) for key, value in params.items()})
+        return Response(status, b"" if data is None else json.dumps(data).encode())
+
+    def stream(self, url: str, params: dict) -> "_FakeStream":
+        return _FakeStream(self, url, params)
+
+
+class _FakeStream(StreamResponse):
+    def __init__(self, transport: FakeTransport, url: str, params: dict) -> None:
+        self._transport = transport
+        self._url = url
+        self._params = params
+        self._body = b""
+
+    async def __aenter__(self) -> "_FakeStream":
+        response = await self._transport.get(self._url, self._params)
+        self.status = response.status
+        self._body = response.body
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        pass
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        size = self._transport.chunk_size
+        for start in range(0, len(self._body), size):
+            yield self._body[start:start + size]
+            await asyncio.sleep(0)
+
+
+class FakeServer():
+    '''
+    HTTP server on localhost serving `FakeProxySix`, for measuring the whole network path
+
+    ```
+    async with FakeServer(fake) as server:
+        client = ProxySix(fake.api_key)
+        client.URL = server.url
+    ```
+
+    Attributes
+    ----------
+    fake (FakeProxySix):
+        Fake API answering requests
+    url (str):
+        Value for `ProxySix.URL` (available after `start()`)
+    '''
+    def __init__(self, fake: FakeProxySix = None, host: str = "127.0.0.1", port: int = 0) -> None:
+        self.fake: FakeProxySix = fake if fake is not None else FakeProxySix()
+        self.host: str = host
+        self.port: int = port
+        self.url: str = None
+        self._runner = None
+
+    async def start(self) -> str:
+        '''Starts server, returns API URL'''
+        from aiohttp import web
+
+        async def handle(request: web.Request) -> web.Response:
+            status, data = await self.fake.handle(request.match_info["key"], request.match_info["method"], dict(request.query))
+            if data is None:
+                return web.Response(status=status)
+            return web.json_response(data, status=status)
+
+        app = web.Application()
+        app.router.add_get("/api/{key}/{method}/", handle)
+        self._runner = web.AppRunner(app, access_log=None)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, self.host, self.port)
+        await site.start()
+        port = self._runner.addresses[0][1]
+        self.url = f"http://{self.host}:{port}/api"
+        return self.url
+
+    async def close(self) -> None:
+        '''Stops server'''
+        if self._runner is not None:
+            await self._runner.cleanup()
+            self._runner = None
+
+    async def __aenter__(self) -> "FakeServer":
+        await self.start()
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
@@ -0,0 +1,162 @@
+from typing import AsyncIterator, TYPE_CHECKING
+import abc, asyncio
+
+if TYPE_CHECKING:
+    import aiohttp
+
+class Response():
+    '''
+    Answer of API server
+
+    Attributes
+    ----------
+    status (int):
+        HTTP status
+    body (bytes):
+        Response body
+    '''
+    __slots__ = ("status", "body")
+
+    def __init__(self, status: int, body: bytes) -> None:
+        self.status: int = status
+        self.body: bytes = body
+
+
+class StreamResponse(abc.ABC):
+    '''Answer of API server whose body is read chunk by chunk'''
+    status: int
+
+    @abc.abstractmethod
+    def iter_chunks(self) -> AsyncIterator[bytes]:
+        '''Yields body chunks as they arrive'''
+
+
+class Transport(abc.ABC):
+    '''
+    Way `ProxySix` delivers requests to API
+
+    Attributes
+    ----------
+    transient_errors (tuple):
+        Exception types meaning that request may be retried (connection failures, timeouts)
+    '''
+    transient_errors: tuple = (ConnectionError, asyncio.TimeoutError)
+
+    @abc.abstractmethod
+    async def get(self, url: str, params: dict) -> Response:
+        '''
+        Sends GET request and reads the whole response
+
+        Parameters
+        ----------
+        url (str):
+            Request URL (Required)
+        params (dict):
+            Query parameters (Required)
+        '''
+
+    @abc.abstractmethod
+    def stream(self, url: str, params: dict):
+        '''Sends GET request, returns async context manager giving `StreamResponse`'''
+
+    async def close(self) -> None:
+        '''Releases resources held by transport'''
+
+    async def __aenter__(self) -> "Transport":
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self.close()
+
+
+class AiohttpTransport(Transport):
+    '''
+    Transport sending requests with pooled aiohttp session
+
+    aiohttp is imported when the session is created, not when this module is.
+
+    Attributes
+    ----------
+    connector_options (dict):
+        Options of `aiohttp.TCPConnector` of own session
+    '''
+    def __init__(self, 
+            session: "aiohttp.ClientSession" = None, 
+            limit: int = 100, 
+            limit_per_host: int = 0, 
+            keepalive_timeout: float = 15.0, 
+            ttl_dns_cache: int = 10) -> None:
+        '''
+        Parameters
+        ----------
+        session (aiohttp.ClientSession):
+            Session to send requests with. If not given, transport creates its own session 
+            on the first request and closes it in `close()` (default - None)
+        limit (int):
+            Total number of simultaneous connections of own session (default - 100, 0 - unlimited)
+        limit_per_host (int):
+            Number of simultaneous connections to one host of own session (default - 0, unlimited)
+        keepalive_timeout (float):
+            Seconds to keep idle connections of own session open (default - 15.0)
+        ttl_dns_cache (int):
+            Seconds to cache resolved DNS entries of own session (default - 10)
+        '''
+        self._session = session
+        self._own_session: bool = session is None
+        self.connector_options: dict = {
+            "limit" : limit,
+            "limit_per_host" : limit_per_host,
+            "keepalive_timeout" : keepalive_timeout,
+            "ttl_dns_cache" : ttl_dns_cache
+        }
+
+    @property
+    def transient_errors(self) -> tuple:
+        '''Connection errors of aiohttp and timeouts'''
+        import aiohttp
+        return (aiohttp.ClientConnectionError, asyncio.TimeoutError)
+
+    @property
+    def session(self) -> "aiohttp.ClientSession":
+        '''Session used to send requests (created on first access if not supplied)'''
+        if self._session is None or (self._own_session and self._session.closed):
+            import aiohttp
+            connector = aiohttp.TCPConnector(**self.connector_options)
+            self._session = aiohttp.ClientSession(connector=connector)
+            self._own_session = True
+        return self._session
+
+    async def get(self, url: str, params: dict) -> Response:
+        async with self.session.get(url=url, params=params) as r:
+            return Response(r.status, await r.read())
+
+    def stream(self, url: str, params: dict) -> "_AiohttpStream":
+        return _AiohttpStream(self.session, url, params)
+
+    async def close(self) -> None:
+        '''
+        Closes own session and its connection pool. 
+        Session supplied by caller is left open, it is up to caller to close it.
+        '''
+        if self._own_session and self._session is not None and not self._session.closed:
+            await self._session.close()
+        if self._own_session:
+            self._session = None
+
+
+class _AiohttpStream(StreamResponse):
+    def __init__(self, session: "aiohttp.ClientSession", url: str, params: dict) -> None:
+        self._request = session.get(url=url, params=params)
+        self._response = None
+
+    async def __aenter__(self) -> "_AiohttpStream":
+        self._response = await self._request.__aenter__()
+        self.status = self._response.status
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb) -> None:
+        await self._request.__aexit__(exc_type, exc, tb)
+
+    async def iter_chunks(self) -> AsyncIterator[bytes]:
+        async for chunk in self._response.content.iter_any():
+            yield chunk
@@ -1,92 +1,8 @@
+from .enums import *
 from typing import List, Dict
-from enum import Enum
 from pydantic import BaseModel, Field
 import datetime
 
-class ProxyVersion(Enum):
-    IPv6 = 6
-    IPv4 = 4
-    IPv4Shared = 3
-
-class ProxyCountry(Enum):
-    UKRAINE = 'ua'
-    LATVIA = 'lv'
-    RUSSIA = 'ru'
-    BELGIUM = 'be'
-    BELARUS = 'by'
-    ROMANIA = 'ro'
-    SLOVENIA = 'si'
-    SOUTH_AFRICA = 'za'
-    AUSTRALIA = 'au'
-    JAPAN = 'jp'
-    MOLDOVA = 'md'
-    ISRAEL = 'il'
-    SPAIN = 'es'
-    GERMANY = 'de'
-    KYRGYZSTAN = 'kg'
-    TAJIKISTAN = 'tj'
-    TURKMENISTAN = 'tm'
-    UNITED_STATES = 'us'
-    UNITED_KINGDOM = 'gb'
-    EGYPT = 'eg'
-    PHILIPPINES = 'ph'
-    HONG_KONG = 'hk'
-    KAZAKHSTAN = 'kz'
-    BULGARIA = 'bg'
-    MALAYSIA = 'my'
-    THAILAND = 'th'
-    SOUTH_KOREA = 'kr'
-    SERBIA = 'rs'
-    CYPRUS = 'cy'
-    BANGLADESH = 'bd'
-    UNITED_ARAB_EMIRATES = 'ae'
-    UZBEKISTAN = 'uz'
-    NIGERIA = 'ng'
-    MEXICO = 'mx'
-    TAIWAN = 'tw'
-    SINGAPORE = 'sg'
-    ITALY = 'it'
-    BRAZIL = 'br'
-    LITHUANIA = 'lt'
-    INDONESIA = 'id'
-    DENMARK = 'dk'
-    VIETNAM = 'vn'
-    INDIA = 'in'
-    CHINA = 'cn'
-    PORTUGAL = 'pt'
-    NETHERLANDS = 'nl'
-    GEORGIA = 'ge'
-    IRELAND = 'ie'
-    CHILE = 'cl'
-    ARMENIA = 'am'
-    ESTONIA = 'ee'
-    FRANCE = 'fr'
-    POLAND = 'pl'
-    CZECH_REPUBLIC = 'cz'
-    AUSTRIA = 'at'
-    NORWAY = 'no'
-    FINLAND = 'fi'
-    GREECE = 'gr'
-    SWITZERLAND = 'ch'
-    SWEDEN = 'se'
-    TURKEY = 'tr'
-    CANADA = 'ca'
-
-class ProxyState(Enum):
-    ACTIVE = "active"
-    EXPIRED = "expired"
-    EXPIRING = "expiring"
-    all = "all"
-
-class ProxyScheme(Enum):
-    HTTPS = "http"
-    SOCKS5 = "socks"
-
-class Currency(Enum):
-    RUB = "RUB"
-    USD = "USD"
-
-
 class Price(BaseModel):
     '''
     Contains information about the cost of the order, depending on the version, period and number of proxy.
@@ -168,6 +84,76 @@ class Proxy(BaseModel):
         elif self.type == ProxyScheme.SOCKS5:
             return f"socks5://{self.user}:{self.pswd}@{self.host}:{self.port}"
 
+class ProxyRecord():
+    '''
+    Lightweight unvalidated counterpart of `Proxy` built by trusted decoding
+
+    Has the same attributes as `Proxy`. Values are converted with plain casts instead of pydantic validation, 
+    `date` and `date_end` are parsed on first access. Use `to_model()` to get validated `Proxy`.
+    '''
+    __slots__ = ("id", "ip", "host", "port", "user", "pswd", "type", "country", 
+        "_date", "_date_end", "unixtime", "unixtime_end", "descr", "active")
+
+    def __init__(self, data: dict) -> None:
+        self.id: int = int(data["id"])
+        self.ip: str = data["ip"]
+        self.host: str = data["host"]
+        self.port: str = str(data["port"])
+        self.user: str = data["user"]
+        self.pswd: str = data["pass"]
+        self.type: ProxyScheme = _SCHEMES[data["type"]]
+        self.country: ProxyCountry = _COUNTRIES[data["country"]]
+        self._date: str | datetime.datetime = data["date"]
+        self._date_end: str | datetime.datetime = data["date_end"]
+        self.unixtime: int = int(data["unixtime"])
+        self.unixtime_end: int = int(data["unixtime_end"])
+        self.descr: str = data["descr"]
+        self.active: bool = bool(int(data["active"]))
+
+    @property
+    def date(self) -> datetime.datetime:
+        if isinstance(self._date, str):
+            self._date = datetime.datetime.fromisoformat(self._date)
+        return self._date
+
+    @property
+    def date_end(self) -> datetime.datetime:
+        if isinstance(self._date_end, str):
+            self._date_end = datetime.datetime.fromisoformat(self._date_end)
+        return self._date_end
+
+    @property
+    def proxy_link(self):
+        if self.type == ProxyScheme.HTTPS:
+            return f"http://{self.user}:{self.pswd}@{self.host}:{self.port}"
+        elif self.type == ProxyScheme.SOCKS5:
+            return f"socks5://{self.user}:{self.pswd}@{self.host}:{self.port}"
+
+    def dict(self) -> dict:
+        return {
+            "id" : self.id, "ip" : self.ip, "host" : self.host, "port" : self.port, 
+            "user" : self.user, "pswd" : self.pswd, "type" : self.type, "country" : self.country, 
+            "date" : self.date, "date_end" : self.date_end, "unixtime" : self.unixtime, 
+            "unixtime_end" : self.unixtime_end, "descr" : self.descr, "active" : self.active
+        }
+
+    def to_model(self) -> "Proxy":
+        '''Returns validated `Proxy` with the same values'''
+        data = self.dict()
+        data["pass"] = data.pop("pswd")
+        return Proxy(**data)
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (ProxyRecord, Proxy)):
+            return self.dict() == other.dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"ProxyRecord(id={self.id}, host={self.host!r}, port={self.port!r}, type={self.type}, country={self.country})"
+
+_SCHEMES = {scheme.value: scheme for scheme in ProxyScheme}
+_COUNTRIES = {country.value: country for country in ProxyCountry}
+
 class ProxyList(BaseModel):
     '''
     Contains list of your proxies (dict format)
@@ -182,6 +168,11 @@ class ProxyList(BaseModel):
     list_count: int
     list: Dict[int, Proxy]
 
+    def to_table(self) -> "ProxyTable":
+        '''Converts proxies into compact column-wise `ProxyTable`'''
+        from .table import ProxyTable
+        return ProxyTable.from_list(self)
+
 class ProxyListNokey(BaseModel):
     '''
     Contains list of your proxies (list format)
@@ -196,6 +187,11 @@ class ProxyListNokey(BaseModel):
     list_count: int
     list: List[Proxy]
 
+    def to_table(self) -> "ProxyTable":
+        '''Converts proxies into compact column-wise `ProxyTable`'''
+        from .table import ProxyTable
+        return ProxyTable.from_list(self)
+
 
 class NewProxy(BaseModel):
     '''
@@ -12,6 +12,9 @@ setup(
     license="MIT",
     url="https://github.com/Yessirskiy/Proxy6",
     install_requires=requirements,
+    extras_require={
+        "speedups": ["orjson"]
+    },
     keywords=[
         "proxy",
         "proxysix",